@@ -4,6 +4,8 @@ with contextlib.redirect_stdout(None):
     import pygame
 import pyganim
 
+from cultivate import spritesheets, timing
+
 
 def getImagesFromSpriteSheet(filename, width=None, height=None, rows=None, cols=None, rects=None):
     """Loads several sprites from a single image file (a "spritesheet").
@@ -19,6 +21,9 @@ def getImagesFromSpriteSheet(filename, width=None, height=None, rows=None, cols=
     to:
         surf = pygame.Surface((rect[2], rect[3]), pygame.SRCALPHA, sheetImage) # create Surface with width/height in rect
     This fixes blitting sprites with alpha values for me on AArch64 macOS using pygame 2 / SDL2.
+
+    The sheet itself is decoded through {cultivate.spritesheets.registry},
+    so getters reading the same sheet only decode it once.
     """
 
     argsType = '' # there should be exactly 1 set of arguments passed (i.e. don't pass width/height AND rows/cols)
@@ -41,7 +46,7 @@ def getImagesFromSpriteSheet(filename, width=None, height=None, rows=None, cols=
     if argsType == '':
         raise ValueError('Only pass one set of args: width & height, rows & cols, *or* rects')
 
-    sheetImage = pygame.image.load(filename).convert_alpha()
+    sheetImage = spritesheets.registry.get(filename)
 
     if argsType == 'width/height':
         for y in range(0, sheetImage.get_height(), (sheetImage.get_height() // height)):
@@ -77,3 +82,7 @@ def getImagesFromSpriteSheet(filename, width=None, height=None, rows=None, cols=
 
 
 pyganim.getImagesFromSpriteSheet = getImagesFromSpriteSheet
+
+
+# animate using the game's clock, rather than the real time
+pyganim.TIME_FUNC = lambda: int(timing.now() * 1000)
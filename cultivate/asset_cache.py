@@ -0,0 +1,184 @@
+"""How long loaded assets are kept in memory.
+
+Loader functions decorated with {scoped} cache what they load, like {functools.lru_cache},
+but each cache belongs to a scope, which decides when its assets are released:
+- "session" assets are kept until the game ends
+- "day" assets are released when a day starts that doesn't use them
+- "final cutscene" assets are only needed at the end of the game, so are kept once loaded
+A cache can also be given a budget of bytes, over which its least recently used assets are released.
+Character and pickup sprites are packed into {cultivate.atlas.atlas}, which keeps them for the whole game,
+so their loaders are "session" loaders: only assets with pixels of their own, like the pentagram, are released.
+The atlas pages, and the spritesheets decoded at the time, count towards the "session" scope's memory.
+
+So that a day doesn't stall while its assets load, the {prefetcher} loads the next day's assets
+a few at a time between frames of the day before.
+"""
+import collections
+import functools
+import time
+import typing
+
+import pygame
+
+from cultivate import atlas, spritesheets
+
+SCOPES = ("session", "day", "final cutscene")
+# how long the prefetcher may spend loading assets each frame, in seconds
+PREFETCH_SECONDS = 0.002
+
+# every scoped cache
+caches = []
+# the day being played, which "day" assets are marked as used on
+current_day = 0
+
+
+def asset_bytes(asset) -> int:
+    """Roughly how many bytes of pixels {asset} keeps in memory.
+
+    Subsurfaces share their parent's pixels, so aren't counted.
+    """
+    if isinstance(asset, pygame.Surface):
+        if asset.get_parent() is not None:
+            return 0
+        return asset.get_width() * asset.get_height() * asset.get_bytesize()
+    if isinstance(asset, dict):
+        return sum(asset_bytes(value) for value in asset.values())
+    if isinstance(asset, (list, tuple)):
+        return sum(asset_bytes(value) for value in asset)
+    if hasattr(asset, "numFrames") and hasattr(asset, "getFrame"):
+        # an animation
+        return sum(asset_bytes(asset.getFrame(i)) for i in range(asset.numFrames))
+    if hasattr(asset, "frames"):
+        # an animation whose frames are made as they are needed
+        return sum(asset_bytes(frame) for frame in asset.frames if frame is not None)
+    return 0
+
+
+class ScopedCache:
+    """Caches what {func} returns for each set of arguments, until it is released.
+
+    :param scope: one of {SCOPES}
+    :param max_bytes: release the least recently used assets when a new one takes the cache over this many bytes
+    """
+
+    def __init__(self, func: typing.Callable, scope: str, max_bytes: int = None):
+        if scope not in SCOPES:
+            raise ValueError(f"Unknown asset scope {scope!r}, choose from: {', '.join(SCOPES)}")
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.scope = scope
+        self.max_bytes = max_bytes
+        # arguments -> asset, least recently used first
+        self._assets = collections.OrderedDict()
+        # arguments -> the last day the asset was used on
+        self._last_used = {}
+        self.loads = 0
+        caches.append(self)
+
+    def __call__(self, *args, **kwargs):
+        key = (args, tuple(sorted(kwargs.items())))
+        try:
+            asset = self._assets[key]
+        except KeyError:
+            asset = self._assets[key] = self.func(*args, **kwargs)
+            self.loads += 1
+            if self.max_bytes is not None:
+                self._release_over_budget(key)
+        else:
+            self._assets.move_to_end(key)
+        self._last_used[key] = current_day
+        return asset
+
+    def _release_over_budget(self, keep) -> None:
+        while self.bytes > self.max_bytes and len(self._assets) > 1:
+            key = next(iter(self._assets))
+            if key == keep:
+                break
+            self._release(key)
+
+    def _release(self, key) -> None:
+        del self._assets[key]
+        del self._last_used[key]
+
+    def release_unused(self, day: int) -> None:
+        """Release the assets that haven't been used on {day}."""
+        for key, last_used in list(self._last_used.items()):
+            if last_used < day:
+                self._release(key)
+
+    def cache_clear(self) -> None:
+        self._assets.clear()
+        self._last_used.clear()
+
+    def __len__(self) -> int:
+        return len(self._assets)
+
+    @property
+    def bytes(self) -> int:
+        return sum(asset_bytes(asset) for asset in self._assets.values())
+
+
+def scoped(scope: str, max_bytes: int = None) -> typing.Callable[[typing.Callable], ScopedCache]:
+    """Cache a loader function's assets in {scope}, see {ScopedCache}."""
+    def decorator(func: typing.Callable) -> ScopedCache:
+        return ScopedCache(func, scope, max_bytes)
+    return decorator
+
+
+def start_day(day: int) -> None:
+    """Mark the "day" assets used from now on as used on {day}."""
+    global current_day
+    current_day = day
+
+
+def release_finished_days() -> None:
+    """Release the "day" assets that haven't been used since the current day started."""
+    for cache in caches:
+        if cache.scope == "day":
+            cache.release_unused(current_day)
+
+
+def memory_usage() -> typing.Dict[str, int]:
+    """Return how many bytes the assets cached in each scope take up."""
+    usage = {scope: 0 for scope in SCOPES}
+    for cache in caches:
+        usage[cache.scope] += cache.bytes
+    # the sprites handed out by the atlas share the pixels of its pages, so are counted here instead
+    usage["session"] += asset_bytes(atlas.atlas.pages) + spritesheets.registry.resident_bytes
+    return usage
+
+
+class Prefetcher:
+    """Loads assets before they are needed, spending a little time on it each frame."""
+
+    def __init__(self):
+        self.queue = collections.deque()
+
+    def add(self, loads: typing.Iterable[typing.Callable[[], typing.Any]]) -> None:
+        """Queue loader functions to be called with no arguments, to cache their assets."""
+        self.queue.extend(loads)
+
+    def step(self, seconds: float = PREFETCH_SECONDS) -> int:
+        """Load queued assets for up to {seconds}, loading at least one if any are queued.
+
+        :return: how many assets were loaded
+        """
+        deadline = time.perf_counter() + seconds
+        loaded = 0
+        while self.queue:
+            self.queue.popleft()()
+            loaded += 1
+            if time.perf_counter() >= deadline:
+                break
+        return loaded
+
+    def finish(self) -> None:
+        """Load every queued asset now."""
+        while self.queue:
+            self.queue.popleft()()
+
+    def __len__(self) -> int:
+        return len(self.queue)
+
+
+prefetcher = Prefetcher()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""Packs character and item sprites into a few large surfaces.
+
+Run `python -m cultivate.atlas [output directory]` to pack every character and pickup sprite,
+print the atlas index and its memory footprint, and optionally save the pages and index.
+"""
+import json
+import os
+import sys
+import typing
+
+import pygame
+
+PAGE_SIZE = 512
+PADDING = 1
+
+
+class TextureAtlas:
+    """Sprites packed into shared pages, looked up by name.
+
+    Sprites are handed out as subsurfaces of a page, so they can be used anywhere a surface can,
+    but must not be drawn onto.
+    Pages are filled shelf by shelf, like books on a bookcase.
+    """
+
+    def __init__(self, page_size: int = PAGE_SIZE, padding: int = PADDING):
+        self.page_size = page_size
+        self.padding = padding
+        self.pages = []
+        # one list of shelves per page, each shelf is [y, height, next free x]
+        self._shelves = []
+        # name -> (page index, rect)
+        self.index = {}
+        self._regions = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def get(self, name: str) -> pygame.Surface:
+        """Return the sprite packed as {name}."""
+        return self._regions[name]
+
+    def add(self, name: str, surface: pygame.Surface) -> pygame.Surface:
+        """Pack {surface} as {name}, unless {name} is already packed, and return the packed sprite."""
+        if name in self.index:
+            return self._regions[name]
+        w, h = surface.get_size()
+        if w + self.padding > self.page_size or h + self.padding > self.page_size:
+            raise ValueError(f"{name} ({w}x{h}) does not fit on a {self.page_size}x{self.page_size} atlas page")
+        page_index, rect = self._allocate(w, h)
+        # the allocated area is transparent black, so adding copies the pixels exactly
+        self.pages[page_index].blit(surface, rect, special_flags=pygame.BLEND_RGBA_ADD)
+        self.index[name] = (page_index, rect)
+        region = self._regions[name] = self.pages[page_index].subsurface(rect)
+        return region
+
+    def _allocate(self, w: int, h: int) -> typing.Tuple[int, pygame.Rect]:
+        padded_w, padded_h = w + self.padding, h + self.padding
+        for page_index, shelves in enumerate(self._shelves):
+            for shelf in shelves:
+                y, height, x = shelf
+                if padded_h <= height and x + padded_w <= self.page_size:
+                    shelf[2] += padded_w
+                    return page_index, pygame.Rect(x, y, w, h)
+            # start a new shelf under the last one
+            y = shelves[-1][0] + shelves[-1][1] if shelves else 0
+            if y + padded_h <= self.page_size:
+                shelves.append([y, padded_h, padded_w])
+                return page_index, pygame.Rect(0, y, w, h)
+
+        # start a new page
+        self.pages.append(pygame.Surface((self.page_size, self.page_size), pygame.SRCALPHA, 32).convert_alpha())
+        self._shelves.append([[0, padded_h, padded_w]])
+        return len(self.pages) - 1, pygame.Rect(0, 0, w, h)
+
+    def stats(self) -> typing.Dict[str, int]:
+        """Describe the memory used by the atlas, and by the sprites in it if they were separate surfaces."""
+        bytes_per_pixel = 4
+        return {
+            "sprites": len(self.index),
+            "pages": len(self.pages),
+            "page_bytes": len(self.pages) * self.page_size ** 2 * bytes_per_pixel,
+            "sprite_bytes": sum(rect.w * rect.h for _, rect in self.index.values()) * bytes_per_pixel,
+        }
+
+    def save(self, directory: str) -> None:
+        """Save each page as a PNG, and the index as JSON, to {directory}."""
+        os.makedirs(directory, exist_ok=True)
+        for page_index, page in enumerate(self.pages):
+            pygame.image.save(page, os.path.join(directory, f"atlas{page_index}.png"))
+        with open(os.path.join(directory, "atlas.json"), "w") as f:
+            json.dump({name: [page_index, list(rect)] for name, (page_index, rect) in self.index.items()},
+                      f, indent=2, sort_keys=True)
+
+
+atlas = TextureAtlas()
+
+
+def build() -> TextureAtlas:
+    """Pack the sprites of the player, every NPC and every pickup into {atlas}."""
+    # settings must be imported before the loader
+    from cultivate import settings, loader
+    from cultivate.sprites import pickups
+
+    for get_images in [loader.get_player, loader.get_npc, loader.get_npc2, loader.get_npc3, loader.get_npc4,
+                       loader.get_npc5, loader.get_npc_innocent, loader.get_npc_cat,
+                       loader.get_npc_white_robes, loader.get_npc_pink_robes]:
+        for direction in [None, 'forward', 'backward', 'left', 'right']:
+            get_images(direction)
+
+    pickup_types = [pickups.BasePickUp]
+    for pickup_type in pickup_types:
+        pickup_types.extend(pickup_type.__subclasses__())
+        if pickup_type is not pickups.BasePickUp:
+            pickup_type(0, 0)
+    return atlas
+
+
+def main(argv=sys.argv[1:]) -> None:
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+
+    build()
+    for name, (page_index, rect) in sorted(atlas.index.items()):
+        print(f"{name:<40} page {page_index} {tuple(rect)}")
+    stats = atlas.stats()
+    print(f"{stats['sprites']} sprites on {stats['pages']} pages of {atlas.page_size}x{atlas.page_size}: "
+          f"{stats['page_bytes']} bytes of pages for {stats['sprite_bytes']} bytes of sprites")
+    if argv:
+        atlas.save(argv[0])
+
+
+if __name__ == "__main__":
+    # use the copy of this module that the loader packs sprites into
+    from cultivate import atlas as atlas_module
+    atlas_module.main()
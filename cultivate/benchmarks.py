@@ -0,0 +1,618 @@
+#!/usr/bin/env python3
+"""Benchmarks for the game's hot paths.
+
+Run with `python -m cultivate.benchmarks [name ...]`, or no names to run them all.
+No window is opened and no sound is played.
+"""
+import functools
+import itertools
+import os
+import random
+import sys
+import tempfile
+import time
+import typing
+
+# these must be set before pygame initialises its display and mixer
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+
+import pygame
+
+from cultivate import main as game
+from cultivate import asset_cache, glyphs, loader, npc_batch, profiler, scatter, settings, spritesheets, text_layout, tiling, \
+    transition
+from cultivate.chunks import ChunkedSurface
+from cultivate.compositor import HUD, Layer
+from cultivate.renderer import DirtyRectRenderer
+from cultivate.sprites import UpdatableSprite
+from cultivate.sprites.buildings import Building
+from cultivate.sprites.buildings.kitchen import Kitchen
+from cultivate.conversation_tree import ConversationTree
+from cultivate.game_state import CROWD_AREA, GameState
+from cultivate.npc import Npc
+from cultivate.sprites import pickups as pickupables
+from cultivate.sprites.clothes_line import ClothesLine
+from cultivate.sprites.demon import Demon
+from cultivate.sprites.fire import DemonFire, Fire
+from cultivate.sprites.river import River
+
+BENCHMARKS = {}
+
+
+def benchmark(func: typing.Callable[[], None]) -> typing.Callable[[], None]:
+    BENCHMARKS[func.__name__] = func
+    return func
+
+
+def report(name: str, **results) -> None:
+    values = ", ".join(f"{key}={value:.3f}" if isinstance(value, float) else f"{key}={value}"
+                       for key, value in results.items())
+    print(f"{name:<40} {values}")
+
+
+def timed(func: typing.Callable[[], None], repeat: int) -> float:
+    """Call {func} {repeat} times and return the mean time per call in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+def setup_game(day: int = 0):
+    """Create a screen and a game on {day}, the same way {cultivate.main.main} does."""
+    screen, clock = game.init_game()
+    game_state, player, game_map, tooltip_bar, inventory, info_box, static_interactables = game.init_state(day)
+    npc_sprites, pickups = game_state.get_day_items()
+    return (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+            static_interactables, npc_sprites, pickups)
+
+
+def clear_loader_caches() -> None:
+    """Forget every asset the loader has cached in memory."""
+    for value in vars(loader).values():
+        if isinstance(getattr(value, "cache_clear", None), typing.Callable):
+            value.cache_clear()
+
+
+@benchmark
+def startup() -> None:
+    """Time to load the game state with an empty disk cache (cold) and a filled one (warm)."""
+    game.init_game()
+    cache_dir, disk_cache = settings.CACHE_DIR, settings.DISK_CACHE
+    with tempfile.TemporaryDirectory() as settings.CACHE_DIR:
+        try:
+            for label, enabled in [("uncached", False), ("cold", True), ("warm", True)]:
+                settings.DISK_CACHE = enabled
+                clear_loader_caches()
+                spritesheets.registry = spritesheets.SpriteSheetRegistry()
+                ms = timed(functools.partial(game.init_state, 0), 1)
+                stats = spritesheets.registry.stats()
+                report(f"startup.{label}", ms=ms, sheet_requests=stats["requests"], sheet_decodes=stats["decodes"],
+                       sheet_mb=stats["resident_bytes"] / 2 ** 20)
+        finally:
+            settings.CACHE_DIR, settings.DISK_CACHE = cache_dir, disk_cache
+
+
+@benchmark
+def replay(seed: int = 1234) -> None:
+    """Check that loading a game with the same seed uses random numbers the same way with a cold and a warm disk cache.
+
+    Recordings are made and replayed with whatever is in the disk cache at the time,
+    so anything cached must not change which random numbers the game goes on to use.
+    """
+    game.init_game()
+    cache_dir, disk_cache = settings.CACHE_DIR, settings.DISK_CACHE
+    states = {}
+    with tempfile.TemporaryDirectory() as settings.CACHE_DIR:
+        try:
+            settings.DISK_CACHE = True
+            for label in ["cold", "warm"]:
+                clear_loader_caches()
+                random.seed(seed)
+                start = time.perf_counter()
+                game_state = game.init_state(0)[0]
+                npc_sprites, pickups = game_state.get_day_items()
+                ms = (time.perf_counter() - start) * 1000
+                states[label] = ([npc.speed for npc in npc_sprites], random.getstate())
+                report(f"replay.{label}", ms=ms)
+        finally:
+            settings.CACHE_DIR, settings.DISK_CACHE = cache_dir, disk_cache
+    report("replay", identical=states["cold"] == states["warm"])
+    if states["cold"] != states["warm"]:
+        sys.exit("loading the game used random numbers differently with a cold and a warm disk cache")
+
+
+@benchmark
+def dirty_rects(frames: int = 300) -> None:
+    """Frame time of a full redraw and flip versus the dirty rect renderer, with the camera idle."""
+    (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+     static_interactables, npc_sprites, pickups) = setup_game(day=2)
+
+    def update():
+        game.update(game_state, player, game_map, tooltip_bar, npc_sprites, pickups, static_interactables)
+
+    def draw():
+        game.draw_frame(screen, clock, player, game_map, game_state, tooltip_bar, inventory, info_box,
+                        npc_sprites, pickups)
+
+    def full_frame():
+        update()
+        draw()
+        pygame.display.flip()
+
+    renderer = DirtyRectRenderer(screen)
+    pixels = []
+
+    def dirty_frame():
+        update()
+        game.mark_dirty_regions(renderer, clock, player, game_map, game_state, tooltip_bar, inventory, info_box,
+                                npc_sprites, pickups)
+        renderer.render(game_map.get_viewport(), draw)
+        pixels.append(renderer.pixels)
+
+    update_ms = timed(update, frames)
+    full_ms = timed(full_frame, frames)
+    dirty_ms = timed(dirty_frame, frames)
+    # the first frame is always a full redraw
+    redrawn = sum(pixels[1:]) / (len(pixels) - 1) / (settings.WIDTH * settings.HEIGHT)
+    report("dirty_rects.full", ms_per_frame=full_ms, draw_ms=full_ms - update_ms, redrawn=1.0)
+    report("dirty_rects.dirty", ms_per_frame=dirty_ms, draw_ms=dirty_ms - update_ms, redrawn=redrawn)
+
+
+@benchmark
+def collisions(probes: int = 2000) -> None:
+    """Time of {cultivate.map.Map.can_move} as obstacles are added, versus colliding with every sprite."""
+    (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+     static_interactables, npc_sprites, pickups) = setup_game()
+    rng = random.Random(0)
+    moves = [rng.choice([(0, 10), (0, -10), (10, 0), (-10, 0)]) for _ in range(probes)]
+    views = [(rng.randrange(settings.MAP_WIDTH - settings.WIDTH), rng.randrange(settings.MAP_HEIGHT - settings.HEIGHT))
+             for _ in range(probes)]
+
+    def probe(check: typing.Callable[[int, int], bool]) -> None:
+        for (dx, dy), (game_map.map_view_x, game_map.map_view_y) in zip(moves, views):
+            check(dx, dy)
+
+    def linear_can_move(dx: int, dy: int) -> bool:
+        ghost = pygame.sprite.Sprite()
+        ghost.rect = pygame.Rect(game_map.map_view_x + player.rect.x + dx,
+                                 game_map.map_view_y + player.rect.bottom + dy, player.rect.w, 1)
+        return (pygame.sprite.spritecollide(ghost, game_map.passables, False)
+                or not pygame.sprite.spritecollide(ghost, game_map.impassables, False))
+
+    for extra in [0, 1000, 5000]:
+        while len(game_map.impassables) < extra:
+            obstacle = UpdatableSprite(pygame.Rect(rng.randrange(settings.MAP_WIDTH), rng.randrange(settings.MAP_HEIGHT),
+                                                   rng.randint(10, 100), rng.randint(10, 100)))
+            game_map.impassables.add(obstacle)
+            game_map.impassable_index.insert(obstacle, obstacle.rect)
+        report(f"collisions.{len(game_map.impassables)}",
+               linear_us=timed(functools.partial(probe, linear_can_move), 1) * 1000 / probes,
+               indexed_us=timed(functools.partial(probe, game_map.can_move), 1) * 1000 / probes)
+
+
+@benchmark
+def buildings(ticks: int = 300) -> None:
+    """Tick time with the normal buildings, and with ten times as many placed around the map."""
+    (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+     static_interactables, npc_sprites, pickups) = setup_game(day=2)
+    rng = random.Random(0)
+
+    def tick():
+        game.update(game_state, player, game_map, tooltip_bar, npc_sprites, pickups, static_interactables)
+
+    count = len(game_map.buildings)
+    for multiple in [1, 10]:
+        while len(game_map.buildings) < count * multiple:
+            game_map.add_building(f"kitchen{len(game_map.buildings)}",
+                                  Kitchen(rng.randrange(settings.MAP_WIDTH - 200),
+                                          rng.randrange(settings.MAP_HEIGHT - 200), game_map.image))
+        report(f"buildings.{len(game_map.buildings)}", tick_ms=timed(tick, ticks),
+               colliders=len(game_map.impassables) + len(game_map.passables))
+
+
+@benchmark
+def interactions(ticks: int = 300) -> None:
+    """Time to find what the player can reach as pickups are scattered, versus checking every item each tick."""
+    (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+     static_interactables, npc_sprites, pickups) = setup_game(day=2)
+    rng = random.Random(0)
+    viewport = game_map.get_viewport()
+
+    def linear():
+        boundary = player.tooltip_boundary(viewport)
+        for item in pickups:
+            item.update(viewport)
+        for item in itertools.chain(pickups, npc_sprites, static_interactables):
+            # static interactables are positioned on the map
+            rect = item.rect if item not in static_interactables else item.rect.move(-viewport.x, -viewport.y)
+            if boundary.colliderect(rect):
+                return item.help_text
+
+    def indexed():
+        player.interactions.update(viewport, pickups, npc_sprites)
+
+    for count in [10, 100, 1000]:
+        while len(pickups) < count:
+            pickups.add(pickupables.Lemon(rng.randrange(settings.MAP_WIDTH), rng.randrange(settings.MAP_HEIGHT)))
+        report(f"interactions.{count}", linear_us=timed(linear, ticks) * 1000, indexed_us=timed(indexed, ticks) * 1000)
+
+
+@benchmark
+def recipes(repeat: int = 100000) -> None:
+    """Check the recipe table can make each day's task items, and time looking up and making recipes."""
+    game.init_game()
+    book = pickupables.recipes
+    problems = book.validate(pickupables.BasePickUp)
+    for problem in problems:
+        print(f"recipes: {problem}")
+    goals = {2: [pickupables.Lemonade, pickupables.EmptyBottle],
+             3: [pickupables.WhiteRobes, pickupables.PinkRobes],
+             4: [pickupables.BlackCandles, pickupables.ScentedBlackCandles]}
+    for day, day_goals in goals.items():
+        npc_sprites, pickups = GameState(day=day).get_day_items()
+        made = book.reachable({type(item) for item in pickups}, fixtures=[River, Fire, ClothesLine])
+        report(f"recipes.day{day}", **{goal.__name__: goal in made for goal in day_goals})
+
+    held, target = pickupables.Sugar(0, 0), pickupables.LemonyWater(0, 0)
+    missing = pickupables.Lemonade(0, 0)
+    report("recipes", count=len(book), problems=len(problems),
+           can_combine_us=timed(lambda: held.can_combine(target), repeat) * 1000,
+           cannot_combine_us=timed(lambda: held.can_combine(missing), repeat) * 1000,
+           combine_us=timed(lambda: held.combine(target), repeat // 100) * 1000)
+
+
+@benchmark
+def dialogue(frames: int = 300) -> None:
+    """Time frames drawn during a long conversation, drawing the dialogue box every frame or only when it changes."""
+    (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+     static_interactables, npc_sprites, pickups) = setup_game(day=2)
+    text = " ".join(["The dark one stirs beneath the orchard, and the harvest must be gathered before the moon."] * 4)
+    responses = [(i, f"Response number {i}, which goes on for a little while") for i in range(1, 5)]
+    player.conversation = ConversationTree(npc_name="Cult Leader", conversation_data=[
+        {"text": text, "responses": responses}] + [{"text": text, "responses": []}] * 4)
+
+    def draw():
+        game.draw(screen, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups)
+
+    def draw_uncached():
+        player.dialogue_box.shown = None
+        draw()
+
+    report("dialogue.long", uncached_ms=timed(draw_uncached, frames), cached_ms=timed(draw, frames),
+           box_ms=timed(lambda: player.dialogue_box.set_data(player.conversation.npc_name, text, responses), frames))
+
+
+@benchmark
+def wrapping(repeat: int = 20) -> None:
+    """Time wrapping text by measuring every prefix of each line, and by adding up the widths of words."""
+    game.init_game()
+    font = settings.MD_FONT
+    width = 1080
+
+    def by_prefix(text: str) -> None:
+        # how text was wrapped before, one measurement per character
+        while text:
+            i = 1
+            while font.size(text[:i])[0] < width and i < len(text):
+                i += 1
+            if i < len(text):
+                i = text.rfind(" ", 0, i) + 1
+            text = text[i:]
+
+    for words in [20, 100, 500]:
+        text = " ".join(f"cultivate{i}" for i in range(words))
+        text_layout.metrics.cache_clear()
+        report(f"wrapping.{words}_words", prefix_ms=timed(lambda: by_prefix(text), repeat),
+               cold_ms=timed(lambda: text_layout.TextLayout(text, font, width), 1),
+               words_ms=timed(lambda: text_layout.TextLayout(text, font, width), repeat),
+               cached_ms=timed(lambda: text_layout.layout(text, font, width), repeat))
+
+
+@benchmark
+def text(repeat: int = 2000) -> None:
+    """Time drawing UI strings with the font, from the glyph atlas, and from the string cache."""
+    game.init_game()
+    strings = ["press x to talk", "press c to combine", "31/05/1966", "Make lemonade", "Lemony Water"]
+    color = pygame.Color("black")
+
+    def with_font():
+        for string in strings:
+            settings.MD_FONT.render(string, True, color)
+
+    atlas = glyphs.GlyphAtlas(settings.MD_FONT, color)
+
+    def with_atlas():
+        for string in strings:
+            atlas.render(string)
+
+    cache = glyphs.TextCache(settings.TEXT_CACHE_BUDGET)
+
+    def with_cache():
+        for string in strings:
+            cache.render(settings.MD_FONT, string, color)
+
+    report("text.ui", font_us=timed(with_font, repeat) * 1000 / len(strings),
+           atlas_us=timed(with_atlas, repeat) * 1000 / len(strings),
+           cached_us=timed(with_cache, repeat) * 1000 / len(strings),
+           atlas_kb=glyphs.TextCache.bytes(atlas.surface) // 1024)
+
+    # a budget smaller than the strings drawn, so the cache keeps evicting
+    small = glyphs.TextCache(64 * 1024)
+    for i in range(1000):
+        small.render(settings.MD_FONT, f"Day {i} of the harvest", color)
+    report("text.budget", budget_kb=small.budget // 1024, used_kb=small.size // 1024, strings=len(small),
+           misses=small.misses)
+
+
+@benchmark
+def hud(frames: int = 1000) -> None:
+    """Time drawing the HUD, composing its widgets every frame or only when what they show changes."""
+    (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+     static_interactables, npc_sprites, pickups) = setup_game(day=2)
+    inventory.set_icon(pickupables.Lemon(0, 0))
+    tooltip_bar.set_tooltip("press c to combine")
+    widgets = [tooltip_bar, inventory, info_box]
+
+    def draw():
+        for widget in widgets:
+            widget.draw(screen)
+
+    def draw_composing():
+        for widget in widgets:
+            widget._surface = None
+        draw()
+
+    for name, func in [("composing", draw_composing), ("retained", draw)]:
+        composed = sum(widget.composed for widget in widgets)
+        ms = timed(func, frames)
+        composed = sum(widget.composed for widget in widgets) - composed
+        report(f"hud.{name}", ms_per_frame=ms, composed_per_frame=composed / frames,
+               kb_allocated_per_frame=sum(glyphs.TextCache.bytes(widget.get_surface()) for widget in widgets)
+               * composed / len(widgets) / frames / 1024)
+
+
+@benchmark
+def demons(frames: int = 200) -> None:
+    """Time drawing the final cutscene's demon and demon fire, scaling frames every time or once."""
+    screen, clock = game.init_game()
+    for sprite_type, get_animation in [(Demon, loader.get_demon), (DemonFire, loader.get_demon_fire)]:
+        animation = get_animation()
+
+        def scaling_every_time():
+            screen.blit(pygame.transform.scale(animation.getCurrentFrame(), (1000, 1000)), (0, 0))
+
+        def first_frame():
+            loader.get_scaled_animation.cache_clear()
+            sprite_type(0, 0)
+
+        def scaling_once():
+            screen.blit(sprite.image, (0, 0))
+
+        first_ms = timed(first_frame, 10)
+        sprite = sprite_type(0, 0)
+        # scale every frame of the animation before timing
+        for i in range(animation.numFrames):
+            sprite.animation.getFrame(i)
+        report(f"demons.{sprite_type.__name__}", every_time_ms=timed(scaling_every_time, frames),
+               once_ms=timed(scaling_once, frames), first_frame_ms=first_ms,
+               scaled_mb=sum(glyphs.TextCache.bytes(frame) for frame in sprite.animation.frames) / 2 ** 20)
+
+
+@benchmark
+def transitions(frames: int = 64) -> None:
+    """Time a whole day transition in each style, and the full map sized fade it replaced."""
+    screen, clock = game.init_game()
+
+    class MapFader(transition.Transition):
+        # how the fade used to be drawn
+        def __init__(self):
+            super().__init__()
+            self.fade = pygame.Surface((settings.MAP_WIDTH, settings.MAP_HEIGHT))
+            self.rect = pygame.Rect(0, 0, settings.MAP_WIDTH, settings.MAP_HEIGHT)
+
+        def draw(self, surface):
+            self.fade.set_alpha(self.opacity)
+            pygame.draw.rect(self.fade, transition.BLACK, self.rect)
+            surface.blit(self.fade, self.rect)
+
+    for name, style in [("map_fade", MapFader), *transition.STYLES.items()]:
+        fader = style()
+
+        def frame():
+            if not fader.fading:
+                fader.start()
+            fader.update()
+            fader.draw(screen)
+
+        surface = getattr(fader, "fade", None)
+        report(f"transitions.{name}", ms_per_frame=timed(frame, frames),
+               surface_mb=glyphs.TextCache.bytes(surface) / 2 ** 20 if surface else 0.0)
+
+
+@benchmark
+def assets() -> None:
+    """Play through the days, reporting cached asset memory, and time starting the last day with and without prefetching."""
+    game.init_game()
+    clear_loader_caches()
+    game_state = game.init_state(0)[0]
+    for day in range(7):
+        game_state.day = day
+        game.load_day(game_state)
+        usage = {scope.replace(" ", "_") + "_mb": size / 2 ** 20 for scope, size in asset_cache.memory_usage().items()}
+        report(f"assets.day{day}", queued=len(asset_cache.prefetcher), **usage)
+        asset_cache.prefetcher.finish()
+
+    for prefetch in [False, True]:
+        clear_loader_caches()
+        game_state = GameState(day=5)
+        game.load_day(game_state)
+        if prefetch:
+            asset_cache.prefetcher.finish()
+        else:
+            asset_cache.prefetcher.queue.clear()
+        game_state.day = 6
+        start = time.perf_counter()
+        game.load_day(game_state)
+        report(f"assets.start_day6.{'prefetched' if prefetch else 'cold'}", ms=(time.perf_counter() - start) * 1000)
+
+
+@benchmark
+def profiling(repeat: int = 100000, sections: int = 12) -> None:
+    """Time the overhead of timing a section, and of finishing a frame, with and without the profiler."""
+    def per_section(active) -> float:
+        def run():
+            with active.section("section"):
+                pass
+        return timed(run, repeat) * 1000
+
+    def per_frame(active) -> float:
+        for i in range(sections):
+            with active.section(f"section {i}"):
+                pass
+        return timed(active.end_frame, repeat // 10) * 1000
+
+    game.init_game()
+    null, active = profiler.NullProfiler(), profiler.Profiler()
+    report("profiling.section", null_us=per_section(null), active_us=per_section(active))
+    report(f"profiling.end_frame.{sections}", null_us=per_frame(null), active_us=per_frame(active))
+    report("profiling.overlay", draw_ms=timed(lambda: active.draw(pygame.display.get_surface()), 1000))
+
+
+@benchmark
+def backgrounds(repeat: int = 5) -> None:
+    """Time covering backgrounds of different sizes in a 16x16 tile with each tiling strategy."""
+    game.init_game()
+    image = loader.get_grass(16, 16)
+    for size in [(settings.CHUNK_SIZE, settings.CHUNK_SIZE), (settings.WIDTH, settings.HEIGHT),
+                 (settings.MAP_WIDTH, settings.MAP_HEIGHT)]:
+        # the full map is slow to tile one blit at a time, so don't wait for it as often
+        times = repeat if size[0] < settings.MAP_WIDTH else 1
+        results = {f"{name}_ms": timed(lambda: strategy(image, size), times)
+                   for name, strategy in tiling.STRATEGIES.items()}
+        report(f"backgrounds.{size[0]}x{size[1]}", **results)
+
+
+@benchmark
+def forest(repeat: int = 20) -> None:
+    """Time placing the forest border, and painting every chunk of the map with it."""
+    game.init_game()
+    size = (settings.MAP_WIDTH, settings.MAP_HEIGHT)
+    trees = scatter.forest_border(*size, random.Random(0))
+    report("forest.place", ms=timed(lambda: scatter.forest_border(*size, random.Random(0)), repeat), instances=len(trees))
+
+    def paint():
+        image = ChunkedSurface(*size, loader.get_grass(settings.CHUNK_SIZE, settings.CHUNK_SIZE))
+        scatter.draw(image, loader.get_forest_tiles(), trees, image.get_rect())
+        for chunk in image.chunks_overlapping(image.get_rect()):
+            image.get_chunk(*chunk)
+
+    # the forest used to be painted onto its own surface the size of the map
+    report("forest.paint_map", ms=timed(paint, 3), baked_mb=size[0] * size[1] * 4 / 2 ** 20)
+
+
+@benchmark
+def layers(frames: int = 1000) -> None:
+    """Time drawing the HUD layer straight to the screen and from its cache, and drawing every layer."""
+    (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+     static_interactables, npc_sprites, pickups) = setup_game(1)
+    game.update(game_state, player, game_map, tooltip_bar, npc_sprites, pickups, static_interactables)
+    frame = game.Frame(player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups,
+                       game_map.get_viewport(), (0, 0), clock)
+
+    for name, hud in [("direct", Layer("hud", HUD, game.draw_hud)),
+                      ("cached", Layer("hud", HUD, game.draw_hud, key=game.hud_shows)),
+                      (f"cached_every_{settings.HUD_INTERVAL}",
+                       Layer("hud", HUD, game.draw_hud, key=game.hud_shows, interval=settings.HUD_INTERVAL))]:
+        numbers = itertools.count()
+        ms = timed(lambda: hud.draw(screen, frame, next(numbers)), frames)
+        report(f"layers.hud.{name}", ms_per_frame=ms, redrawn=hud.redrawn)
+
+    report("layers.all", ms_per_frame=timed(lambda: game.compositor.draw(screen, frame), frames))
+
+
+@benchmark
+def roofs(frames: int = 1000) -> None:
+    """Time drawing the roofs with the normal buildings and ten times as many, as they used to be drawn and culled."""
+    (screen, clock, game_state, player, game_map, tooltip_bar, inventory, info_box,
+     static_interactables, npc_sprites, pickups) = setup_game(day=0)
+    rng = random.Random(0)
+    # looking at the kitchen and dorms
+    viewport = pygame.Rect(1000, 1300, settings.WIDTH, settings.HEIGHT)
+
+    def every_building():
+        # how the roofs used to be drawn, with a roof and a sign blitted for every building
+        near_player = pygame.Rect(settings.WIDTH // 2 - 75, settings.HEIGHT // 2 - 75, 150, 150)
+        for building in game_map.buildings.values():
+            rect = building.rect.move(-viewport.x, -viewport.y)
+            if near_player.colliderect(rect):
+                continue
+            if isinstance(building, Building):
+                overlap, sign_rect = building.roof_y_overlap, building.sign.get_rect()
+                screen.blit(building.roof, pygame.Rect(rect.x, rect.y - overlap, rect.w, rect.h + overlap))
+                screen.blit(building.sign, pygame.Rect(rect.x + rect.w // 2 - sign_rect.w // 2,
+                                                       rect.y + overlap - sign_rect.h, rect.w, rect.h))
+            else:
+                screen.blit(building.roof, pygame.Rect(rect.x + 1, rect.y - 84, rect.w, rect.h + 100))
+
+    count = len(game_map.buildings)
+    for multiple in [1, 10]:
+        while len(game_map.buildings) < count * multiple:
+            game_map.add_building(f"kitchen{len(game_map.buildings)}",
+                                  Kitchen(rng.randrange(settings.MAP_WIDTH - 200),
+                                          rng.randrange(settings.MAP_HEIGHT - 200), game_map.image))
+        every_ms = timed(every_building, frames)
+        culled_ms = timed(lambda: game_map.roofs.draw(screen, viewport), frames)
+        report(f"roofs.{len(game_map.buildings)}", every_building_ms=every_ms, culled_ms=culled_ms,
+               drawn=game_map.roofs.drawn)
+
+
+@benchmark
+def crowds(frames: int = 100) -> None:
+    """Time moving and drawing crowds of NPCs as one sprite each, and as one batch."""
+    game.init_game()
+    screen = pygame.display.get_surface()
+
+    class Walker(Npc):
+        name = "walker"
+
+        def __init__(self, points, speed):
+            self.points = points
+            super().__init__(speed=speed)
+            self.tips = None
+
+    for count in [10, 100, 1000]:
+        rng = random.Random(count)
+        walkers = pygame.sprite.Group()
+        for _ in range(count):
+            walkers.add(Walker([(rng.randrange(CROWD_AREA.left, CROWD_AREA.right),
+                                 rng.randrange(CROWD_AREA.top, CROWD_AREA.bottom)) for _ in range(4)],
+                               rng.uniform(2, 5)))
+        batch = npc_batch.crowd(count, CROWD_AREA, random.Random(count))
+        viewport = pygame.Rect(1500, 1500, settings.WIDTH, settings.HEIGHT)
+
+        def sprites():
+            walkers.update(viewport)
+            for walker in walkers:
+                walker.draw(screen)
+
+        def batched():
+            batch.update(viewport)
+            batch.draw(screen)
+
+        report(f"crowds.{count}", sprites_ms=timed(sprites, frames), batch_ms=timed(batched, frames),
+               visible=len(batch._blits), numpy=npc_batch.numpy is not None)
+
+
+def main(argv=sys.argv[1:]) -> None:
+    names = argv or list(BENCHMARKS)
+    for name in names:
+        if name not in BENCHMARKS:
+            sys.exit(f"unknown benchmark {name!r}, choose from: {', '.join(BENCHMARKS)}")
+    for name in names:
+        BENCHMARKS[name]()
+
+
+if __name__ == "__main__":
+    main()
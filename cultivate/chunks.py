@@ -0,0 +1,129 @@
+import typing
+
+import pygame
+
+from cultivate import settings
+
+
+class ChunkedSurface:
+    """A map-sized surface that is only ever painted a chunk at a time.
+
+    Things are blitted onto a ChunkedSurface the same way as onto a pygame.Surface,
+    but each blit is only recorded against the chunks it overlaps.
+    A chunk is painted from its recorded blits the first time it comes into view,
+    and is thrown away again once it is further than {resident_margin} chunks from the viewport.
+    """
+
+    def __init__(self, width: int, height: int, background: pygame.Surface,
+                 chunk_size: int = settings.CHUNK_SIZE, resident_margin: int = 1):
+        """
+        :param background: painted under every chunk, should be {chunk_size} square and tileable
+        """
+        self.width = width
+        self.height = height
+        self.background = background
+        self.chunk_size = chunk_size
+        self.resident_margin = resident_margin
+
+        # (source, map x, map y, area, special_flags) for every blit, in blit order
+        self._blits = []
+        # chunk coordinates -> indices into {self._blits} that overlap that chunk
+        self._chunk_blits = {}
+        # chunk coordinates -> painted chunk surface
+        self._chunks = {}
+        self.chunks_painted = 0
+
+    def get_rect(self) -> pygame.Rect:
+        return pygame.Rect(0, 0, self.width, self.height)
+
+    def get_width(self) -> int:
+        return self.width
+
+    def get_height(self) -> int:
+        return self.height
+
+    def get_size(self) -> typing.Tuple[int, int]:
+        return self.width, self.height
+
+    def blit(self, source: pygame.Surface, dest, area=None, special_flags=0) -> pygame.Rect:
+        """Record a blit of {source} at {dest} (in map coordinates)."""
+        x, y = dest[0], dest[1]
+        if area is None:
+            w, h = source.get_size()
+        else:
+            area = pygame.Rect(area)
+            w, h = area.size
+        rect = pygame.Rect(int(x), int(y), w, h).clip(self.get_rect())
+        if rect.w and rect.h:
+            self._record(rect, (source, x, y, area, special_flags))
+        return rect
+
+    def fill(self, color, rect=None) -> pygame.Rect:
+        """Record a solid fill of {rect} (in map coordinates)."""
+        rect = self.get_rect() if rect is None else pygame.Rect(rect).clip(self.get_rect())
+        if rect.w and rect.h:
+            self._record(rect, (color, rect))
+        return rect
+
+    def _record(self, rect: pygame.Rect, operation: tuple):
+        index = len(self._blits)
+        self._blits.append(operation)
+        for chunk in self.chunks_overlapping(rect):
+            self._chunk_blits.setdefault(chunk, []).append(index)
+            # a resident chunk is now stale, it will be repainted next time it is drawn
+            self._chunks.pop(chunk, None)
+
+    def chunks_overlapping(self, rect: pygame.Rect) -> typing.Iterator[typing.Tuple[int, int]]:
+        """Yield the coordinates of every chunk that {rect} overlaps."""
+        size = self.chunk_size
+        for cy in range(max(rect.top, 0) // size, (max(rect.bottom, 1) - 1) // size + 1):
+            for cx in range(max(rect.left, 0) // size, (max(rect.right, 1) - 1) // size + 1):
+                yield cx, cy
+
+    def get_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        """Return the painted chunk at {cx}, {cy}, painting it if it is not resident."""
+        chunk = self._chunks.get((cx, cy))
+        if chunk is None:
+            chunk = self._chunks[cx, cy] = self._paint_chunk(cx, cy)
+        return chunk
+
+    def _paint_chunk(self, cx: int, cy: int) -> pygame.Surface:
+        chunk = pygame.Surface((self.chunk_size, self.chunk_size)).convert()
+        chunk.blit(self.background, (0, 0))
+        offset_x = cx * self.chunk_size
+        offset_y = cy * self.chunk_size
+        for index in self._chunk_blits.get((cx, cy), ()):
+            operation = self._blits[index]
+            if len(operation) == 2:
+                color, rect = operation
+                chunk.fill(color, rect.move(-offset_x, -offset_y))
+            else:
+                source, x, y, area, special_flags = operation
+                chunk.blit(source, (x - offset_x, y - offset_y), area, special_flags)
+        self.chunks_painted += 1
+        return chunk
+
+    def draw(self, surface: pygame.Surface, viewport: pygame.Rect):
+        """Draw the chunks that overlap {viewport} to {surface}, and evict those far from it."""
+        view = viewport.clip(self.get_rect())
+        for cx, cy in self.chunks_overlapping(view):
+            chunk_x = cx * self.chunk_size
+            chunk_y = cy * self.chunk_size
+            # don't draw past the edge of the map
+            area = pygame.Rect(0, 0, self.width - chunk_x, self.height - chunk_y)
+            surface.blit(self.get_chunk(cx, cy), (chunk_x - viewport.x, chunk_y - viewport.y), area)
+
+        margin = self.resident_margin * self.chunk_size
+        resident = set(self.chunks_overlapping(viewport.inflate(margin * 2, margin * 2)))
+        for chunk in [chunk for chunk in self._chunks if chunk not in resident]:
+            del self._chunks[chunk]
+
+    @property
+    def resident_chunks(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def resident_bytes(self) -> int:
+        """Memory used by the pixels of the resident chunks."""
+        return sum(chunk.get_bytesize() * chunk.get_width() * chunk.get_height()
+                   for chunk in self._chunks.values())
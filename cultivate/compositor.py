@@ -0,0 +1,112 @@
+"""Drawing the screen as a stack of layers.
+
+Each {Layer} draws one kind of thing, e.g. the ground or the HUD, and the {Compositor} draws them in order of {Layer.z}.
+A layer with a {Layer.key} is cached: it is drawn onto its own transparent surface,
+which is only drawn again when the key changes, and is otherwise copied to the screen as it is.
+Cached layers should be mostly transparent, like the HUD,
+as the cache is run length encoded so the transparent parts cost nothing to copy.
+Run length encoded surfaces are blended a little differently,
+so partly transparent pixels of a cached layer can be a shade off from drawing them straight to the screen.
+"""
+import typing
+
+import pygame
+
+from cultivate import profiler
+
+# the z order of the game's layers, higher layers are drawn over lower ones
+GROUND = 0
+PROPS = 10
+ACTORS = 20
+ROOFS = 30
+PLAYER = 40
+HUD = 50
+OVERLAY = 60
+
+
+class Layer:
+    """Things on screen drawn by {draw}, over every layer with a lower {z}.
+
+    :param draw: called with the surface to draw on and the frame being drawn
+    :param key: called with the frame being drawn, returns something that changes whenever what the layer draws would.
+                If given, the layer is cached.
+    :param interval: only check whether a cached layer changed every {interval} frames
+    """
+
+    def __init__(self, name: str, z: int, draw: typing.Callable[[pygame.Surface, typing.Any], None],
+                 key: typing.Callable[[typing.Any], typing.Hashable] = None, interval: int = 1):
+        self.name = name
+        self.z = z
+        self._draw = draw
+        self.key = key
+        self.interval = interval
+        self._cache = None
+        self._cached_key = None
+        self._checked = None
+        # how many times the layer has been drawn, rather than copied from its cache
+        self.redrawn = 0
+
+    def draw(self, surface: pygame.Surface, frame, number: int) -> None:
+        """Draw the layer for {frame}, the {number}th frame drawn, to {surface}."""
+        if self.key is None:
+            self.redrawn += 1
+            self._draw(surface, frame)
+            return
+
+        if self._checked is None or number - self._checked >= self.interval:
+            self._checked = number
+            key = self.key(frame)
+            if self._cache is None or self._cache.get_size() != surface.get_size() or key != self._cached_key:
+                self._cached_key = key
+                self.redraw(surface.get_size(), frame)
+        surface.blit(self._cache, (0, 0))
+
+    def redraw(self, size: typing.Tuple[int, int], frame) -> None:
+        if self._cache is None or self._cache.get_size() != size:
+            self._cache = pygame.Surface(size, pygame.SRCALPHA)
+            self._cache.set_alpha(255, pygame.RLEACCEL)
+        else:
+            self._cache.fill((0, 0, 0, 0))
+        self.redrawn += 1
+        self._draw(self._cache, frame)
+
+    def invalidate(self) -> None:
+        """Draw the layer again next frame, even if its key hasn't changed."""
+        self._cache = None
+        self._checked = None
+
+
+class Compositor:
+    """Draws {layers} from the lowest {Layer.z} up."""
+
+    def __init__(self, layers: typing.Iterable[Layer] = ()):
+        self.layers = []
+        self.frames = 0
+        for layer in layers:
+            self.add(layer)
+
+    def add(self, layer: Layer) -> None:
+        """Add {layer}, above any layers with the same {Layer.z}."""
+        self.layers.append(layer)
+        self.layers.sort(key=lambda layer: layer.z)
+
+    def remove(self, name: str) -> None:
+        self.layers.remove(self[name])
+
+    def __getitem__(self, name: str) -> Layer:
+        for layer in self.layers:
+            if layer.name == name:
+                return layer
+        raise KeyError(name)
+
+    def draw(self, surface: pygame.Surface, frame) -> None:
+        """Draw every layer for {frame} to {surface}, timing each one."""
+        for layer in self.layers:
+            with profiler.section(layer.name):
+                layer.draw(surface, frame, self.frames)
+        self.frames += 1
+
+    def invalidate(self) -> None:
+        """Draw every cached layer again next frame."""
+        for layer in self.layers:
+            layer.invalidate()
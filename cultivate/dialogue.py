@@ -1,4 +1,5 @@
 import pygame
+from cultivate import text_layout
 from cultivate.loader import get_conversation_box
 from cultivate.settings import WIDTH, HEIGHT, MD_FONT
 
@@ -6,37 +7,13 @@ FOREGROUND = pygame.Color(0, 0, 0)
 DE_EMPH = pygame.Color("black")
 
 def drawText(surface, text, color, rect, font, line_sp=2):
-    rect = pygame.Rect(rect)
-    y = rect.top
-
-    # get the height of the font
-    font_height = font.size("Tg")[1]
-
-    while text:
-        i = 1
-
-        # determine if the row of text will be outside our area
-        if y + font_height > rect.bottom:
-            break
-
-        # determine maximum width of line
-        while font.size(text[:i])[0] < rect.width and i < len(text):
-            i += 1
+    """Draw {text} wrapped to fit in {rect}.
 
-        # if we've wrapped the text, then adjust the wrap to the last word
-        if i < len(text):
-            i = text.rfind(" ", 0, i) + 1
-
-        # render the line and blit it to the surface
-        image = font.render(text[:i], True, color)
-
-        surface.blit(image, (rect.left, y))
-        y += font_height + line_sp
-
-        # remove the text we just blitted
-        text = text[i:]
-
-    return y, text
+    :return: the y coordinate below the text, and the text that didn't fit
+    """
+    rect = pygame.Rect(rect)
+    layout = text_layout.layout(text, font, rect.width, rect.height, line_sp)
+    return layout.draw(surface, color, rect.topleft), layout.overflow
 
 
 class Dialogue:
@@ -47,6 +24,16 @@ class Dialogue:
         self.render = None
         self.rect = pygame.Rect(0, HEIGHT - self.height, self.width, self.height)
         self.padding = 10
+        # the npc name and conversation node last shown, which {render} is a drawing of
+        self.shown = None
+
+    def show(self, npc_name, node):
+        """Show conversation {node}, said by {npc_name}, only drawing it again if it isn't already shown."""
+        if self.shown is not None and self.shown[0] == npc_name and self.shown[1] is node:
+            return
+        self.set_data(npc_name, node['text'], node['responses'])
+        # keep the node itself rather than its id, so the id can't be reused by another node
+        self.shown = (npc_name, node)
 
     def set_data(self, npc_name, text, responses):
         font_width, font_height = MD_FONT.size(text)
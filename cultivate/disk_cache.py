@@ -0,0 +1,89 @@
+import functools
+import hashlib
+import logging
+import os
+import struct
+import typing
+
+import pygame
+
+from cultivate import settings
+
+# bump this to invalidate every cached surface, e.g. after changing how a surface is composed
+CACHE_VERSION = 1
+
+HEADER = struct.Struct("<4sII")
+FORMATS = {b"RGBA": "RGBA", b"RGB\0": "RGB"}
+
+tobytes = getattr(pygame.image, "tobytes", None) or pygame.image.tostring
+
+
+@functools.lru_cache(None)
+def file_digest(path: str) -> str:
+    """Hash the contents of the file at {path}."""
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def cache_key(func: typing.Callable, sheets: typing.Iterable[str], args: tuple, kwargs: dict) -> str:
+    key = hashlib.sha1()
+    key.update(repr((CACHE_VERSION, func.__module__, func.__qualname__, args, sorted(kwargs.items()))).encode())
+    for sheet in sheets:
+        key.update(file_digest(os.path.join(settings.SPRITES_DIR, sheet)).encode())
+    return key.hexdigest()
+
+
+def save_surface(path: str, surface: pygame.Surface) -> None:
+    """Write the raw pixels of {surface} to {path}."""
+    has_alpha = bool(surface.get_flags() & pygame.SRCALPHA)
+    pixel_format = b"RGBA" if has_alpha else b"RGB\0"
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    # write to a temporary file first, so a half written file is never loaded
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as f:
+        f.write(HEADER.pack(pixel_format, *surface.get_size()))
+        f.write(tobytes(surface, FORMATS[pixel_format]))
+    os.replace(temp_path, path)
+
+
+def load_surface(path: str) -> pygame.Surface:
+    """Read a surface written by {save_surface} from {path}."""
+    with open(path, "rb") as f:
+        pixel_format, width, height = HEADER.unpack(f.read(HEADER.size))
+        pixels = f.read()
+    surface = pygame.image.frombuffer(pixels, (width, height), FORMATS[pixel_format])
+    # converting copies the pixels, so the returned surface doesn't depend on {pixels}
+    if pixel_format == b"RGBA":
+        return surface.convert_alpha()
+    return surface.convert()
+
+
+def cached_surface(*sheets: str):
+    """Cache the surfaces returned by the decorated function on disk.
+
+    Surfaces are keyed by the function, the arguments it was called with,
+    and the contents of the spritesheets in {sheets} (relative to {settings.SPRITES_DIR}) it is composed from,
+    so editing a spritesheet invalidates everything composed from it.
+    """
+    def decorator(func: typing.Callable[..., pygame.Surface]) -> typing.Callable[..., pygame.Surface]:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> pygame.Surface:
+            if not settings.DISK_CACHE:
+                return func(*args, **kwargs)
+
+            path = os.path.join(settings.CACHE_DIR, cache_key(func, sheets, args, kwargs) + ".surface")
+            try:
+                return load_surface(path)
+            except FileNotFoundError:
+                pass
+            except (OSError, struct.error, KeyError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable cached surface {path}: {e}")
+
+            surface = func(*args, **kwargs)
+            try:
+                save_surface(path, surface)
+            except OSError as e:
+                logging.warning(f"Could not cache surface to {path}: {e}")
+            return surface
+        return wrapper
+    return decorator
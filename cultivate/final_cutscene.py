@@ -1,8 +1,8 @@
 from collections import namedtuple
-import time
 
 import pygame
 
+from cultivate import timing
 from cultivate.conversation_tree import ConversationTree
 from cultivate.dialogue import Dialogue
 from cultivate.npc import NpcSacrifice, NpcPathAndStop
@@ -148,6 +148,7 @@ class FinalCutscene:
 
         self.dialogue = END_DIALOGUE
         self.current_conversation = None
+        self.dialogue_box = Dialogue()
         self.state = 0
 
         self.demon_fire = None
@@ -170,13 +171,8 @@ class FinalCutscene:
 
     def draw(self, surface):
         if self.current_conversation:
-            d = Dialogue()
-            d.set_data(
-                "Cult Leader",
-                self.current_conversation.current['text'],
-                self.current_conversation.current['responses']
-            )
-            d.draw(surface)
+            self.dialogue_box.show("Cult Leader", self.current_conversation.current)
+            self.dialogue_box.draw(surface)
         if self.demon:
             surface.blit(self.demon.image, (0, 0))
 
@@ -234,7 +230,7 @@ class FinalCutscene:
                 self.setup_state()
 
         elif self.state == 11:
-            if time.time() > self.end_time:
+            if timing.now() > self.end_time:
                 if self.game_state.tasks_sabotaged == 5:
                     raise SummoningSabotaged("Sabotage complete")
                 else:
@@ -309,4 +305,4 @@ class FinalCutscene:
                 self.npc_sprites.add(DemonFire(*FIRE_POS))
             else:
                 self.demon = Demon(0, 0)
-            self.end_time = time.time() + 5
+            self.end_time = timing.now() + 5
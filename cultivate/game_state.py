@@ -1,7 +1,16 @@
 from collections import namedtuple
+from functools import partial
+import random
+
+import pygame
+
+from cultivate import settings
+from cultivate import loader
+from cultivate.loader import get_demon, get_demon_fire, get_npc_pink_robes, get_npc_white_robes, get_pentagram
 from cultivate.npc import Susan, NpcFollower, NpcQuester, CultLeader, Pentagram
+from cultivate.npc_batch import crowd
 from cultivate.tasks import task_conversations
-from cultivate.transition import Fader
+from cultivate.transition import make_transition
 from cultivate.settings import WIDTH, HEIGHT
 from cultivate.sprites.grave import Grave
 from cultivate.sprites.desk import Desk
@@ -12,6 +21,61 @@ from pygame.sprite import Group
 
 TaskStatus = namedtuple('TaskStatus', 'completed sabotaged')
 
+# the directions NPC animations are loaded for
+DIRECTIONS = (None, 'forward', 'backward', 'left', 'right')
+
+# where the extra villagers of {settings.CROWD_SIZE} walk, inside the forest around the edge of the map
+CROWD_AREA = pygame.Rect(500, 350, settings.MAP_WIDTH - 1100, settings.MAP_HEIGHT - 800)
+
+
+def animations(*get_animations):
+    """Loader functions for the animations of characters walking in every direction."""
+    return [partial(get_images, direction=direction) for get_images in get_animations for direction in DIRECTIONS]
+
+
+# loader functions for the assets each day's NPCs and pickups need, including what can be crafted from them,
+# so they can be loaded while the day before is played
+DAY_ASSETS = {
+    # dig the grave
+    1: [
+        *animations(loader.get_npc_cat),
+        loader.get_shovel, loader.get_dug_grave, loader.get_planted_grave,
+        loader.get_plant1, loader.get_plant2, loader.get_plant3, loader.get_plant4,
+        loader.get_plant5, loader.get_plant6, loader.get_plant7,
+    ],
+    # make lemonade
+    2: [
+        *animations(loader.get_npc5, loader.get_npc_cat),
+        loader.get_lemon_basket, loader.get_basin_empty, loader.get_basin_water, loader.get_empty_bottle,
+        loader.get_rat_poison, loader.get_lemonade_pitcher,
+    ],
+    # do laundry
+    3: [
+        *animations(loader.get_npc_cat),
+        loader.get_basin_empty, loader.get_basin_water, loader.get_soap, loader.get_sock,
+        loader.get_laundry_dirty, loader.get_laundry_basin, loader.get_laundry_clean_white,
+        loader.get_laundry_clean_pink,
+    ],
+    # make candles
+    4: [
+        *animations(loader.get_npc_cat),
+        loader.get_basin_empty, loader.get_basin_water, loader.get_empty_bottle, loader.get_brown_jar,
+        loader.get_pestle_and_mortar, loader.get_melted_wax, loader.get_candles_black,
+    ],
+    # edit prayer sheet
+    5: [
+        *animations(loader.get_npc_cat),
+    ],
+    # the summoning ritual, and the final cutscene at the end of it
+    6: [
+        *animations(loader.get_npc5, loader.get_npc_cat),
+        get_pentagram,
+        *animations(get_npc_white_robes, get_npc_pink_robes),
+        get_demon,
+        get_demon_fire,
+    ],
+}
+
 class GameState:
     def __init__(self, day=0):
         self.day = day
@@ -21,7 +85,7 @@ class GameState:
         self.task_status = [TaskStatus(False, False)] * 6
         self.playthroughs = 0
 
-        self.fader = Fader()
+        self.fader = make_transition()
 
         self.final_cutscene = False
         self.madlib_text = "1\n2\n\n3\n4\n5\n6\n\n7\n\n"
@@ -101,8 +165,18 @@ class GameState:
                 Pentagram()
             ])
 
+        if settings.CROWD_SIZE:
+            # fill the map inside the forest with extra villagers, who walk the same way for the same seed,
+            # and when no seed is given, the same way when a recording is replayed, like the map
+            seed = settings.WORLD_SEED if settings.WORLD_SEED is not None else random.randrange(2 ** 32)
+            self.npc_sprites.add(crowd(settings.CROWD_SIZE, CROWD_AREA, random.Random(seed)))
+
         return self.npc_sprites, self.pickups
 
+    def get_next_day_assets(self):
+        """Return loader functions for the assets the next day needs, see {DAY_ASSETS}."""
+        return DAY_ASSETS.get(self.day + 1, [])
+
     def trigger_final_cutscene(self):
         if not self.final_cutscene:
             self.final_cutscene = True
@@ -112,6 +186,7 @@ class GameState:
         return self.task_status[self.day].completed or self.task_status[self.day].sabotaged
 
     def update(self, viewport):
+        self.fader.update()
         if self.final_cutscene:
             self._cutscene.update(viewport)
 
@@ -0,0 +1,162 @@
+"""Drawing text from glyphs that are only rendered once.
+
+Each glyph of a font in a colour is rendered once into a {GlyphAtlas},
+and text is drawn by copying glyphs out of the atlas.
+Whole strings that are drawn often, like UI labels, are kept in a {TextCache},
+which forgets the least recently used strings when they take up more memory than its budget.
+
+Glyphs are placed by their advances in whole pixels, where {pygame.font.Font.render} uses fractions of a pixel,
+so text can be a pixel or two wider than it would draw it.
+"""
+import collections
+import typing
+
+import pygame
+
+from cultivate import settings
+
+# the width of an atlas, which grows downwards as glyphs are added
+ATLAS_WIDTH = 512
+
+
+class GlyphAtlas:
+    """Every glyph of {font} drawn so far in {color}, packed into rows of one surface."""
+
+    def __init__(self, font: pygame.font.Font, color: pygame.Color):
+        self.font = font
+        self.color = pygame.Color(color)
+        self.height = font.get_height()
+        self.surface = pygame.Surface((ATLAS_WIDTH, self.height), pygame.SRCALPHA)
+        # character -> (area of the atlas, x offset from the pen position, advance)
+        self.glyphs = {}
+        self._cursor = (0, 0)
+
+    def glyph(self, char: str) -> typing.Tuple[pygame.Rect, int, int]:
+        try:
+            return self.glyphs[char]
+        except KeyError:
+            pass
+        image = self.font.render(char, True, self.color)
+        metrics = self.font.metrics(char)[0]
+        if metrics is None:
+            # the font has no glyph for {char}
+            offset, advance = 0, image.get_width()
+        else:
+            # a glyph that reaches left of the pen position is rendered with that overhang included
+            offset, advance = min(metrics[0], 0), metrics[4]
+        area = self._place(image)
+        self.glyphs[char] = (area, offset, advance)
+        return self.glyphs[char]
+
+    def _place(self, image: pygame.Surface) -> pygame.Rect:
+        """Copy {image} into the next free space of the atlas, growing it if it is full."""
+        w, h = image.get_size()
+        x, y = self._cursor
+        if x + w > ATLAS_WIDTH:
+            x, y = 0, y + self.height
+        if y + h > self.surface.get_height():
+            grown = pygame.Surface((ATLAS_WIDTH, max(y + h, self.surface.get_height() * 2)), pygame.SRCALPHA)
+            grown.blit(self.surface, (0, 0))
+            self.surface = grown
+        self.surface.blit(image, (x, y))
+        self._cursor = (x + w, y)
+        return pygame.Rect(x, y, w, h)
+
+    def size(self, text: str) -> typing.Tuple[int, int]:
+        """The size of {text} drawn by {render}."""
+        return self._layout(text)[0], self.height
+
+    def _layout(self, text: str) -> typing.Tuple[int, typing.List[typing.Tuple[pygame.Rect, int]]]:
+        """Work out where each glyph of {text} goes.
+
+        :return: the width of the text, and the area of the atlas and x position of each glyph
+        """
+        glyphs = [self.glyph(char) for char in text]
+        # start far enough right that a first glyph overhanging the pen isn't cut off
+        pen = -glyphs[0][1] if glyphs else 0
+        width = 0
+        placed = []
+        for area, offset, advance in glyphs:
+            placed.append((area, pen + offset))
+            width = max(width, pen + offset + area.w)
+            pen += advance
+        return max(width, pen), placed
+
+    def render(self, text: str) -> pygame.Surface:
+        """Draw {text} onto a new transparent surface."""
+        width, placed = self._layout(text)
+        surface = pygame.Surface((max(width, 1), self.height), pygame.SRCALPHA)
+        # glyphs can overlap, so keep the most opaque pixel of each rather than blending
+        surface.blits([(self.surface, (x, 0), area, pygame.BLEND_RGBA_MAX) for area, x in placed], doreturn=False)
+        return surface
+
+
+class TextCache:
+    """Rendered strings, most recently used last, taking up at most {budget} bytes between them."""
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        # (font, text, colour) -> rendered text
+        self._strings = collections.OrderedDict()
+        # (font, colour) -> atlas
+        self._atlases = {}
+
+    def atlas(self, font: pygame.font.Font, color: pygame.Color) -> GlyphAtlas:
+        key = (font, tuple(pygame.Color(color)))
+        if key not in self._atlases:
+            self._atlases[key] = GlyphAtlas(font, color)
+        return self._atlases[key]
+
+    def render(self, font: pygame.font.Font, text: str, color: pygame.Color) -> pygame.Surface:
+        """Return {text} drawn in {font} and {color}.
+
+        The surface may be returned again for the same text, so it mustn't be drawn on.
+        """
+        key = (font, text, tuple(pygame.Color(color)))
+        try:
+            surface = self._strings[key]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            self._strings.move_to_end(key)
+            return surface
+
+        surface = self.atlas(font, color).render(text)
+        self._strings[key] = surface
+        self.size += self.bytes(surface)
+        self.evict()
+        return surface
+
+    def evict(self) -> None:
+        """Forget the least recently used strings until they fit in {budget}."""
+        while self.size > self.budget and self._strings:
+            _, surface = self._strings.popitem(last=False)
+            self.size -= self.bytes(surface)
+
+    def clear(self) -> None:
+        self._strings.clear()
+        self._atlases.clear()
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._strings)
+
+    @staticmethod
+    def bytes(surface: pygame.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    @property
+    def atlas_bytes(self) -> int:
+        return sum(self.bytes(atlas.surface) for atlas in self._atlases.values())
+
+
+cache = TextCache(settings.TEXT_CACHE_BUDGET)
+
+
+def render(font: pygame.font.Font, text: str, color: pygame.Color) -> pygame.Surface:
+    """Return {text} drawn in {font} and {color}, from {cache}."""
+    return cache.render(font, text, color)
@@ -0,0 +1,134 @@
+"""Where the game's input comes from.
+
+The game reads events and held keys from {source},
+which is the keyboard unless it is replaced, e.g. by a {ScriptedInput} when running headless,
+or wrapped in a {RecordingInput} to record a script.
+"""
+import typing
+
+import pygame
+
+
+class KeyboardInput:
+    """Input from the player at the keyboard."""
+
+    def get_events(self) -> typing.List[pygame.event.Event]:
+        """Return the events for this frame."""
+        return pygame.event.get()
+
+    def get_pressed(self) -> typing.Sequence[bool]:
+        """Return which keys are held down, indexed by key code."""
+        return pygame.key.get_pressed()
+
+
+class HeldKeys:
+    """Which keys are held down, indexed by key code like the result of {pygame.key.get_pressed}."""
+
+    def __init__(self, keys: typing.Iterable[int] = ()):
+        self.keys = frozenset(keys)
+
+    def __getitem__(self, key: int) -> bool:
+        return key in self.keys
+
+
+class ScriptedInput:
+    """Input read from a script, for running the game without a player.
+
+    Each line of a script is `<frame> <down|up> <key name>`, for example `30 down s`,
+    where key names are those used by {pygame.key.name}.
+    A line `seed <number>` gives the seed for the random number generator the script was recorded with.
+    Blank lines and lines starting with `#` are ignored.
+    """
+
+    def __init__(self, lines: typing.Iterable[str]):
+        # frame -> [(event type, key)]
+        self.script = {}
+        self.last_frame = -1
+        self.seed = None
+        for line_number, line in enumerate(lines, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                if line.startswith("seed "):
+                    self.seed = int(line.split()[1])
+                    continue
+                frame, action, name = line.split(None, 2)
+                event_type = {"down": pygame.KEYDOWN, "up": pygame.KEYUP}[action]
+                key = pygame.key.key_code(name)
+                frame = int(frame)
+            except (ValueError, KeyError) as e:
+                raise ValueError(f"Invalid input script line {line_number}: {line!r}") from e
+            self.script.setdefault(frame, []).append((event_type, key))
+            self.last_frame = max(self.last_frame, frame)
+
+        self.frame = -1
+        self.held = set()
+
+    @classmethod
+    def from_file(cls, path: str) -> "ScriptedInput":
+        with open(path) as f:
+            return cls(f)
+
+    @property
+    def finished(self) -> bool:
+        """Every line of the script has been played."""
+        return self.frame >= self.last_frame
+
+    def get_events(self) -> typing.List[pygame.event.Event]:
+        """Move on to the next frame, and return the scripted events for it."""
+        # keep the window system happy, even though nothing it says is used
+        pygame.event.pump()
+        self.frame += 1
+        events = []
+        for event_type, key in self.script.get(self.frame, []):
+            if event_type == pygame.KEYDOWN:
+                self.held.add(key)
+            else:
+                self.held.discard(key)
+            events.append(pygame.event.Event(event_type, key=key))
+        return events
+
+    def get_pressed(self) -> HeldKeys:
+        return HeldKeys(self.held)
+
+
+class RecordingInput:
+    """Passes on input from another source, and writes the key presses to a script that replays them.
+
+    Held keys are worked out from the key presses, rather than asked of the other source,
+    so that the game sees exactly the same input when the script is replayed.
+    """
+
+    def __init__(self, source, script: typing.TextIO, seed: int):
+        self.source = source
+        self.script = script
+        self.frame = -1
+        self.held = set()
+        self.script.write(f"seed {seed}\n")
+
+    def get_events(self) -> typing.List[pygame.event.Event]:
+        self.frame += 1
+        events = self.source.get_events()
+        for event in events:
+            if event.type not in (pygame.KEYDOWN, pygame.KEYUP) or not pygame.key.name(event.key):
+                continue
+            if event.type == pygame.KEYDOWN:
+                self.held.add(event.key)
+                action = "down"
+            else:
+                self.held.discard(event.key)
+                action = "up"
+            self.script.write(f"{self.frame} {action} {pygame.key.name(event.key)}\n")
+        return events
+
+    def get_pressed(self) -> HeldKeys:
+        return HeldKeys(self.held)
+
+
+source = KeyboardInput()
+
+
+def get_pressed() -> typing.Sequence[bool]:
+    """Return which keys are held down according to {source}."""
+    return source.get_pressed()
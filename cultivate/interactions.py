@@ -0,0 +1,130 @@
+import typing
+
+import pygame
+
+from cultivate.spatial import SpatialHash
+from cultivate.sprites.pickups import BasePickUp
+
+# when several things are in reach, prefer pickups, then NPCs, then static things, then the closest
+PICKUP, NPC, STATIC = range(3)
+
+
+class Affordances(typing.NamedTuple):
+    """What the player can do with {item}, the nearest thing to them if there is one."""
+    item: typing.Any
+    # the player is holding something
+    holding: bool
+    # the held item can be combined with {item}
+    combine: bool
+    help_text: typing.Optional[str]
+
+    @property
+    def pickup(self) -> bool:
+        return isinstance(self.item, BasePickUp) and not self.holding
+
+    @property
+    def tooltip(self) -> typing.Optional[str]:
+        if self.combine:
+            return "press c to combine"
+        if self.help_text and not (isinstance(self.item, BasePickUp) and self.holding):
+            return f"press x to {self.help_text}"
+        if self.holding:
+            return "press z to drop"
+        return None
+
+
+class Interactions:
+    """Finds what the player can reach, and what they can do with it.
+
+    Static interactables and pickups are indexed by where they are on the map,
+    NPCs move every tick so they are checked directly.
+    Pickups are only moved, added and removed in response to key presses (or added by a cutscene),
+    so they are indexed again after {invalidate} is called, or when the group or number of pickups changes.
+    What the player can do with the nearest thing is only worked out again
+    when the nearest thing or the held item changes, or after {invalidate} is called.
+    """
+
+    def __init__(self, player, static_interactables: typing.Iterable[pygame.sprite.Sprite]):
+        self.player = player
+        self._statics = SpatialHash()
+        for item in static_interactables:
+            self._statics.insert(item, item.rect)
+        self._pickups = SpatialHash()
+        # pickup -> where it was indexed
+        self._pickup_positions = {}
+        self._pickup_group = None
+        self._pickups_stale = True
+
+        self.affordances = Affordances(None, False, False, None)
+        # the affordances changed during the last {update}
+        self.changed = True
+        self._affordances_key = None
+
+    def invalidate(self) -> None:
+        """Work out the affordances again on the next {update}, e.g. after an interaction changed something."""
+        self._affordances_key = None
+        self._pickups_stale = True
+
+    def reach(self, viewport: pygame.Rect) -> pygame.Rect:
+        """The area of the map the player can reach."""
+        return self.player.tooltip_boundary(viewport).move(viewport.x, viewport.y)
+
+    def _index_pickups(self, pickups: typing.Collection[BasePickUp]) -> None:
+        if not self._pickups_stale and pickups is self._pickup_group and len(pickups) == len(self._pickup_positions):
+            return
+        self._pickups_stale = False
+        self._pickup_group = pickups
+        positions = {item: (item.x, item.y) for item in pickups}
+        if positions == self._pickup_positions:
+            return
+        for item in self._pickup_positions.keys() - positions.keys():
+            self._pickups.remove(item)
+        for item, (x, y) in positions.items():
+            if self._pickup_positions.get(item) != (x, y):
+                self._pickups.insert(item, pygame.Rect(x, y, item.rect.w, item.rect.h))
+        self._pickup_positions = positions
+
+    def nearby(self, viewport: pygame.Rect, pickups: typing.Collection[BasePickUp],
+               npc_sprites: typing.Iterable[pygame.sprite.Sprite] = ()) -> typing.List:
+        """Return everything in reach of the player, the most relevant first.
+
+        :param npc_sprites: NPCs to consider, which are positioned on the screen
+        """
+        reach = self.reach(viewport)
+        self._index_pickups(pickups)
+        found = [(PICKUP, self._pickups.get_rect(item), item) for item in self._pickups.query(reach)]
+        for npc in npc_sprites:
+            rect = npc.rect.move(viewport.x, viewport.y)
+            if reach.colliderect(rect):
+                found.append((NPC, rect, npc))
+        found.extend((STATIC, item.rect, item) for item in self._statics.query(reach))
+
+        x, y = reach.center
+
+        def relevance(tier_rect_item) -> typing.Tuple[int, int]:
+            # distance to the closest edge, so big things like the river aren't considered far away
+            tier, rect, _ = tier_rect_item
+            dx = max(rect.left - x, 0, x - rect.right)
+            dy = max(rect.top - y, 0, y - rect.bottom)
+            return tier, dx * dx + dy * dy
+
+        found.sort(key=relevance)
+        return [item for _, _, item in found]
+
+    def update(self, viewport: pygame.Rect, pickups: typing.Collection[BasePickUp],
+               npc_sprites: typing.Iterable[pygame.sprite.Sprite]) -> Affordances:
+        """Find the nearest thing in reach of the player, and what they can do with it."""
+        nearby = self.nearby(viewport, pickups, npc_sprites)
+        nearest = nearby[0] if nearby else None
+        held = self.player.pickup
+        key = (nearest, held)
+        self.changed = key != self._affordances_key
+        if self.changed:
+            self._affordances_key = key
+            if nearest is None:
+                self.affordances = Affordances(None, held is not None, False, None)
+            else:
+                self.affordances = Affordances(nearest, held is not None,
+                                               held is not None and held.can_combine(nearest),
+                                               nearest.help_text)
+        return self.affordances
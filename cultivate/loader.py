@@ -1,35 +1,36 @@
 import os
-from functools import lru_cache
+import typing
 
 import pygame
 import pyganim
 import random
 
-from cultivate import settings
+from cultivate import settings, tiling
+from cultivate.asset_cache import scoped
+from cultivate.atlas import atlas
+from cultivate.disk_cache import cached_surface
 
-# todo: the spritesheets may be loaded from disk multiple tiles
 
-
-@lru_cache(None)
+@scoped("session")
 def get_music(path: str) -> pygame.mixer.Sound:
     path = path.replace("/", os.sep).replace("\\", os.sep)
     path = os.path.join(settings.MUSIC_DIR, path)
     return pygame.mixer.Sound(path)
 
 
-@lru_cache(None)
+@scoped("session")
 def get_sound(path: str) -> pygame.mixer.Sound:
     path = path.replace("/", os.sep).replace("\\", os.sep)
     path = os.path.join(settings.SOUNDS_DIR, path)
     return pygame.mixer.Sound(path)
 
 
-@lru_cache(None)
+@scoped("session")
 def get_font(filename: str, size: int) -> pygame.font.Font:
     path = os.path.join(settings.FONTS_DIR, filename)
     return pygame.font.Font(path, size)
 
-@lru_cache(None)
+@scoped("session")
 def get_image(path: str, has_alpha: bool = False) -> pygame.Surface:
     canonicalized_path = path.replace('/', os.sep).replace('\\', os.sep)
     image = pygame.image.load(canonicalized_path)
@@ -39,7 +40,21 @@ def get_image(path: str, has_alpha: bool = False) -> pygame.Surface:
         return image.convert()
 
 
-@lru_cache(None)
+def get_atlas_sprites(filename: str, rects) -> typing.List[pygame.Surface]:
+    """Cut {rects} out of the spritesheet {filename}, packed into the sprite atlas."""
+    names = [f"{filename}{tuple(rect)}" for rect in rects]
+    missing = [rect for name, rect in zip(names, rects) if name not in atlas]
+    if missing:
+        images = pyganim.getImagesFromSpriteSheet(
+            os.path.join(settings.SPRITES_DIR, filename),
+            rects=missing)
+        for rect, image in zip(missing, images):
+            atlas.add(f"{filename}{tuple(rect)}", image)
+    return [atlas.get(name) for name in names]
+
+
+@scoped("session")
+@cached_surface('foliage4.png')
 def get_grass(width: int, height: int) -> pygame.Surface:
     # load the grass tile from the sprite sheet
     grass_tile = pyganim.getImagesFromSpriteSheet(
@@ -50,13 +65,12 @@ def get_grass(width: int, height: int) -> pygame.Surface:
     grass = pygame.Surface((width, height), pygame.SRCALPHA, 32).convert_alpha()
 
     # paint grass tiles onto surface
-    for i in range(0, width, 16):
-        for j in range(0, height, 16):
-            grass.blit(grass_tile, (i, j))
+    tiling.tile(grass, grass_tile)
     return grass
 
 
-@lru_cache(None)
+@scoped("session")
+@cached_surface('river1.png')
 def get_river(height):
     tiles = [
         (64, 48, 16, 16),  # left river
@@ -79,7 +93,8 @@ def get_river(height):
     return river
 
 
-@lru_cache(None)
+@scoped("session")
+@cached_surface('floors1.png')
 def get_floor(width: int, height: int) -> pygame.Surface:
     # load the floor tile from the sprite sheet
     floor_tile = pyganim.getImagesFromSpriteSheet(
@@ -89,13 +104,11 @@ def get_floor(width: int, height: int) -> pygame.Surface:
     # create a blank surface to tile
     floor = pygame.Surface((width, height), pygame.SRCALPHA, 32).convert()
 
-    # tile the floor
-    for i in range(0, height, 16):
-        for j in range(0, width, 16):
-            floor.blit(floor_tile, (i, j))
+    # tile the floor, which has always been tiled {height} across and {width} down
+    tiling.tile(floor, floor_tile, (0, 0, len(range(0, height, 16)) * 16, len(range(0, width, 16)) * 16))
     return floor
 
-@lru_cache(None)
+@scoped("session")
 def get_character(filename, direction):
     tiles = [
         (3, 130, 25, 36),  # facing forward
@@ -111,11 +124,7 @@ def get_character(filename, direction):
         (27, 236, 25, 34),
         (52, 236, 25, 34)
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, filename),
-        rects=tiles)
-    for tile in char_tiles:
-        tile.convert_alpha()
+    char_tiles = get_atlas_sprites(filename, tiles)
     character = pygame.Surface(
         (23, 34), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -158,15 +167,15 @@ def get_character(filename, direction):
 
     return animChar
 
-@lru_cache(None)
+@scoped("session")
 def get_player(direction=None):
     return get_character("chars1.png", direction)
 
-@lru_cache(None)
+@scoped("session")
 def get_npc(direction=None):
     return get_character("chars1-2.png", direction)
 
-@lru_cache(None)
+@scoped("session")
 def get_npc2(direction=None):
     tiles = [
         (1, 128, 30, 32), # forward
@@ -182,9 +191,7 @@ def get_npc2(direction=None):
         (33, 224, 30, 32),
         (66, 224, 30, 32)
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "chars5.png"),
-        rects=tiles)
+    char_tiles = get_atlas_sprites("chars5.png", tiles)
     character = pygame.Surface(
         (30, 32), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -226,7 +233,7 @@ def get_npc2(direction=None):
     animChar.play()
     return animChar
 
-@lru_cache(None)
+@scoped("session")
 def get_npc5(direction=None):
     tiles = [
         (98, 0, 30, 32), # forward
@@ -242,9 +249,7 @@ def get_npc5(direction=None):
         (130, 98, 30, 32),
         (161, 98, 30, 32),
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "chars2.png"),
-        rects=tiles)
+    char_tiles = get_atlas_sprites("chars2.png", tiles)
     character = pygame.Surface(
         (30, 32), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -286,7 +291,7 @@ def get_npc5(direction=None):
     animChar.play()
     return animChar
 
-@lru_cache(None)
+@scoped("session")
 def get_npc_innocent(direction=None):
     tiles = [
         (1, 128, 30, 32), # forward
@@ -302,9 +307,7 @@ def get_npc_innocent(direction=None):
         (33, 224, 30, 32),
         (66, 224, 30, 32)
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "chars9.png"),
-        rects=tiles)
+    char_tiles = get_atlas_sprites("chars9.png", tiles)
     character = pygame.Surface(
         (30, 32), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -346,7 +349,7 @@ def get_npc_innocent(direction=None):
     animChar.play()
     return animChar
 
-@lru_cache(None)
+@scoped("session")
 def get_npc3(direction=None):
     tiles = [
         (193, 128, 30, 32), # forward
@@ -362,9 +365,7 @@ def get_npc3(direction=None):
         (225, 224, 30, 32),
         (257, 224, 30, 32)
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "chars5.png"),
-        rects=tiles)
+    char_tiles = get_atlas_sprites("chars5.png", tiles)
     character = pygame.Surface(
         (30, 32), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -402,7 +403,7 @@ def get_npc3(direction=None):
     animChar.play()
     return animChar
 
-@lru_cache(None)
+@scoped("session")
 def get_npc_cat(direction=None):
     tiles = [
         (435, 12, 42, 42),
@@ -418,9 +419,7 @@ def get_npc_cat(direction=None):
         (483, 156, 42, 42),
         (530, 156, 42, 42),
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "cats1.png"),
-        rects=tiles)
+    char_tiles = get_atlas_sprites("cats1.png", tiles)
     character = pygame.Surface(
         (30, 32), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -458,7 +457,7 @@ def get_npc_cat(direction=None):
     animChar.play()
     return animChar
 
-@lru_cache(None)
+@scoped("session")
 def get_npc4(direction=None):
     tiles = [
         (99, 2, 27, 31),
@@ -474,9 +473,7 @@ def get_npc4(direction=None):
         (131, 98, 27, 31),
         (163, 98, 27, 31)
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "chars6.png"),
-        rects=tiles)
+    char_tiles = get_atlas_sprites("chars6.png", tiles)
     character = pygame.Surface(
         (30, 32), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -514,7 +511,7 @@ def get_npc4(direction=None):
     animChar.play()
     return animChar
 
-@lru_cache(None)
+@scoped("final cutscene")
 def get_npc_white_robes(direction=None):
     tiles = [
         (1, 128, 30, 32), # forward
@@ -530,9 +527,7 @@ def get_npc_white_robes(direction=None):
         (33, 224, 30, 32),
         (66, 224, 30, 32)
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "chars10.png"),
-        rects=tiles)
+    char_tiles = get_atlas_sprites("chars10.png", tiles)
     character = pygame.Surface(
         (30, 32), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -574,7 +569,7 @@ def get_npc_white_robes(direction=None):
     animChar.play()
     return animChar
 
-@lru_cache(None)
+@scoped("final cutscene")
 def get_npc_pink_robes(direction=None):
     tiles = [
         (1, 128, 30, 32), # forward
@@ -590,9 +585,7 @@ def get_npc_pink_robes(direction=None):
         (33, 224, 30, 32),
         (66, 224, 30, 32)
     ]
-    char_tiles = pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "pink_chars.png"),
-        rects=tiles)
+    char_tiles = get_atlas_sprites("pink_chars.png", tiles)
     character = pygame.Surface(
         (30, 32), pygame.SRCALPHA, 32).convert_alpha()
 
@@ -634,74 +627,64 @@ def get_npc_pink_robes(direction=None):
     animChar.play()
     return animChar
 
-@lru_cache(None)
+@scoped("session")
 def get_laundry_basin():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'food1.png'),
-        rects=[(160, 285, 32, 35)])[0].convert_alpha()
+    return get_atlas_sprites('food1.png', [(160, 285, 32, 35)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_lemonade_glass():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'food1.png'),
         rects=[(196, 258, 10, 14)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_lemonade_pitcher():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'food1.png'),
-        rects=[(227, 290, 18, 21)])[0].convert_alpha()
+    return get_atlas_sprites('food1.png', [(227, 290, 18, 21)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_rat_poison():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
-        rects=[(325, 224, 15, 17)])[0].convert_alpha()
+    return get_atlas_sprites('apothecary1.png', [(325, 224, 15, 17)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_empty_bottle():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
-        rects=[(272, 385, 15, 17)])[0].convert_alpha()
+    return get_atlas_sprites('apothecary1.png', [(272, 385, 15, 17)])[0]
 
 
-@lru_cache(None)
+@scoped("session")
 def get_lemonade_stand():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'food1.png'),
         rects=[(192, 161, 65, 86)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_sock():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'fairytale1.png'),
-        rects=[(259, 128, 20, 22)])[0].convert_alpha()
+    return get_atlas_sprites('fairytale1.png', [(259, 128, 20, 22)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_stained_glass_window():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'fairytale2.png'),
         rects=[(225, 111, 31, 69)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_desk():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'library1.png'),
         rects=[(192, 277, 64, 64)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_prayer_edits():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'library1.png'),
         rects=[(415, 224, 34, 29)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_prayer_scroll():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'library1.png'),
         rects=[(479, 223, 33, 34)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_bridge():
     tiles = [
         (416, 32, 44, 32)
@@ -718,55 +701,52 @@ def get_bridge():
         bridge.blit(images[0], (i, 0))
     return bridge
 
-@lru_cache(None)
+@scoped("session")
 def get_basin_water():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'food1.png'),
-        rects=[(159, 157, 33, 38)])[0].convert_alpha()
+    return get_atlas_sprites('food1.png', [(159, 157, 33, 38)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_basin_empty():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'food2.png'),
-        rects=[(159, 157, 33, 38)])[0].convert_alpha()
+    return get_atlas_sprites('food2.png', [(159, 157, 33, 38)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_dirt_path():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'foliage4.png'),
         rects=[(130, 0, 28, 32)])[0].convert_alpha()
 
 
-@lru_cache(None)
+@scoped("session")
 def get_weed():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "foliage2.png"),
         rects=[(131, 453, 58, 58)])[0].convert_alpha()
 
 
-@lru_cache(None)
+@scoped("session")
+@cached_surface('walls2.png')
 def get_walls(width):
     wall_tile = pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'walls2.png'),
         rects=[(64, 0, 64, 64)])[0].convert()
     wall = pygame.Surface((width, 64), pygame.SRCALPHA, 32).convert()
-    for i in range(0, width, 64):
-        wall.blit(wall_tile, (i, 0))
+    tiling.tile(wall, wall_tile)
     return wall
 
-@lru_cache(None)
+@scoped("session")
+@cached_surface('walls2.png')
 def get_walls_edge(height):
     wall_tile = pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'walls2.png'),
         rects=[(64, 0, 12, 64)])[0].convert()
     wall = pygame.Surface((12, height), pygame.SRCALPHA, 32).convert()
-    for i in range(0, height, 64):
-        wall.blit(wall_tile, (0, i))
+    tiling.tile(wall, wall_tile)
     return wall
 
 
-@lru_cache(None)
-def get_forest(width, height):
+@scoped("session")
+def get_forest_tiles() -> typing.List[pygame.Surface]:
+    """The trees placed by {cultivate.scatter.forest_border}."""
     tiles = [
         (0, 220, 130, 130),
         # this is the annoyingly long one in case you were wondering
@@ -774,52 +754,21 @@ def get_forest(width, height):
         (130, 95, 120, 126),
         (133, 226, 120, 126)
     ]
-    forest_tile = pyganim.getImagesFromSpriteSheet(
+    return [tile.convert_alpha() for tile in pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'foliage2.png'),
-        rects=tiles)
-    for tile in forest_tile:
-        tile.convert_alpha()
-    forest = pygame.Surface(
-        (width, height), pygame.SRCALPHA, 32).convert_alpha()
+        rects=tiles)]
+
 
-    # for top edge
-    for i in range(0, width, 100):
-        forest.blit(forest_tile[1], (i, -50))
-        forest.blit(random.choice(forest_tile),
-                    (i+random.randint(-30, 0), 0+random.randint(-20, 20)))
-        forest.blit(random.choice(forest_tile),
-                    (i+random.randint(-30, 0), 150+random.randint(-20, 20)))
-        forest.blit(random.choice([forest_tile[0], forest_tile[2], forest_tile[3]]), (
-            i+random.randint(-25, 25), 250+random.randint(-25, 25)))
-    # left edge
-    for i in range(0, height, 100):
-        forest.blit(forest_tile[1], (-50, i+random.randint(-30, 0)))
-        for i_x in range(50, 450, 90):
-            forest.blit(random.choice(forest_tile),
-                        (i_x+random.randint(-30, 30), i+random.randint(-30, 0)))
-    # right edge
-    for i in range(0, height, 100):
-        forest.blit(forest_tile[1], (width-100, i+random.randint(-30, 0)))
-        for i_x in range(50, 550, 90):
-            forest.blit(random.choice(forest_tile), ((width - i_x) +
-                                                     random.randint(-30, 30), i+random.randint(-30, 0)))
-    # bottom edge
-    for i in range(0, width, 100):
-        for i_y in range(50, 400, 90):
-            forest.blit(random.choice(
-                forest_tile), (i+random.randint(-30, 0), (width - i_y)+random.randint(-30, 30)))
-        forest.blit(forest_tile[1], (i, height-100))
-    return forest
-
-
-@lru_cache(None)
+@scoped("session")
 def get_lemon():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "food1.png"),
         rects=[(55, 180, 8, 8)])[0].convert_alpha()
 
 
-@lru_cache(None)
+# not cached on disk, as the vegetables are picked with the global random number generator,
+# which must be used the same way whether or not a cached surface exists for a replay to match its recording
+@scoped("session")
 def get_vegetables(width, height):
     tiles = [
         (10, 99, 41, 30),
@@ -841,7 +790,7 @@ def get_vegetables(width, height):
         vegetables.blit(random.choice(veg_tiles), (width-40, i))
     return vegetables
 
-@lru_cache(None)
+@scoped("session")
 def get_lemon_basket():
     tiles = [
         (10, 99, 41, 30),
@@ -859,9 +808,10 @@ def get_lemon_basket():
     vegetables = pygame.Surface(
         (42, 40), pygame.SRCALPHA, 32).convert_alpha()
     vegetables.blit(veg_tiles[2],(0,0))
-    return vegetables
+    return atlas.add("lemon_basket", vegetables)
 
-@lru_cache(None)
+@scoped("session")
+@cached_surface('floors1.png')
 def get_stone_cross_floor(width, height):
     tiles = [
         (200, 340, 32, 32)
@@ -875,17 +825,14 @@ def get_stone_cross_floor(width, height):
     stone_floor = pygame.Surface((width, height), pygame.SRCALPHA, 32).convert_alpha()
 
     # long column
-    for y in range(64, height, 32):
-        for x in range(64, (width - 64), 32):
-            stone_floor.blit(images[0], (x, y))
+    tiling.tile(stone_floor, images[0], (64, 64, len(range(64, width - 64, 32)) * 32, height - 64))
 
     # wide column
-    for y in range(128, height_prop + 32, 32):
-        for x in range(0, width, 32):
-            stone_floor.blit(images[0], (x, y))
+    tiling.tile(stone_floor, images[0], (0, 128, width, len(range(128, height_prop + 32, 32)) * 32))
     return stone_floor
 
-@lru_cache(None)
+@scoped("session")
+@cached_surface('walls2.png')
 def get_stone_cross_wall(width, height):
     tiles = [
         (191, 84, 8, 16),
@@ -956,45 +903,46 @@ def get_stone_cross_wall(width, height):
     return stone_wall
 
 
-@lru_cache(None)
+@scoped("session")
 def get_altar():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "library1.png"),
         rects=[(352, 294, 36, 48)])[0].convert_alpha()
 
 
-@lru_cache(None)
+@scoped("session")
 def get_pews():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "foliage1.png"),
         rects=[(128, 460, 64, 16)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_image_from_spirtes_dir(filename):
     return get_image(os.path.join(settings.SPRITES_DIR, filename), True)
 
 
-@lru_cache(None)
+@scoped("session")
 def get_roof_small() -> pygame.Surface:
     return get_image_from_spirtes_dir("building_top1.png")
 
-@lru_cache(None)
+@scoped("session")
 def get_church_roof() -> pygame.Surface:
     return get_image_from_spirtes_dir("Church_rooftop.png")
 
-@lru_cache(None)
+@scoped("session")
 def get_conversation_box():
     return get_image_from_spirtes_dir("conversation_box.png")
 
-@lru_cache(None)
+@scoped("session")
 def get_inventory_box():
     return get_image_from_spirtes_dir("inventory_box.png")
 
-@lru_cache(None)
+@scoped("session")
 def get_info_box():
     return get_image_from_spirtes_dir("task_box.png")
 
-@lru_cache(None)
+@scoped("session")
+@cached_surface('foliage4.png')
 def get_dirt(width: int, height: int) -> pygame.Surface:
     tiles = [
         (140, 45, 44, 44),
@@ -1014,11 +962,13 @@ def get_dirt(width: int, height: int) -> pygame.Surface:
         tile.convert_alpha()
     dirt = pygame.Surface((width, height), pygame.SRCALPHA, 32).convert_alpha()
 
+    # the middle tiles overlap, and each is covered by the next, so only their top left 33x33 shows
+    tiling.tile(dirt, dirt_tile[0].subsurface((0, 0, 33, 33)))
+    for i in range(0, width, 33):
+        dirt.blit(dirt_tile[5], (0, i))
+    for j in range(0, height, 33):
+        dirt.blit(dirt_tile[7], (width-33, j))
     for i in range(0, width, 33):
-        for j in range(0, height, 33):
-            dirt.blit(dirt_tile[5], (0, i))
-            dirt.blit(dirt_tile[0], (i, j))
-            dirt.blit(dirt_tile[7], (width-33, j))
         dirt.blit(dirt_tile[6], (i, 0))
         dirt.blit(dirt_tile[8], (i, height-30))
     dirt.blit(dirt_tile[1], (0,0))
@@ -1027,43 +977,41 @@ def get_dirt(width: int, height: int) -> pygame.Surface:
     dirt.blit(dirt_tile[4], (width-33, height-33))
     return dirt
 
-@lru_cache(None)
+@scoped("session")
 def get_bed() -> pygame.Surface:
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "apothecary1.png"),
         rects=[(192, 430, 32, 64)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_sideways_bed() -> pygame.Surface:
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "apothecary1.png"),
         rects=[(256, 186, 58, 38)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_grave() -> pygame.Surface:
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "foliage5.png"),
         rects=[(65, 131, 63, 60)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_dug_grave() -> pygame.Surface:
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "foliage6.png"),
         rects=[(65, 131, 63, 60)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_planted_grave() -> pygame.Surface:
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, "grave.png"),
         rects=[(96, 144, 47, 46)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_shovel() -> pygame.Surface:
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, "shovel.png"),
-        rects=[(2, 2, 13, 50)])[0].convert_alpha()
+    return get_atlas_sprites("shovel.png", [(2, 2, 13, 50)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_fire():
     tiles = [
         (0, 20, 64, 64),
@@ -1079,19 +1027,19 @@ def get_fire():
     animFire.play()
     return animFire
 
-@lru_cache(None)
+@scoped("session")
 def get_tool_sign():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'building_signs.png'),
         rects=[(240, 62, 48, 34)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_clothes_sign():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'building_signs.png'),
         rects=[(96, 110, 48, 31)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_stores_sign():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'building_signs.png'),
@@ -1099,152 +1047,145 @@ def get_stores_sign():
 
 
 
-@lru_cache(None)
+@scoped("session")
 def get_cage():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'attic1.png'),
         rects=[(482, 253, 31, 39)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_carpet():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'attic1.png'),
         rects=[(100, 353, 90, 63)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_cans():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'attic1.png'),
         rects=[(194, 222, 31, 39)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_boxes():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'attic1.png'),
         rects=[(382, 35, 62, 64)])[0].convert_alpha()
 
 
-@lru_cache(None)
+@scoped("session")
 def get_bear():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'attic1.png'),
         rects=[(291, 97, 27, 35)])[0].convert_alpha()
 
 
-@lru_cache(None)
+@scoped("session")
 def get_library_sign():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'building_signs.png'),
         rects=[(144, 159, 48, 34)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_painting():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'library1.png'),
         rects=[(34, 4, 63, 29)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_shelf_m():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'library1.png'),
         rects=[(31, 42, 64,72)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_shelf_l():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'library1.png'),
         rects=[(128, 46, 129,68)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_laundry_dirty():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'attic1.png'),
-        rects=[(10, 200, 53, 35)])[0].convert_alpha()
+    return get_atlas_sprites('attic1.png', [(10, 200, 53, 35)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_laundry_clean_white():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'attic1.png'),
-        rects=[(65, 201, 25, 24)])[0].convert_alpha()
+    return get_atlas_sprites('attic1.png', [(65, 201, 25, 24)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_laundry_clean_pink():
     # pyganim.getImagesFromSpriteSheet(
     #     os.path.join(settings.SPRITES_DIR, 'attic1.png'),
     #     rects=[(6, 271, 24, 24)])[0].convert_alpha()
-    image = get_laundry_clean_white()
+    image = get_laundry_clean_white().copy()
     image.fill((16, 91, 38) + (0,), None, pygame.BLEND_RGB_SUB)
-    return image
+    return atlas.add("laundry_clean_pink", image)
 
 
-@lru_cache(None)
+@scoped("session")
 def get_laundry_clean_other():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'attic1.png'),
         rects=[(65, 261, 32, 232)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_sugar():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
         rects=[(357, 391, 23, 16)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_soap():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
-        rects=[(235, 298, 19, 23)])[0].convert_alpha()
+    return get_atlas_sprites('apothecary1.png', [(235, 298, 19, 23)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_gravestone1():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'grave.png'),
         rects=[(58, 341, 36, 48)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_gravestone2():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'grave.png'),
         rects=[(57, 387, 38, 48)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_gravestone3():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'grave.png'),
         rects=[(105, 338, 35, 48)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_gravestone4():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'grave.png'),
         rects=[(105, 338, 35, 48)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_gravestone5():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'grave.png'),
         rects=[(55, 49, 37, 51)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_candles_black():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'attic1.png'),
-        rects=[(70, 488, 21, 23)])[0].convert_alpha()
+    return get_atlas_sprites('attic1.png', [(70, 488, 21, 23)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_candles_white():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'attic1.png'),
         rects=[(2, 487, 23, 26)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_candles_pink():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'attic1.png'),
         rects=[(0, 456, 23, 26)])[0].convert_alpha()
 
-@lru_cache(None)
-def get_garden(width, height):
+@scoped("session")
+def get_garden_tiles() -> typing.List[pygame.Surface]:
+    """The plants placed by {cultivate.scatter.garden_border}."""
     tiles = [
         (3, 227, 31, 28),
         (32, 255, 31, 28),
@@ -1253,107 +1194,76 @@ def get_garden(width, height):
         (8, 269, 53, 52),
         (132, 288, 59, 35),
     ]
-    garden_tile = pyganim.getImagesFromSpriteSheet(
+    return [tile.convert_alpha() for tile in pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'foliage1.png'),
-        rects=tiles)
-    for tile in garden_tile:
-        tile.convert_alpha()
-    garden = pygame.Surface(
-        (width, height), pygame.SRCALPHA, 32).convert_alpha()
+        rects=tiles)]
 
-    # for top edge
-    for i in range(0, width, 60):
-        garden.blit(random.choice(garden_tile),
-                (i+random.randint(0, 5), 0+random.randint(0, 10)))
-        garden.blit(random.choice(garden_tile),
-                (i+random.randint(0, 5), 0+random.randint(0, 10)))
-    for j in range(0, height, 60):
-        garden.blit(random.choice(garden_tile),
-                (0+random.randint(0, 10), j+random.randint(0, 5)))
-        garden.blit(random.choice(garden_tile),
-                (width-60+random.randint(0, 10), j+random.randint(0, 5)))
-    return garden
-
-@lru_cache(None)
+@scoped("session")
 def get_plant1():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'nature.png'),
-        rects=[(241, 531, 47, 43)])[0].convert_alpha()
+    return get_atlas_sprites('nature.png', [(241, 531, 47, 43)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_plant2():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'nature.png'),
-        rects=[(584, 143, 40, 45)])[0].convert_alpha()
+    return get_atlas_sprites('nature.png', [(584, 143, 40, 45)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_plant3():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'nature.png'),
-        rects=[(342, 193, 35, 50)])[0].convert_alpha()
+    return get_atlas_sprites('nature.png', [(342, 193, 35, 50)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_plant4():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'nature.png'),
-        rects=[(485, 478, 40, 54)])[0].convert_alpha()
+    return get_atlas_sprites('nature.png', [(485, 478, 40, 54)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_plant5():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'nature.png'),
-        rects=[(344, 592, 28, 34)])[0].convert_alpha()
+    return get_atlas_sprites('nature.png', [(344, 592, 28, 34)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_plant6():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'nature.png'),
-        rects=[(344, 592, 28, 34)])[0].convert_alpha()
+    return get_atlas_sprites('nature.png', [(344, 592, 28, 34)])[0]
 
 
-@lru_cache(None)
+@scoped("session")
 def get_plant7():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'nature.png'),
-        rects=[(59, 251, 33, 46)])[0].convert_alpha()
+    return get_atlas_sprites('nature.png', [(59, 251, 33, 46)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_herbs():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
         rects=[(256, 18, 58, 33)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_cabinet():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
         rects=[(133, 10, 56, 71)])[0].convert_alpha()
 
 
-@lru_cache(None)
+@scoped("session")
 def get_kitchen_sign():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'building_signs.png'),
         rects=[(0, 158, 48, 36)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_bed_sign():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'building_signs2.png'),
         rects=[(144, 158, 48, 31)])[0].convert_alpha()
 
 
-@lru_cache(None)
+@scoped("session")
 def get_sheet():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
         rects=[(278, 227, 40, 30)])[0].convert_alpha()
 
-@lru_cache(None)
+@scoped("session")
 def get_clothes_line():
     return get_image_from_spirtes_dir('clothes_line.png')
 
-@lru_cache(None)
+@scoped("final cutscene")
 def get_demon():
     tiles = [
         (290, 129, 30, 34),
@@ -1369,7 +1279,7 @@ def get_demon():
     animdemon.play()
     return animdemon
 
-@lru_cache(None)
+@scoped("final cutscene")
 def get_demon_fire():
     tiles = [
         (0, 0, 100, 100),
@@ -1403,25 +1313,51 @@ def get_demon_fire():
     animdemon.play()
     return animdemon
 
-@lru_cache(None)
+class ScaledAnimation:
+    """{animation} with its frames scaled to {size}.
+
+    Each frame is scaled the first time it is shown, and kept,
+    so a big animation doesn't have to be scaled all at once or on every frame.
+    """
+
+    def __init__(self, animation: pyganim.PygAnimation, size: typing.Tuple[int, int], smooth: bool = False):
+        self.animation = animation
+        self.size = size
+        self.scale = pygame.transform.smoothscale if smooth else pygame.transform.scale
+        self.frames = [None] * animation.numFrames
+
+    def getFrame(self, frame_number: int) -> pygame.Surface:
+        if self.frames[frame_number] is None:
+            self.frames[frame_number] = self.scale(self.animation.getFrame(frame_number), self.size)
+        return self.frames[frame_number]
+
+    def getCurrentFrame(self) -> pygame.Surface:
+        return self.getFrame(self.animation.currentFrameNum)
+
+
+# the scaled frames are big, so only keep the most recently used animations
+@scoped("final cutscene", max_bytes=128 * 2 ** 20)
+def get_scaled_animation(get_animation: typing.Callable[[], pyganim.PygAnimation],
+                         size: typing.Tuple[int, int], smooth: bool = False) -> ScaledAnimation:
+    """Return the animation from {get_animation} scaled to {size}, sharing the scaled frames between callers.
+
+    :param smooth: scale with {pygame.transform.smoothscale} instead of keeping the pixels sharp
+    """
+    return ScaledAnimation(get_animation(), size, smooth)
+
+@scoped("session")
 def get_melted_wax():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
-        rects=[(419, 68, 27, 26)])[0].convert_alpha()
+    return get_atlas_sprites('apothecary1.png', [(419, 68, 27, 26)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_brown_jar():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
-        rects=[(393, 327, 15, 17)])[0].convert_alpha()
+    return get_atlas_sprites('apothecary1.png', [(393, 327, 15, 17)])[0]
 
-@lru_cache(None)
+@scoped("session")
 def get_pestle_and_mortar():
-    return pyganim.getImagesFromSpriteSheet(
-        os.path.join(settings.SPRITES_DIR, 'apothecary1.png'),
-        rects=[(422, 224, 21, 20)])[0].convert_alpha()
+    return get_atlas_sprites('apothecary1.png', [(422, 224, 21, 20)])[0]
 
-@lru_cache(None)
+@scoped("day")
 def get_pentagram():
     return pyganim.getImagesFromSpriteSheet(
         os.path.join(settings.SPRITES_DIR, 'pentagram.png'),
@@ -7,7 +7,7 @@ import copy
 
 import pygame
 
-from cultivate import loader, settings
+from cultivate import glyphs, inputs, loader, settings, text_layout
 
 class Madlibs:
     text_color = pygame.Color("black")
@@ -83,36 +83,29 @@ class Madlibs:
                   colors: typing.List[typing.List[pygame.Color]]) -> None:
         cursor_y = draw_rect.top
 
-        # get the height of the font
-        font_height = self.font.size("Tg")[1]
+        metrics = text_layout.metrics(self.font)
+        font_height = metrics.line_height
 
         for words, word_colors in zip(lines, colors):
-            while len(words) > 0:
-                # number of words on this line
-                i = 1
-
+            for start, end in metrics.wrap(words, draw_rect.width):
                 # determine if the row of text will be outside our area
                 if cursor_y + font_height > draw_rect.bottom:
                     # give up rendering text and stop where we are
                     logging.error("Could not fit all of the text onto screen")
                     break
 
-                # try and fit more words on this line
-                while self.font.size(" ".join(words[:i + 1]))[0] < draw_rect.width and i < len(words):
-                    i += 1
-
                 # render the words
                 rendered_words = []
-                rendered_space = self.font.render(" ", True, self.text_color)
-                for word, word_color in zip(words[:i], word_colors[:i]):
+                rendered_space = glyphs.render(self.font, " ", self.text_color)
+                for word, word_color in zip(words[start:end], word_colors[start:end]):
                     if word == "":
                         continue
                     if word[-1] not in string.ascii_lowercase:
                         # always render punctuation at the end of a word in {self.text_color}
-                        rendered_words.append(self.font.render(word[:-1], True, word_color))
-                        rendered_words.append(self.font.render(word[-1], True, self.text_color))
+                        rendered_words.append(glyphs.render(self.font, word[:-1], word_color))
+                        rendered_words.append(glyphs.render(self.font, word[-1], self.text_color))
                     else:
-                        rendered_words.append(self.font.render(word, True, word_color))
+                        rendered_words.append(glyphs.render(self.font, word, word_color))
                     rendered_words.append(rendered_space)
 
                 # blit the rendered words to the surface
@@ -123,10 +116,6 @@ class Madlibs:
 
                 cursor_y += font_height + 2
 
-                # remove the text we just blitted
-                words = words[i:]
-                word_colors = word_colors[i:]
-
     @property
     def edited(self):
         for key, word in self.changed_words.items():
@@ -156,7 +145,7 @@ class Madlibs:
 
         letter = pygame.key.name(key)
         if letter in string.ascii_lowercase:
-            pressed = pygame.key.get_pressed()
+            pressed = inputs.get_pressed()
             if pressed[pygame.K_LSHIFT] or pressed[pygame.K_RSHIFT]:
                 letter = letter.upper()
             self.changed_words[selected_word] += letter
@@ -1,7 +1,11 @@
 #!/usr/bin/env python3
+import collections
 import contextlib
 import logging
+import os
+import random
 import sys
+import time
 import typing
 
 from itertools import chain
@@ -9,9 +13,12 @@ from itertools import chain
 import pygame
 from pygame.sprite import Group
 
-from cultivate import settings
+from cultivate import asset_cache, glyphs, inputs, profiler, settings, spritesheets, timing, transition
+from cultivate.compositor import ACTORS, GROUND, HUD, OVERLAY, PLAYER, PROPS, ROOFS, Compositor, Layer
 from cultivate.loader import get_dirt, get_font, get_grass, get_music
 from cultivate.map import Map
+from cultivate.renderer import DirtyRectRenderer
+from cultivate.interactions import Interactions
 from cultivate.game_state import GameState
 from cultivate.sprites.pickups import BasePickUp
 from cultivate.player import Player
@@ -32,61 +39,225 @@ def main(argv=sys.argv[1:]):
         logging_config["level"] = logging.DEBUG
     logging.basicConfig(**logging_config)
 
+    if "--no-cache" in argv:
+        settings.DISK_CACHE = False
+
+    if "--transition" in argv:
+        settings.TRANSITION = argv[argv.index('--transition') + 1]
+        if settings.TRANSITION not in transition.STYLES:
+            sys.exit(f"unknown transition {settings.TRANSITION!r}, choose from: {', '.join(transition.STYLES)}")
+
+    # scatter the trees, weeds and plants over the map the same way on every run
+    if "--seed" in argv:
+        settings.WORLD_SEED = int(argv[argv.index('--seed') + 1])
+
+    # fill the map with this many extra villagers
+    if "--crowd" in argv:
+        settings.CROWD_SIZE = int(argv[argv.index('--crowd') + 1])
+
     if "--day" in argv:
         day_idx = argv.index('--day') + 1
         current_day = int(argv[day_idx])
     else:
         current_day = 0
 
+    # run without a window or sound, as fast as possible
+    headless = "--headless" in argv
+    if headless:
+        # these must be set before pygame is initialised
+        os.environ["SDL_VIDEODRIVER"] = "dummy"
+        os.environ["SDL_AUDIODRIVER"] = "dummy"
+
+    # time each stage of the game loop, showing the times on screen and optionally saving them when the game exits
+    profile_trace = None
+    if "--profile-trace" in argv:
+        profile_trace = argv[argv.index('--profile-trace') + 1]
+    if "--profile" in argv or profile_trace is not None:
+        profiler.active = profiler.Profiler(trace=profile_trace is not None)
+
+    # stop after a number of frames
+    if "--frames" in argv:
+        frames = int(argv[argv.index('--frames') + 1])
+    else:
+        frames = None
+
     # init
     screen, clock = init_game()
+
+    # play input from a script instead of the keyboard, stopping at the end of it unless {frames} is given
+    script = None
+    seed = None
+    recording = None
+    if "--script" in argv:
+        script = inputs.source = inputs.ScriptedInput.from_file(argv[argv.index('--script') + 1])
+        seed = script.seed
+    # record input to a script that replays this game
+    if "--record" in argv:
+        if seed is None:
+            seed = random.randrange(2 ** 32)
+        recording = open(argv[argv.index('--record') + 1], "w", buffering=1)
+        inputs.source = inputs.RecordingInput(inputs.source, recording, seed)
+    # make the game the same on every run, with the same random numbers and timing
+    if seed is not None:
+        random.seed(seed)
+    if headless or script is not None or "--record" in argv:
+        timing.clock = timing.FrameClock(settings.FPS, start=0)
+
+    start_time = time.perf_counter()
     game_state, player, game_map, tooltip_bar, inventory, info_box, static_interactables = init_state(current_day)
-    npc_sprites, pickups = game_state.get_day_items()
+    npc_sprites, pickups = load_day(game_state)
+    logging.debug(f"Loaded game state in {time.perf_counter() - start_time:.2f}s, with map seed {game_map.seed}")
+
+    # only redraw the parts of the screen that change
+    renderer = DirtyRectRenderer(screen) if "--dirty-rects" in argv else None
+    if renderer is not None:
+        # the renderer works out what changed from the HUD as it is now, so it must be drawn as it is now
+        compositor["hud"].interval = 1
 
     # show intro screen
     update(game_state, player, game_map, tooltip_bar, npc_sprites, pickups, static_interactables)
-    if not settings.DEBUG:
+    if not settings.DEBUG and not headless:
         draw_callable = lambda: draw(screen, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups)
         intro(screen, clock, draw_callable)
 
     # main loop
+    # the game moves on in fixed steps, however fast frames are drawn,
+    # except when it must do the same thing on every run, when it moves on one step per frame
+    deterministic = isinstance(timing.clock, timing.FrameClock)
+    stepper = timing.FixedTimestep(1 / settings.FPS)
+    frame = 0
+    # phase of the game -> time taken by each frame, in seconds, only kept when running headless to be reported
+    frame_times = collections.defaultdict(list)
+    start_time = last_frame = time.perf_counter()
     try:
-        while True:
+        while frames is None or frame < frames:
+            if frames is None and script is not None and script.finished:
+                break
+            frame_start = time.perf_counter()
+
             # handle events
-            for event in pygame.event.get():
-                handle_event(event, player, game_map, game_state, inventory, static_interactables, pickups)
+            with profiler.section("events"):
+                for event in inputs.source.get_events():
+                    handle_event(event, player, game_map, game_state, inventory, static_interactables, pickups)
 
-            # transition day
-            if game_state.day != current_day and game_state.fader.black:
-                npc_sprites, pickups = game_state.get_day_items()
-                current_day = game_state.day
+            if deterministic:
+                steps, alpha = 1, 1.0
+            else:
+                steps = stepper.advance(frame_start - last_frame)
+                alpha = stepper.alpha
+            last_frame = frame_start
+
+            for _ in range(steps):
+                # transition day
+                if game_state.day != current_day and game_state.fader.black:
+                    npc_sprites, pickups = load_day(game_state)
+                    current_day = game_state.day
+
+                # update
+                update(game_state, player, game_map, tooltip_bar, npc_sprites, pickups, static_interactables)
+                timing.clock.tick()
+
+            # draw and display new draws, in between the last two steps
+            if renderer is None:
+                draw_frame(screen, clock, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups,
+                           alpha)
+                with profiler.section("flip"):
+                    pygame.display.flip()
+            else:
+                with profiler.section("dirty rects"):
+                    mark_dirty_regions(renderer, clock, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups)
+                # the renderer only knows how to scroll between whole steps, so the latest step is drawn,
+                # without moving the view or the NPCs in between steps
+                renderer.render(game_map.get_viewport(), lambda: draw_frame(
+                    screen, clock, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups))
+
+            # load some of the next day's assets with the time left over
+            if asset_cache.prefetcher:
+                with profiler.section("prefetch"):
+                    asset_cache.prefetcher.step()
+                    if not asset_cache.prefetcher:
+                        release_spritesheets()
+
+            if headless:
+                frame_times[game_phase(game_state)].append(time.perf_counter() - frame_start)
+            profiler.active.end_frame()
+            frame += 1
+
+            # wait for next frame, unless running as fast as possible
+            if headless:
+                clock.tick()
+            else:
+                clock.tick(settings.FPS)
 
-            # update
-            update(game_state, player, game_map, tooltip_bar, npc_sprites, pickups, static_interactables)
+    except DemonSummoned:
+        logging.info("The demon was summoned")
+        if not headless:
+            game_lost(screen, clock)
+    except SummoningSabotaged:
+        logging.info("The summoning was sabotaged")
+        if not headless:
+            game_win(screen, clock)
+    finally:
+        if isinstance(profiler.active, profiler.Profiler):
+            for line in profiler.active.summary():
+                logging.info(line)
+            if profile_trace is not None:
+                profiler.active.dump(profile_trace)
+                logging.info(f"Saved profile trace to {profile_trace}")
+        if recording is not None:
+            recording.close()
+
+    if headless:
+        elapsed = time.perf_counter() - start_time
+        print(f"{frame} ticks in {elapsed:.2f}s: {frame / elapsed:.1f} ticks/s, "
+              f"{elapsed * 1000 / max(frame, 1):.2f}ms per tick")
+        report_frame_times(frame_times)
+        print(describe_asset_memory())
+
+
+def game_phase(game_state) -> str:
+    if game_state.final_cutscene:
+        return "final cutscene"
+    return f"day {game_state.day}"
+
+
+def report_frame_times(frame_times: typing.Dict[str, typing.List[float]]) -> None:
+    """Print how long frames took in each phase of the game."""
+    for phase, times in frame_times.items():
+        times = sorted(times)
+        print(f"{phase:<16} {len(times):>6} frames, mean {sum(times) * 1000 / len(times):.2f}ms, "
+              f"p95 {times[int(len(times) * 0.95)] * 1000:.2f}ms, max {times[-1] * 1000:.2f}ms")
+
+def load_day(game_state) -> typing.Tuple[Group, Group]:
+    """Make the NPCs and pickups for the day {game_state} is on.
+
+    Assets that were only used on finished days are released,
+    and the next day's assets are queued to be loaded in the background.
+    """
+    asset_cache.start_day(game_state.day)
+    npc_sprites, pickups = game_state.get_day_items()
+    asset_cache.release_finished_days()
+    release_spritesheets()
+    asset_cache.prefetcher.add(game_state.get_next_day_assets())
+    logging.debug(describe_asset_memory())
+    return npc_sprites, pickups
 
-            # draw
-            draw(screen, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups)
 
-            # display FPS
-            if settings.DEBUG:
-                fps_str = f"FPS: {clock.get_fps():.2f}"
-                fps_surface = settings.SM_FONT.render(fps_str, True, pygame.Color("black"))
-                screen.blit(fps_surface, (settings.WIDTH // 2 - fps_surface.get_rect().w, fps_surface.get_rect().h))
+def describe_asset_memory() -> str:
+    usage = ", ".join(f"{scope} {size / 2 ** 20:.1f}MB" for scope, size in asset_cache.memory_usage().items())
+    return f"Cached assets: {usage}, text {glyphs.cache.size / 2 ** 20:.1f}MB"
 
-            # fade screen on day transition
-            if game_state.fader.fading:
-                game_state.fader.draw(screen)
 
-            # display new draws
-            pygame.display.flip()
+def release_spritesheets() -> None:
+    """Free the spritesheets decoded while loading, now that the sprites have been cut out of them.
 
-            # wait for next frame
-            clock.tick(settings.FPS)
+    This is done when a day loads and when the next day's assets have been prefetched.
+    Sheets decoded for anything loaded in between, like crafted items, stay decoded until then.
+    """
+    logging.debug("Spritesheets: {requests} requests, {decodes} decodes, "
+                  "{resident} resident using {resident_bytes} bytes".format(**spritesheets.registry.stats()))
+    spritesheets.registry.clear()
 
-    except DemonSummoned:
-        game_lost(screen, clock)
-    except SummoningSabotaged:
-        game_win(screen, clock)
 
 def game_wait(clock, to_wait):
     wait_frames = settings.FPS * to_wait
@@ -132,6 +303,7 @@ def init_state(start_day: int) -> typing.Tuple[GameState, Player, Map, Tooltip,
     static_interactables.add(game_map.fire)
     static_interactables.add(game_map.graves)
     static_interactables.add(game_map.clothes_line)
+    player.interactions = Interactions(player, static_interactables)
 
     return game_state, player, game_map, tooltip_bar, inventory, info_box, static_interactables
 
@@ -179,6 +351,8 @@ def handle_event(event, player, game_map, game_state, inventory, static_interact
         sys.exit(0)
 
     if event.type == pygame.KEYDOWN:
+        # any key press could change what the player can do with things nearby
+        player.interactions.invalidate()
         handled = game_state.key_press(event.key)
         if handled:
             return
@@ -195,16 +369,15 @@ def handle_event(event, player, game_map, game_state, inventory, static_interact
         elif event.key == K_INTERACT:
             picked_up = False
             if not player.pickup:
-                boundary = player.tooltip_boundary(game_map.get_viewport())
-                for item in pickups:
-                    if boundary.colliderect(item.rect):
-                        logging.debug("Interacting with: " + str(item))
-                        # Found the item we're picking up
-                        pickups.remove(item)
-                        player.pickup = item
-                        picked_up = True
-                        inventory.set_icon(item)
-                        break
+                nearby = player.interactions.nearby(game_map.get_viewport(), pickups)
+                if nearby and nearby[0] in pickups:
+                    item = nearby[0]
+                    logging.debug("Interacting with: " + str(item))
+                    # Found the item we're picking up
+                    pickups.remove(item)
+                    player.pickup = item
+                    picked_up = True
+                    inventory.set_icon(item)
 
             if not picked_up and not player.interacting_with and \
                not isinstance(player.nearby_interactable, BasePickUp):
@@ -216,85 +389,209 @@ def handle_event(event, player, game_map, game_state, inventory, static_interact
         # combine
         elif event.key == pygame.K_c and player.pickup:
             logging.debug("Trying to combine on: " + str(player.pickup))
-            boundary = player.tooltip_boundary(game_map.get_viewport())
-            for item in chain(pickups, static_interactables):
-                if boundary.colliderect(item.rect):
-                    if player.pickup.can_combine(item):
-                        # We can create a new item
-                        new_item, reusable = player.pickup.combine(item)
-                        new_item.x = item.x
-                        new_item.y = item.y
-                        logging.debug("Created: " + str(new_item))
-                        if item in static_interactables:
-                            # If it's static, use the players x/y
-                            new_item.x = player.x + game_map.map_view_x
-                            new_item.y = player.y + game_map.map_view_y
-                        else:
-                            # If it isn't static, item should be deleted
-                            pickups.remove(item)
-
-                        pickups.add(new_item)
-                        player.pickup = reusable
-                        inventory.set_icon(reusable)
-                        # Break just incase we are in the vicinity of multiple objects
-                        break
+            for item in player.interactions.nearby(game_map.get_viewport(), pickups):
+                if player.pickup.can_combine(item):
+                    # We can create a new item
+                    new_item, reusable = player.pickup.combine(item)
+                    new_item.x = item.x
+                    new_item.y = item.y
+                    logging.debug("Created: " + str(new_item))
+                    if item in static_interactables:
+                        # If it's static, use the players x/y
+                        new_item.x = player.x + game_map.map_view_x
+                        new_item.y = player.y + game_map.map_view_y
+                    else:
+                        # If it isn't static, item should be deleted
+                        pickups.remove(item)
+
+                    pickups.add(new_item)
+                    player.pickup = reusable
+                    inventory.set_icon(reusable)
+                    # Break just incase we are in the vicinity of multiple objects
+                    break
 
         elif event.type == pygame.KEYDOWN:
             player.key_press(event.key)
 
 
 def update(game_state, player, game_map, tooltip_bar, npc_sprites, pickups, static_interactables) -> typing.Tuple[Group, Group]:
-    game_map.update_map_view(pygame.key.get_pressed())
+    with profiler.section("map view"):
+        game_map.update_map_view(inputs.get_pressed())
 
-    game_state.update(game_map.get_viewport())
-    npc_sprites.update(game_map.get_viewport())
-    pickups.update(game_map.get_viewport())
-    static_interactables.update(game_map.get_viewport())
-    player.update()
-    player.set_nearby(None)
+    with profiler.section("game state"):
+        game_state.update(game_map.get_viewport())
+    with profiler.section("npcs"):
+        npc_sprites.update(game_map.get_viewport())
+    with profiler.section("pickups"):
+        pickups.update(game_map.get_viewport())
+        player.update()
 
     if settings.DEBUG:
         pygame.display.set_caption(
             "mouse X: {}, mouse Y: {}".format(pygame.mouse.get_pos()[0]+game_map.map_view_x,
                                               pygame.mouse.get_pos()[1]+game_map.map_view_y))
     # update tooltip
-    tooltip_bar.clear_tooltip()
-    for item in chain(pickups, npc_sprites, static_interactables):
-        tooltip_rect = player.tooltip_boundary(game_map.get_viewport())
-        if tooltip_rect.colliderect(item.rect):
-            if player.pickup and player.pickup.can_combine(item):
-                tooltip_bar.set_tooltip("press c to combine")
-            else:
-                if isinstance(item, BasePickUp) and player.pickup:
-                    pass
-                elif item.help_text:
-                    tooltip_bar.set_tooltip(f"press x to {item.help_text}")
-
-            player.set_nearby(item)
-            break
-    if player.pickup and tooltip_bar.empty:
-        tooltip_bar.set_tooltip("press z to drop")
+    with profiler.section("tooltip"):
+        nearest = player.interactions.update(game_map.get_viewport(), pickups, npc_sprites)
+        player.set_nearby(nearest.item)
+        if player.interactions.changed:
+            tooltip_bar.clear_tooltip()
+            if nearest.tooltip:
+                tooltip_bar.set_tooltip(nearest.tooltip)
 
     # check various task completion conditions
-    game_state.update_task_status(pickups, static_interactables)
+    with profiler.section("task status"):
+        game_state.update_task_status(pickups, static_interactables)
+
+
+
+class Frame(typing.NamedTuple):
+    """Everything drawn in a frame, passed to each layer of {compositor}."""
+    player: Player
+    game_map: Map
+    game_state: GameState
+    tooltip_bar: Tooltip
+    inventory: InventoryBox
+    info_box: InfoBox
+    npc_sprites: Group
+    pickups: Group
+    # the area of the map drawn
+    viewport: pygame.Rect
+    # how far to shift things positioned on screen relative to the latest viewport
+    offset: typing.Tuple[int, int]
+    # to show the FPS, if there is one
+    clock: typing.Optional[pygame.time.Clock] = None
+    # how far between the last two updates to draw things that move, see {draw}
+    alpha: float = 1.0
+
+
+def draw_ground(surface: pygame.Surface, frame: Frame) -> None:
+    frame.game_map.draw_ground(surface, frame.viewport)
+
+
+def draw_props(surface: pygame.Surface, frame: Frame) -> None:
+    frame.game_map.draw_props(surface, frame.viewport)
 
 
-def draw(screen, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups) -> None:
-    game_map.draw(screen)
-    pickups.draw(screen)
-    for npc in npc_sprites:
-        npc.draw(screen)
-    # draw building roofs
-    for building in game_map.buildings.values():
-        building.draw(screen)
-    player.draw(screen, pygame.key.get_pressed())
-    if not player.conversation:
-        tooltip_bar.draw(screen)
+def draw_actors(surface: pygame.Surface, frame: Frame) -> None:
+    for pickup in frame.pickups:
+        surface.blit(pickup.image, pickup.rect.move(frame.offset))
+    for npc in frame.npc_sprites:
+        npc.draw(surface, frame.offset, frame.alpha)
 
-    inventory.draw(screen)
-    info_box.draw(screen)
 
-    game_state.draw(screen)
+def draw_roofs(surface: pygame.Surface, frame: Frame) -> None:
+    frame.game_map.roofs.draw(surface, frame.viewport)
+
+
+def draw_player(surface: pygame.Surface, frame: Frame) -> None:
+    frame.player.draw(surface, inputs.get_pressed())
+
+
+def draw_hud(surface: pygame.Surface, frame: Frame) -> None:
+    if not frame.player.conversation:
+        frame.tooltip_bar.draw(surface)
+    frame.inventory.draw(surface)
+    frame.info_box.draw(surface)
+
+
+def hud_shows(frame: Frame) -> typing.Hashable:
+    """What the HUD shows, which changes whenever {draw_hud} would draw something different."""
+    tooltip_bar = frame.tooltip_bar
+    tooltip = tooltip_bar.shows() if tooltip_bar.render and not frame.player.conversation else None
+    return tooltip, frame.inventory.shows(), frame.info_box.shows()
+
+
+def draw_overlay(surface: pygame.Surface, frame: Frame) -> None:
+    frame.game_state.draw(surface)
+
+    # display FPS
+    if settings.DEBUG and frame.clock is not None:
+        fps_surface = settings.SM_FONT.render(fps_text(frame.clock), True, pygame.Color("black"))
+        surface.blit(fps_surface, fps_rect(fps_surface.get_size()))
+
+    # fade screen on day transition
+    if frame.game_state.fader.fading:
+        frame.game_state.fader.draw(surface)
+
+    if isinstance(profiler.active, profiler.Profiler):
+        profiler.active.draw(surface)
+
+
+compositor = Compositor([
+    Layer("ground", GROUND, draw_ground),
+    Layer("props", PROPS, draw_props),
+    Layer("actors", ACTORS, draw_actors),
+    Layer("roofs", ROOFS, draw_roofs),
+    Layer("player", PLAYER, draw_player),
+    # the HUD rarely changes, so it is kept on its own surface and only checked for changes every few frames
+    Layer("hud", HUD, draw_hud, key=hud_shows, interval=settings.HUD_INTERVAL),
+    Layer("overlay", OVERLAY, draw_overlay),
+])
+
+
+def draw(screen, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups,
+         alpha: float = 1.0, clock: pygame.time.Clock = None) -> None:
+    """Draw the game {alpha} of the way between the last two updates.
+
+    The view of the map and the NPCs are drawn {alpha} of the way from where they were before the last update
+    to where they are now, and everything else positioned on screen relative to the latest view
+    is shifted to match the view.
+    When drawing only what changed, the game is always drawn as of the latest update, with {alpha} 1.
+    """
+    viewport = game_map.get_viewport()
+    drawn_viewport = viewport if alpha >= 1 else game_map.get_interpolated_viewport(alpha)
+    offset = (viewport.x - drawn_viewport.x, viewport.y - drawn_viewport.y)
+    compositor.draw(screen, Frame(player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups,
+                                  drawn_viewport, offset, clock, alpha))
+
+
+def draw_frame(screen, clock, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups,
+               alpha: float = 1.0) -> None:
+    draw(screen, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups, alpha, clock)
+
+
+def fps_text(clock) -> str:
+    return f"FPS: {clock.get_fps():.2f}"
+
+
+def fps_rect(size) -> pygame.Rect:
+    w, h = size
+    return pygame.Rect(settings.WIDTH // 2 - w, h, w, h)
+
+
+def mark_dirty_regions(renderer, clock, player, game_map, game_state, tooltip_bar, inventory, info_box, npc_sprites, pickups) -> None:
+    """Tell {renderer} what is on screen this frame, so that it can work out what changed."""
+    if game_state.fader.fading or game_state.final_cutscene or player.madlibs is not None:
+        renderer.invalidate()
+        return
+
+    for sprite in chain(pickups, npc_sprites):
+        # a crowd draws many images, so it counts the changes to them instead
+        renderer.mark(sprite, getattr(sprite, 'drawn_rect', sprite.rect), getattr(sprite, 'changes', id(sprite.image)))
+    # the fire and graves are positioned on the map
+    viewport = game_map.get_viewport()
+    renderer.mark(game_map.fire, game_map.fire.rect.move(-viewport.x, -viewport.y), id(game_map.fire.image))
+    for grave in game_map.graves:
+        renderer.mark(grave, grave.rect.move(-viewport.x, -viewport.y), id(grave.grave_image))
+
+    frame = player.get_images(inputs.get_pressed()).getCurrentFrame()
+    renderer.mark(player, frame.get_rect(topleft=(player.x, player.y)), id(frame))
+
+    if player.conversation:
+        renderer.mark(player.dialogue_box, player.dialogue_box.rect,
+                      (player.conversation.npc_name, id(player.conversation.current)))
+    elif tooltip_bar.render:
+        renderer.mark(tooltip_bar, tooltip_bar.rect, tooltip_bar.text)
+    renderer.mark(inventory, inventory.get_rect(), (inventory.name, id(inventory.icon)))
+    renderer.mark(info_box, info_box.get_rect(), (info_box.current_date, game_state.current_task))
+
+    if settings.DEBUG:
+        text = fps_text(clock)
+        renderer.mark(fps_text, fps_rect(settings.SM_FONT.size(text)), text)
+    if isinstance(profiler.active, profiler.Profiler):
+        renderer.mark(profiler.active, profiler.active.overlay_rect(), profiler.active.overlay_version)
+
 
 def game_lost(screen, clock):
     title = pygame.Surface((settings.WIDTH, settings.HEIGHT))
@@ -1,8 +1,13 @@
 import collections
 import random
+import typing
+
+from itertools import chain
 
 import pygame
 
+from cultivate.chunks import ChunkedSurface
+from cultivate.spatial import SpatialHash
 from cultivate.sprites import UpdatableSprite
 from cultivate.sprites.buildings.toolshed import ToolShed
 from cultivate.sprites.buildings.church import Church
@@ -19,11 +24,12 @@ from cultivate.madlibs import Madlibs
 from cultivate.sprites.fire import Fire, DemonFire
 from cultivate.sprites.demon import Demon
 from cultivate.player import Player
-from cultivate.loader import get_pentagram, get_garden, get_dirt, get_grass, get_weed, get_forest, get_sound, get_grave
+from cultivate.loader import get_pentagram, get_garden_tiles, get_dirt, get_grass, get_weed, get_forest_tiles, get_sound, get_grave
 from cultivate.loader import get_plant1, get_plant2, get_plant3, get_plant4, get_plant5, get_plant6, get_plant7
 from cultivate.loader import get_gravestone1, get_gravestone2, get_gravestone3, get_gravestone4, get_gravestone5
-from cultivate.settings import HEIGHT, MAP_HEIGHT, MAP_WIDTH, WIDTH
-from cultivate import settings
+from cultivate.settings import CHUNK_SIZE, HEIGHT, MAP_HEIGHT, MAP_WIDTH, WIDTH
+from cultivate import scatter, settings
+from cultivate.roofs import Roofs
 from cultivate.game_state import GameState
 
 from cultivate.conversation_tree import ConversationTree
@@ -38,9 +44,13 @@ class Map:
         self.player.map = self
 
         self.game_state = game_state
+        # everything scattered over the map comes from this, so the same seed always makes the same map
+        self.seed = settings.WORLD_SEED if settings.WORLD_SEED is not None else random.randrange(2 ** 32)
         self.image = self.compose_image()
         self.map_view_x = WIDTH
         self.map_view_y = HEIGHT
+        # where the viewport was before the last update, for drawing in between updates
+        self.previous_view = (self.map_view_x, self.map_view_y)
         self.width = self.image.get_rect().width
         self.height = self.image.get_rect().height
         self.move_amount = 10
@@ -67,6 +77,7 @@ class Map:
             "stores": Stores(1875, 450, self.image),
             "church": Church(self.image)
         }
+        self.roofs = Roofs(self.buildings.values())
 
         self.bed = Bed(1340, 1650, self.image)
         self.desk = Desk(2500, 550, self.image, self.make_madlibs())
@@ -93,6 +104,10 @@ class Map:
             self.impassables.add(building.impassables)
             self.passables.add(building.passables)
 
+        # index the collision groups, as nothing in them moves they stay in map coordinates
+        self.impassable_index = self.make_index(self.impassables)
+        self.passable_index = self.make_index(self.passables)
+
         self.day0 = [
             (None, 'welcome the newcomers'),
             ('kitchen', 'kitchen description'),
@@ -102,12 +117,13 @@ class Map:
             (None, 'end day 0')
         ]
 
-    def compose_image(self) -> pygame.Surface:
-        image = get_grass(MAP_WIDTH, MAP_HEIGHT)
-        self.generate_random_weeds(image)
-        self.generate_border_forest(image)
-        self.generate_garden(image)
-        self.generate_dirt(image)
+    def compose_image(self) -> ChunkedSurface:
+        image = ChunkedSurface(MAP_WIDTH, MAP_HEIGHT, get_grass(CHUNK_SIZE, CHUNK_SIZE))
+        rng = random.Random(self.seed)
+        self.generate_random_weeds(image, rng)
+        self.generate_border_forest(image, rng)
+        self.generate_garden(image, rng)
+        self.generate_dirt(image, rng)
         return image
 
     @staticmethod
@@ -154,15 +170,12 @@ class Map:
         )
 
     @staticmethod
-    def generate_random_weeds(surface: pygame.Surface, count=100):
+    def generate_random_weeds(surface: ChunkedSurface, rng: random.Random, count=100):
         """Randomly blit weeds onto {surface}."""
-        weed = get_weed()
-        locations = [(random.randrange(0, MAP_WIDTH), random.randrange(0, MAP_HEIGHT)) for _ in range(count)]
-        for x, y in locations:
-            surface.blit(weed, (x, y))
+        scatter.draw(surface, [get_weed()], scatter.weeds(MAP_WIDTH, MAP_HEIGHT, count, rng), surface.get_rect())
 
     @staticmethod
-    def generate_dirt(surface: pygame.Surface):
+    def generate_dirt(surface: ChunkedSurface, rng: random.Random):
         surface.blit(get_dirt(600, 600), (3000, 800))
         graves = [
             get_gravestone1(),
@@ -171,38 +184,39 @@ class Map:
             get_gravestone5()
             ]
         for i in range(30, 560, 70):
-            surface.blit(random.choice(graves), (3000+i, 820))
-            surface.blit(random.choice(graves), (3020+i, 860))
+            surface.blit(rng.choice(graves), (3000+i, 820))
+            surface.blit(rng.choice(graves), (3020+i, 860))
 
 
     @staticmethod
-    def generate_border_forest(surface: pygame.Surface):
-        surface.blit(get_forest(MAP_WIDTH, MAP_HEIGHT), (0, 0))
+    def generate_border_forest(surface: ChunkedSurface, rng: random.Random):
+        scatter.draw(surface, get_forest_tiles(), scatter.forest_border(MAP_WIDTH, MAP_HEIGHT, rng), surface.get_rect())
 
     @staticmethod
-    def generate_garden(surface: pygame.Surface):
-        surface.blit(get_garden(500, 500), (1100, 400))
-        surface.blit(get_garden(500, 500), (550, 400))
+    def generate_garden(surface: ChunkedSurface, rng: random.Random):
+        scatter.draw(surface, get_garden_tiles(), scatter.garden_border(500, 500, rng), pygame.Rect(1100, 400, 500, 500))
+        scatter.draw(surface, get_garden_tiles(), scatter.garden_border(500, 500, rng), pygame.Rect(550, 400, 500, 500))
 
         for i in range(50, 500, 60):
-            surface.blit(get_plant1(), (1150+random.randint(0, 20), 400+i))
-            surface.blit(get_plant2(), (1200+random.randint(0, 20), 400+i))
-            surface.blit(get_plant3(), (1250+random.randint(0, 20), 400+i))
-            surface.blit(get_plant4(), (1300+random.randint(0, 20), 400+i))
-            surface.blit(get_plant5(), (1350+random.randint(0, 20), 400+i))
-            surface.blit(get_plant6(), (1400+random.randint(0, 20), 400+i))
-            surface.blit(get_plant7(), (1450+random.randint(0, 20), 400+i))
+            surface.blit(get_plant1(), (1150+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant2(), (1200+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant3(), (1250+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant4(), (1300+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant5(), (1350+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant6(), (1400+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant7(), (1450+rng.randint(0, 20), 400+i))
 
         for i in range(50, 500, 60):
-            surface.blit(get_plant1(), (600+random.randint(0, 20), 400+i))
-            surface.blit(get_plant2(), (650+random.randint(0, 20), 400+i))
-            surface.blit(get_plant3(), (700+random.randint(0, 20), 400+i))
-            surface.blit(get_plant4(), (750+random.randint(0, 20), 400+i))
-            surface.blit(get_plant5(), (800+random.randint(0, 20), 400+i))
-            surface.blit(get_plant6(), (850+random.randint(0, 20), 400+i))
-            surface.blit(get_plant7(), (900+random.randint(0, 20), 400+i))
+            surface.blit(get_plant1(), (600+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant2(), (650+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant3(), (700+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant4(), (750+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant5(), (800+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant6(), (850+rng.randint(0, 20), 400+i))
+            surface.blit(get_plant7(), (900+rng.randint(0, 20), 400+i))
 
     def update_map_view(self, key_pressed):
+        self.previous_view = (self.map_view_x, self.map_view_y)
         if self.player.interacting_with:
             self.moved_last_tick = False
             return
@@ -244,8 +258,8 @@ class Map:
                 # See which buildings we are colliding with
                 for (building_name, building) in self.buildings.items():
                     if building.rect.colliderect(pygame.Rect(
-                            WIDTH//2 - 50,
-                            HEIGHT//2 - 50,
+                            self.map_view_x + WIDTH//2 - 50,
+                            self.map_view_y + HEIGHT//2 - 50,
                             100,
                             100)) and building_name == self.day0[0][0]:
                         self.footstep.stop()
@@ -258,38 +272,68 @@ class Map:
             if not self.day0:
                 self.game_state.complete_task()
 
-        # update other sprites
-        for building in self.buildings.values():
-            building.update(self.get_viewport())
-        self.passables.update(self.get_viewport())
-        self.impassables.update(self.get_viewport())
-
     def get_viewport(self):
         return pygame.Rect(self.map_view_x, self.map_view_y,
                            WIDTH, HEIGHT)
 
+    def get_interpolated_viewport(self, alpha: float) -> pygame.Rect:
+        """The viewport {alpha} of the way from where it was before the last update to where it is now."""
+        previous_x, previous_y = self.previous_view
+        return pygame.Rect(round(previous_x + (self.map_view_x - previous_x) * alpha),
+                           round(previous_y + (self.map_view_y - previous_y) * alpha),
+                           WIDTH, HEIGHT)
+
+    @staticmethod
+    def make_index(sprites: typing.Iterable[pygame.sprite.Sprite]) -> SpatialHash:
+        """Index {sprites} by where they are on the map."""
+        index = SpatialHash()
+        for sprite in sprites:
+            index.insert(sprite, sprite.rect)
+        return index
+
+    def add_building(self, name: str, building) -> None:
+        """Add {building}, which has already been drawn on to {self.image}, to the map as {name}."""
+        self.buildings[name] = building
+        self.roofs.add(building)
+        for sprite in building.impassables:
+            self.impassables.add(sprite)
+            self.impassable_index.insert(sprite, sprite.rect)
+        for sprite in building.passables:
+            self.passables.add(sprite)
+            self.passable_index.insert(sprite, sprite.rect)
+
     def can_move(self, dx: int, dy: int) -> bool:
         """Check if the player can move by {dx}, {dy}.
 
         :return True if the player would hit a {self.passable} OR would not hit a {self.impassable}.
         """
-        # the ghost of a player moves ahead of them to check collision
-        ghost = pygame.sprite.Sprite()
-        # collision {ghost.rect} covers is player's feet
-        ghost.rect = pygame.Rect(self.player.rect.x + dx, self.player.rect.bottom + dy,
-                                 self.player.rect.w, 1)
-        return pygame.sprite.spritecollide(ghost, self.passables, False) or not pygame.sprite.spritecollide(ghost, self.impassables, False)
-
-    def draw(self, surface: pygame.Surface):
-        """Draw the viewable area of the map to the surface."""
-        surface.blit(self.image, (0, 0), area=(self.map_view_x, self.map_view_y,
-                                               self.map_view_x+WIDTH, self.map_view_y+HEIGHT))
+        # collision is checked for the player's feet, in map coordinates
+        feet = pygame.Rect(self.map_view_x + self.player.rect.x + dx, self.map_view_y + self.player.rect.bottom + dy,
+                           self.player.rect.w, 1)
+        return self.passable_index.collides(feet) or not self.impassable_index.collides(feet)
+
+    def draw(self, surface: pygame.Surface, viewport: pygame.Rect = None):
+        """Draw the viewable area of the map to the surface.
+
+        :param viewport: the area of the map to draw, if not the current viewport
+        """
+        if viewport is None:
+            viewport = self.get_viewport()
+        self.draw_ground(surface, viewport)
+        self.draw_props(surface, viewport)
+
+    def draw_ground(self, surface: pygame.Surface, viewport: pygame.Rect):
+        """Draw {viewport} of the map image, everything that was drawn onto the map when it was made."""
+        self.image.draw(surface, viewport)
         if settings.DEBUG:
-            self.impassables.draw(surface)
-            self.passables.draw(surface)
-        self.fire.draw(surface)
+            for sprite in chain(self.impassables, self.passables):
+                surface.blit(sprite.image, sprite.rect.move(-viewport.x, -viewport.y))
+
+    def draw_props(self, surface: pygame.Surface, viewport: pygame.Rect):
+        """Draw the things that stay in one place on the map, but are drawn on every frame."""
+        self.fire.draw(surface, viewport)
         # self.demon_fire.draw(surface)
         # self.demon.draw(surface)
         for grave in self.graves:
-            grave.draw(surface)
-        self.clothes_line.draw(surface)
+            grave.draw(surface, viewport)
+        self.clothes_line.draw(surface, viewport)
@@ -1,8 +1,8 @@
 from itertools import cycle
-import time
 import random
 import pygame
 
+from cultivate import glyphs, timing
 from cultivate.loader import get_npc5, get_character, get_npc, get_npc_cat, \
     get_npc_white_robes, get_npc_pink_robes, get_pentagram
 from cultivate.settings import WIDTH, HEIGHT, MD_FONT
@@ -27,27 +27,32 @@ SPEECH_FOLLOWERS = [
 BACKGROUND = pygame.Color(245, 245, 220)
 FOREGROUND = pygame.Color(0, 0, 0)
 
+# NPCs that overlap this area of the screen, around the player, stop walking
+NEAR_PLAYER = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 - 100, 200, 200)
+
 
 class TimedDialogue:
     def __init__(self, text, duration):
         padding = 10
 
-        text_width, text_height = MD_FONT.size(text)
+        rendered = glyphs.render(MD_FONT, text, FOREGROUND)
+        text_width, text_height = rendered.get_size()
 
         self.image = pygame.Surface((text_width + padding * 2,
                                      text_height + padding * 2))
         pygame.draw.rect(self.image, BACKGROUND,
                          (0, 0, *self.image.get_size()))
-        self.image.blit(MD_FONT.render(text, True, FOREGROUND), (padding, padding))
+        self.image.blit(rendered, (padding, padding))
+
+        self.expired = timing.now() + duration
 
-        self.expired = time.time() + duration
+    def get_rect(self, x, y):
+        # Centered above this point
+        return self.image.get_rect(centerx=x, bottom=y - 10)
 
     def draw(self, screen, x, y):
-        # Draw centered above this point
-        if self.expired >= time.time():
-            screen.blit(self.image,
-                        (x - self.image.get_rect().w // 2,
-                         y - self.image.get_rect().bottom - 10))
+        if self.expired >= timing.now():
+            screen.blit(self.image, self.get_rect(x, y))
             return True
         return False
 
@@ -63,6 +68,8 @@ class Npc(pygame.sprite.Sprite):
 
         self.x, self.y = next(self.path)
         self.next_x, self.next_y = next(self.path)
+        # where the NPC was on the map before the last update, for drawing in between updates
+        self.previous_x, self.previous_y = self.x, self.y
 
         self.image = self.get_images().getCurrentFrame()
         self.rect = self.image.get_rect()
@@ -76,7 +83,7 @@ class Npc(pygame.sprite.Sprite):
         self.dialogue = None
         self.pause_between_tips = 5
         self.speech_duration = 5
-        self.next_helpful_hint = time.time() + self.pause_between_tips
+        self.next_helpful_hint = timing.now() + self.pause_between_tips
 
         self.conversation = None
         self.in_conversation = False
@@ -88,23 +95,34 @@ class Npc(pygame.sprite.Sprite):
     def get_images(self, direction=None):
         return get_npc5(direction=direction)
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, offset=(0, 0), alpha=1.0):
+        """Draw the NPC {alpha} of the way from where it was before the last update to where it is now."""
+        rect = self.rect.move(offset)
+        if alpha < 1:
+            rect.move_ip(round((self.previous_x - self.x) * (1 - alpha)),
+                         round((self.previous_y - self.y) * (1 - alpha)))
+        surface.blit(self.image, rect)
 
         if self.dialogue:
-            present = self.dialogue.draw(surface, self.rect.centerx, self.rect.y)
+            present = self.dialogue.draw(surface, rect.centerx, rect.y)
             if not present:
                 self.dialogue = None
-                self.next_helpful_hint = time.time() + self.pause_between_tips
+                self.next_helpful_hint = timing.now() + self.pause_between_tips
 
-    def update(self, viewport):
-        rect_near_player = pygame.Rect(WIDTH//2 - 100, HEIGHT//2 - 100, 200, 200)
+    @property
+    def drawn_rect(self):
+        """The area of the screen covered by this NPC and their speech bubble."""
+        if self.dialogue:
+            return self.rect.union(self.dialogue.get_rect(self.rect.centerx, self.rect.y))
+        return self.rect
 
-        if not self.dialogue and self.next_helpful_hint <= time.time() and self.tips:
+    def update(self, viewport):
+        self.previous_x, self.previous_y = self.x, self.y
+        if not self.dialogue and self.next_helpful_hint <= timing.now() and self.tips:
             self.dialogue = TimedDialogue(random.choice(self.tips), self.speech_duration)
 
         direction = None
-        if not self.player_can_stop or not self.rect.colliderect(rect_near_player):
+        if not self.player_can_stop or not self.rect.colliderect(NEAR_PLAYER):
 
             if self.next_x > self.x + self.speed:
                 direction = 'right'
@@ -178,8 +196,8 @@ class Pentagram(pygame.sprite.Sprite):
         self.rect.x = self.x - view_port.x
         self.rect.y = self.y - view_port.y
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, offset=(0, 0), alpha=1.0):
+        surface.blit(self.image, self.rect.move(offset))
 
     @property
     def help_text(self):
@@ -200,7 +218,7 @@ class NpcFollower(Npc):
         self.next_x, self.next_y = x, y
         self.tips = SPEECH_FOLLOWERS
         self.pause_between_tips = 5+random.random()*10
-        self.next_helpful_hint = time.time() + self.pause_between_tips
+        self.next_helpful_hint = timing.now() + self.pause_between_tips
 
         self.conversation = [
             {'text': "I'm so happy to be invited to be part of this community",
@@ -242,7 +260,7 @@ class NpcSacrifice(NpcPathAndStop):
 
     def draw_text_in(self, text, seconds=1):
         self.tips = [text]
-        self.next_helpful_hint = time.time() + seconds
+        self.next_helpful_hint = timing.now() + seconds
         self.pause_between_tips = 999
 
 
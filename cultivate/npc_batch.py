@@ -0,0 +1,294 @@
+"""Moving and drawing a crowd of NPCs together.
+
+Each {cultivate.npc.Npc} is a sprite that moves and animates itself,
+which costs a few Python calls per NPC per frame, too many to have hundreds of them.
+An {NpcBatch} keeps the positions, targets and speeds of a whole crowd in arrays instead,
+moves every NPC in one step, and only works out the image and position on screen of the NPCs in view.
+When NumPy is installed the step is done on every NPC at once,
+otherwise it is a loop over the arrays, which is still much cheaper than updating sprites.
+NPCs in a batch walk like an {Npc}, but don't talk and can't be interacted with.
+"""
+import random
+import typing
+from array import array
+
+import pygame
+
+from cultivate.loader import get_npc5
+from cultivate.npc import NEAR_PLAYER
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+# the direction each NPC is walking in, as stored in {NpcBatch.directions}, and the animation for it
+STILL = 0
+RIGHT = 1
+LEFT = 2
+BACKWARD = 3
+FORWARD = 4
+DIRECTIONS = (None, 'right', 'left', 'backward', 'forward')
+
+
+def _pixel(value: float) -> int:
+    # round half away from zero, the same way a pygame.Rect does when given a float
+    return int(value + 0.5) if value >= 0 else int(value - 0.5)
+
+
+class NpcBatch(pygame.sprite.Sprite):
+    """A crowd of NPCs that walk between points on the map, all drawn with the images from {get_images}.
+
+    The batch is one sprite, so it goes in the same group as the other NPCs.
+    Its {rect} is empty so it is never in reach of the player,
+    and its {drawn_rect} covers every NPC in it that was on screen at the last update.
+    It draws many images rather than one, so its {image} is empty,
+    and {changes} counts the updates that changed what it draws, for drawing only what changed.
+    """
+    name = "crowd"
+
+    def __init__(self, get_images: typing.Callable = get_npc5):
+        super().__init__()
+        self.get_images = get_images
+        self.width, self.height = get_images().getCurrentFrame().get_size()
+
+        # where each NPC is on the map, where it is walking to, and how far it walks each update
+        self.x = array('d')
+        self.y = array('d')
+        self.target_x = array('d')
+        self.target_y = array('d')
+        self.speed = array('d')
+        # where each NPC was on the map before the last update, for drawing in between updates
+        self.previous_x = array('d')
+        self.previous_y = array('d')
+        # where each NPC was on the screen at the last update, as the top left of its rect
+        self.screen_x = array('d')
+        self.screen_y = array('d')
+        # one of the direction constants for each NPC
+        self.directions = array('b')
+        # whether each NPC stops walking when it is near the player
+        self.can_stop = array('b')
+        # the points each NPC walks to after its target, or None for followers
+        self.paths = []
+        # the NPCs that walk towards the player instead of along a path
+        self.followers = []
+
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.drawn_rect = pygame.Rect(0, 0, 0, 0)
+        # the NPCs on screen at the last update
+        self._visible = []
+        # the NPCs on screen at the last update, as images and where they go on the screen
+        self._blits = []
+        self.image = pygame.Surface((0, 0))
+        self.changes = 0
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+    def add(self, points: typing.Sequence[typing.Tuple[float, float]], speed: float = 3, cycle_path: bool = True,
+            can_stop: bool = True, follow: bool = False) -> int:
+        """Add an NPC that starts at the first of {points} and walks to each of the others in turn.
+
+        :param cycle_path: go back to the first point after the last one, rather than stopping there
+        :param follow: walk towards the centre of the screen, like a {cultivate.npc.NpcFollower}
+        :return: the index of the NPC in the batch's arrays
+        """
+        path = _cycle(points) if cycle_path else iter(points)
+        x, y = next(path)
+        target_x, target_y = next(path, (x, y))
+        self.x.append(x)
+        self.y.append(y)
+        self.target_x.append(target_x)
+        self.target_y.append(target_y)
+        self.speed.append(speed)
+        self.previous_x.append(x)
+        self.previous_y.append(y)
+        self.screen_x.append(x)
+        self.screen_y.append(y)
+        self.directions.append(STILL)
+        self.can_stop.append(can_stop)
+        self.paths.append(None if follow else path)
+        if follow:
+            self.followers.append(len(self.paths) - 1)
+        return len(self.paths) - 1
+
+    def update(self, viewport: pygame.Rect) -> None:
+        """Move every NPC, then work out which are on screen when the map is viewed through {viewport}."""
+        if not self.paths:
+            if self._blits:
+                self.changes += 1
+            self._blits = []
+            self._visible = []
+            self.drawn_rect = pygame.Rect(0, 0, 0, 0)
+            return
+        self.previous_x[:] = self.x
+        self.previous_y[:] = self.y
+        if numpy is not None:
+            arrived = self._step_numpy()
+        else:
+            arrived = self._step()
+
+        for i in arrived:
+            path = self.paths[i]
+            if path is not None:
+                self.target_x[i], self.target_y[i] = next(path, (self.x[i], self.y[i]))
+        # followers head for the middle of the screen, wherever they were going
+        for i in self.followers:
+            self.target_x[i], self.target_y[i] = viewport.centerx, viewport.centery
+
+        self._place(viewport)
+
+    def _blocked(self, i: int) -> bool:
+        # whether NPC {i} stops this update because it was near the player at the last one
+        if not self.can_stop[i]:
+            return False
+        x, y = _pixel(self.screen_x[i]), _pixel(self.screen_y[i])
+        return (x < NEAR_PLAYER.right and NEAR_PLAYER.x < x + self.width
+                and y < NEAR_PLAYER.bottom and NEAR_PLAYER.y < y + self.height)
+
+    def _step(self) -> typing.List[int]:
+        """Move every NPC towards its target, one at a time.
+
+        :return: the NPCs that reached their targets
+        """
+        arrived = []
+        x, y, target_x, target_y, speed = self.x, self.y, self.target_x, self.target_y, self.speed
+        directions = self.directions
+        for i in range(len(self.paths)):
+            if self._blocked(i):
+                directions[i] = STILL
+                continue
+            s = speed[i]
+            if target_x[i] > x[i] + s:
+                directions[i] = RIGHT
+                x[i] += s
+            elif target_x[i] < x[i] - s:
+                directions[i] = LEFT
+                x[i] -= s
+            elif target_y[i] < y[i] - s:
+                directions[i] = BACKWARD
+                y[i] -= s
+            elif target_y[i] > y[i] + s:
+                directions[i] = FORWARD
+                y[i] += s
+            else:
+                directions[i] = STILL
+                x[i], y[i] = target_x[i], target_y[i]
+                arrived.append(i)
+        return arrived
+
+    def _step_numpy(self) -> typing.List[int]:
+        """Move every NPC towards its target at once, the same way as {_step}.
+
+        :return: the NPCs that reached their targets
+        """
+        # views of the arrays, so changing them changes the arrays
+        x, y, target_x, target_y, speed, screen_x, screen_y = (
+            numpy.frombuffer(a, dtype=numpy.float64)
+            for a in (self.x, self.y, self.target_x, self.target_y, self.speed, self.screen_x, self.screen_y))
+        directions = numpy.frombuffer(self.directions, dtype=numpy.int8)
+        can_stop = numpy.frombuffer(self.can_stop, dtype=numpy.int8).astype(bool)
+
+        screen_left, screen_top = _round(screen_x), _round(screen_y)
+        blocked = can_stop & ((screen_left < NEAR_PLAYER.right) & (NEAR_PLAYER.x < screen_left + self.width)
+                              & (screen_top < NEAR_PLAYER.bottom) & (NEAR_PLAYER.y < screen_top + self.height))
+        moving = ~blocked
+        # the first of these that is true for an NPC is the way it walks, like the if statements in {_step}
+        right = moving & (target_x > x + speed)
+        left = moving & ~right & (target_x < x - speed)
+        sideways = right | left
+        backward = moving & ~sideways & (target_y < y - speed)
+        forward = moving & ~sideways & ~backward & (target_y > y + speed)
+        arrived = moving & ~sideways & ~backward & ~forward
+
+        x += numpy.where(right, speed, 0) - numpy.where(left, speed, 0)
+        y += numpy.where(forward, speed, 0) - numpy.where(backward, speed, 0)
+        x[arrived] = target_x[arrived]
+        y[arrived] = target_y[arrived]
+        directions[...] = numpy.select([right, left, backward, forward], [RIGHT, LEFT, BACKWARD, FORWARD], STILL)
+        return numpy.flatnonzero(arrived).tolist()
+
+    def _place(self, viewport: pygame.Rect) -> None:
+        """Work out where every NPC is on screen, and the images of the ones in view."""
+        width, height = viewport.w, viewport.h
+        if numpy is not None:
+            screen_x = numpy.frombuffer(self.screen_x, dtype=numpy.float64)
+            screen_y = numpy.frombuffer(self.screen_y, dtype=numpy.float64)
+            numpy.subtract(numpy.frombuffer(self.x, dtype=numpy.float64), viewport.x, out=screen_x)
+            numpy.subtract(numpy.frombuffer(self.y, dtype=numpy.float64), viewport.y, out=screen_y)
+            left, top = _round(screen_x), _round(screen_y)
+            visible = numpy.flatnonzero((left < width) & (left + self.width > 0)
+                                        & (top < height) & (top + self.height > 0))
+            on_screen = zip(visible.tolist(), left[visible].tolist(), top[visible].tolist())
+        else:
+            on_screen = []
+            for i in range(len(self.paths)):
+                self.screen_x[i] = self.x[i] - viewport.x
+                self.screen_y[i] = self.y[i] - viewport.y
+                left, top = _pixel(self.screen_x[i]), _pixel(self.screen_y[i])
+                if left < width and left + self.width > 0 and top < height and top + self.height > 0:
+                    on_screen.append((i, left, top))
+
+        # every NPC walking the same way shows the same frame, so only look each one up once
+        frames = {}
+        blits = []
+        visible = []
+        for i, left, top in on_screen:
+            direction = self.directions[i]
+            frame = frames.get(direction)
+            if frame is None:
+                frame = frames[direction] = self.get_images(direction=DIRECTIONS[direction]).getCurrentFrame()
+            blits.append((frame, (left, top)))
+            visible.append(i)
+        self._visible = visible
+        if blits != self._blits:
+            self.changes += 1
+        self._blits = blits
+        if blits:
+            rects = [pygame.Rect(position, (self.width, self.height)) for _, position in blits]
+            self.drawn_rect = rects[0].unionall(rects[1:])
+        else:
+            self.drawn_rect = pygame.Rect(0, 0, 0, 0)
+
+    def draw(self, surface: pygame.Surface, offset: typing.Tuple[int, int] = (0, 0), alpha: float = 1.0) -> None:
+        """Draw the NPCs that were on screen {alpha} of the way from where they were before the last update."""
+        dx, dy = offset
+        if alpha < 1:
+            back = 1 - alpha
+            blits = [(frame, (left + dx + round((self.previous_x[i] - self.x[i]) * back),
+                              top + dy + round((self.previous_y[i] - self.y[i]) * back)))
+                     for (frame, (left, top)), i in zip(self._blits, self._visible)]
+        elif offset != (0, 0):
+            blits = [(frame, (left + dx, top + dy)) for frame, (left, top) in self._blits]
+        else:
+            blits = self._blits
+        surface.blits(blits, doreturn=False)
+
+    @property
+    def help_text(self):
+        return None
+
+    @property
+    def interaction_result(self):
+        return None
+
+
+def _cycle(points: typing.Sequence[typing.Tuple[float, float]]) -> typing.Iterator[typing.Tuple[float, float]]:
+    # {itertools.cycle}, but ending straight away when there are no points
+    while points:
+        yield from points
+
+
+def _round(values):
+    # {_pixel} for a NumPy array
+    return numpy.trunc(values + numpy.copysign(0.5, values)).astype(numpy.int64)
+
+
+def crowd(count: int, area: pygame.Rect, rng: random.Random, points: int = 4) -> NpcBatch:
+    """Make a batch of {count} NPCs, each walking around {points} random points in {area} of the map."""
+    batch = NpcBatch()
+    for _ in range(count):
+        batch.add([(rng.randrange(area.left, area.right), rng.randrange(area.top, area.bottom))
+                   for _ in range(points)],
+                  speed=rng.uniform(2, 5))
+    return batch
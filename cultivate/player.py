@@ -28,35 +28,36 @@ class Player(Sprite):
         self._pickup = None
         self._direction = None
         self.conversation = None
+        self.dialogue_box = Dialogue()
         self.madlibs = None
         self.sleeping = False
         self.nearby_interactable = None
         self.interacting_with = None
         self.inventory = None
+        self.interactions = None  # set post init
         self.map = None  # set post init
 
-    def draw(self, surface, key_pressed):
+    @staticmethod
+    def get_images(key_pressed):
         if key_pressed[pygame.K_DOWN] or key_pressed[pygame.K_s]:
-            self.image = get_player('forward')
+            return get_player('forward')
         elif key_pressed[pygame.K_UP] or key_pressed[pygame.K_w]:
-            self.image = get_player('backward')
+            return get_player('backward')
         elif key_pressed[pygame.K_RIGHT] or key_pressed[pygame.K_d]:
-            self.image = get_player('right')
+            return get_player('right')
         elif key_pressed[pygame.K_LEFT] or key_pressed[pygame.K_a]:
-            self.image = get_player('left')
+            return get_player('left')
         else:
-            self.image = get_player()
+            return get_player()
+
+    def draw(self, surface, key_pressed):
+        self.image = self.get_images(key_pressed)
 
         surface.blit(self.image.getCurrentFrame(), (self.x, self.y))
 
         if self.conversation:
-            d = Dialogue()
-            d.set_data(
-                self.conversation.npc_name,
-                self.conversation.current['text'],
-                self.conversation.current['responses']
-            )
-            d.draw(surface)
+            self.dialogue_box.show(self.conversation.npc_name, self.conversation.current)
+            self.dialogue_box.draw(surface)
 
         if self.madlibs is not None:
             self.madlibs.draw(surface)
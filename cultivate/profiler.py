@@ -0,0 +1,151 @@
+"""Times each stage of the game loop.
+
+Wrap each stage in `with profiler.section(name):`, and call {end_frame} once per frame.
+Nothing is timed unless {active} is replaced with a {Profiler}, e.g. by the `--profile` flag.
+"""
+import collections
+import csv
+import json
+import time
+import typing
+
+import pygame
+
+from cultivate import settings
+
+# how many frames percentiles are worked out over
+WINDOW = settings.FPS * 10
+# how many frames the overlay is shown for before it is drawn again
+OVERLAY_REFRESH = settings.FPS // 2
+
+
+class _Section:
+    """Adds the time spent inside a `with` block to a section of a {Profiler}."""
+
+    def __init__(self, frame: typing.Dict[str, float], name: str):
+        self.frame = frame
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, *exc_info) -> None:
+        self.frame[self.name] += time.perf_counter() - self.start
+
+
+class Profiler:
+    """Keeps the time spent in each section of the last {window} frames, and a trace of every frame.
+
+    Times are in milliseconds.
+    """
+
+    def __init__(self, window: int = WINDOW, trace: bool = True):
+        # section -> time spent in it this frame, in seconds
+        self._frame = collections.OrderedDict()
+        self._sections = {}
+        # section -> times for recent frames
+        self.recent = collections.OrderedDict()
+        self.window = window
+        # one {section: time} dict per frame, or None if the trace isn't kept
+        self.trace = [] if trace else None
+        self.frames = 0
+        self._overlay = None
+        self.overlay_version = 0
+
+    def section(self, name: str) -> _Section:
+        if name not in self._sections:
+            self._frame[name] = 0.0
+            self._sections[name] = _Section(self._frame, name)
+        return self._sections[name]
+
+    def end_frame(self) -> None:
+        """Finish timing this frame."""
+        frame = {name: seconds * 1000 for name, seconds in self._frame.items()}
+        for name, ms in frame.items():
+            if name not in self.recent:
+                self.recent[name] = collections.deque(maxlen=self.window)
+            self.recent[name].append(ms)
+            self._frame[name] = 0.0
+        if self.trace is not None:
+            self.trace.append(frame)
+        self.frames += 1
+        if self.frames % OVERLAY_REFRESH == 0:
+            self._overlay = None
+
+    def percentiles(self, name: str, percents: typing.Sequence[int] = (50, 95, 99)) -> typing.List[float]:
+        """Return the given percentiles of the time spent in section {name} over recent frames."""
+        times = sorted(self.recent.get(name, ()))
+        if not times:
+            return [0.0 for _ in percents]
+        return [times[min(len(times) - 1, len(times) * percent // 100)] for percent in percents]
+
+    def summary(self) -> typing.List[str]:
+        """Describe the recent time spent in each section, one line per section."""
+        lines = [f"{'section':<12} {'p50':>6} {'p95':>6} {'p99':>6}"]
+        for name in self.recent:
+            p50, p95, p99 = self.percentiles(name)
+            lines.append(f"{name:<12} {p50:6.2f} {p95:6.2f} {p99:6.2f}")
+        return lines
+
+    def get_overlay(self) -> pygame.Surface:
+        """Return the overlay, which is only drawn again every {OVERLAY_REFRESH} frames."""
+        if self._overlay is None:
+            lines = [settings.XS_FONT.render(line, True, pygame.Color("white")) for line in self.summary()]
+            line_height = settings.XS_FONT.get_linesize()
+            self._overlay = pygame.Surface((max(line.get_width() for line in lines) + 10,
+                                            line_height * len(lines) + 10))
+            self._overlay.set_alpha(200)
+            for i, line in enumerate(lines):
+                self._overlay.blit(line, (5, 5 + i * line_height))
+            self.overlay_version += 1
+        return self._overlay
+
+    def overlay_rect(self) -> pygame.Rect:
+        return self.get_overlay().get_rect(bottomright=(settings.WIDTH, settings.HEIGHT))
+
+    def draw(self, surface: pygame.Surface) -> None:
+        surface.blit(self.get_overlay(), self.overlay_rect())
+
+    def dump(self, path: str) -> None:
+        """Write the trace to {path}, as CSV if it ends with .csv and as JSON otherwise."""
+        names = list(self.recent)
+        if path.endswith(".csv"):
+            with open(path, "w", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(["frame"] + names)
+                for i, frame in enumerate(self.trace or ()):
+                    writer.writerow([i] + [f"{frame.get(name, 0.0):.4f}" for name in names])
+        else:
+            with open(path, "w") as f:
+                json.dump({"sections": names,
+                           "frames": [[round(frame.get(name, 0.0), 4) for name in names] for frame in self.trace or ()]},
+                          f)
+
+
+class _NullSection:
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+class NullProfiler:
+    """A profiler that doesn't time anything."""
+
+    _section = _NullSection()
+
+    def section(self, name: str) -> _NullSection:
+        return self._section
+
+    def end_frame(self) -> None:
+        pass
+
+
+active = NullProfiler()
+
+
+def section(name: str) -> _Section:
+    """Time a `with` block as part of section {name} of the {active} profiler."""
+    return active.section(name)
@@ -0,0 +1,104 @@
+import typing
+
+
+class Recipe(typing.NamedTuple):
+    """Combining a held {held} with a {target} makes a {result}, and leaves the player holding a {reusable}."""
+    held: type
+    target: type
+    result: type
+    reusable: typing.Optional[type] = None
+
+
+class RecipeBook:
+    """Every way of combining things, looked up by the types of the things being combined.
+
+    A recipe for a type also applies to its subclasses, unless they have a recipe of their own.
+    """
+
+    def __init__(self, recipes: typing.Iterable[Recipe] = ()):
+        self._recipes = {}
+        # (held type, target type) -> recipe, or None if they can't be combined
+        self._resolved = {}
+        for recipe in recipes:
+            self.add(recipe)
+
+    def add(self, recipe: Recipe) -> None:
+        key = (recipe.held, recipe.target)
+        if key in self._recipes:
+            raise ValueError(f"{recipe.held.__name__} can already be combined with {recipe.target.__name__}")
+        self._recipes[key] = recipe
+        self._resolved.clear()
+
+    def __iter__(self) -> typing.Iterator[Recipe]:
+        return iter(self._recipes.values())
+
+    def __len__(self) -> int:
+        return len(self._recipes)
+
+    def find(self, held: type, target: type) -> typing.Optional[Recipe]:
+        """Return the recipe for combining a {held} with a {target}, if there is one."""
+        key = (held, target)
+        try:
+            return self._resolved[key]
+        except KeyError:
+            pass
+        recipe = None
+        for held_type in held.__mro__:
+            for target_type in target.__mro__:
+                recipe = self._recipes.get((held_type, target_type))
+                if recipe is not None:
+                    break
+            if recipe is not None:
+                break
+        self._resolved[key] = recipe
+        return recipe
+
+    def can_combine(self, held: type, target: type) -> bool:
+        return self.find(held, target) is not None
+
+    def combine(self, held, target) -> typing.Tuple[typing.Any, typing.Any]:
+        """Make the results of combining {held} with {target}, placed where {held} is.
+
+        :return: the new item and the item the player is left holding, either of which may be None
+        """
+        recipe = self.find(type(held), type(target))
+        if recipe is None:
+            return None, None
+        reusable = recipe.reusable(held.x, held.y) if recipe.reusable is not None else None
+        return recipe.result(held.x, held.y), reusable
+
+    def reachable(self, start: typing.Iterable[type], fixtures: typing.Iterable[type] = ()) -> typing.Set[type]:
+        """Return every type that can be made from the items in {start}.
+
+        Items are consumed when combined with each other, but this only checks what could ever be made,
+        not whether there are enough items to make everything at once.
+
+        :param fixtures: types of things that can be combined with, but never picked up, such as the river
+        """
+        have = set(start)
+        fixtures = set(fixtures)
+        changed = True
+        while changed:
+            changed = False
+            for recipe in self:
+                if recipe.held in have and (recipe.target in have or recipe.target in fixtures):
+                    for made in (recipe.result, recipe.reusable):
+                        if made is not None and made not in have:
+                            have.add(made)
+                            changed = True
+        return have
+
+    def validate(self, base: type) -> typing.List[str]:
+        """Check that everything held or made by a recipe is a subclass of {base}, so can be picked up.
+
+        :return: a description of each problem found
+        """
+        problems = []
+        for recipe in self:
+            name = f"{recipe.held.__name__} + {recipe.target.__name__}"
+            if not issubclass(recipe.held, base):
+                problems.append(f"{name}: {recipe.held.__name__} can't be held")
+            for made in (recipe.result, recipe.reusable):
+                if made is not None and not issubclass(made, base):
+                    problems.append(f"{name}: makes {made.__name__}, which can't be picked up")
+        return problems
@@ -0,0 +1,88 @@
+import typing
+
+import pygame
+
+
+class DirtyRectRenderer:
+    """Redraws and pushes to the display only the parts of the screen that changed.
+
+    Every frame, each thing that can change on screen is marked with the rect it covers and
+    a {state} that changes whenever what it draws changes (e.g. the current animation frame).
+    Anything whose rect or state differs from the previous frame is dirty, and the screen is
+    redrawn with its clip set to each dirty area before those areas are pushed with
+    {pygame.display.update}.
+    If the camera moved or {invalidate} was called, the whole screen is redrawn.
+    """
+
+    def __init__(self, screen: pygame.Surface, max_passes: int = 4):
+        """
+        :param max_passes: number of clipped redraws allowed per frame before dirty areas are merged
+        """
+        self.screen = screen
+        self.screen_rect = screen.get_rect()
+        self.max_passes = max_passes
+        self._previous = {}
+        self._current = {}
+        self._previous_viewport = None
+        self._full_redraw = True
+
+        # statistics about the last frame
+        self.passes = 0
+        self.pixels = 0
+
+    def mark(self, key, rect: pygame.Rect, state=None) -> None:
+        """Mark {rect} (in screen coordinates) as drawn this frame by {key} with {state}."""
+        self._current[key] = (pygame.Rect(rect), state)
+
+    def invalidate(self) -> None:
+        """Redraw the whole screen next frame."""
+        self._full_redraw = True
+
+    def dirty_rects(self, viewport: pygame.Rect) -> typing.List[pygame.Rect]:
+        """Work out which rects need redrawing this frame, and start tracking the next frame."""
+        if self._full_redraw or viewport != self._previous_viewport:
+            dirty = [self.screen_rect]
+        else:
+            dirty = []
+            for key in self._previous.keys() | self._current.keys():
+                previous = self._previous.get(key)
+                current = self._current.get(key)
+                if previous == current:
+                    continue
+                for rect, _ in filter(None, (previous, current)):
+                    rect = rect.clip(self.screen_rect)
+                    if rect.w and rect.h:
+                        dirty.append(rect)
+            dirty = self.merge(dirty)
+
+        self._previous, self._current = self._current, {}
+        self._previous_viewport = pygame.Rect(viewport)
+        self._full_redraw = False
+        return dirty
+
+    def merge(self, rects: typing.List[pygame.Rect]) -> typing.List[pygame.Rect]:
+        """Merge overlapping {rects}, then all of them if there are more than {self.max_passes}."""
+        merged = []
+        for rect in rects:
+            # absorb every merged rect that overlaps this one, until none do
+            overlapping = rect.collidelist(merged)
+            while overlapping != -1:
+                rect = rect.union(merged.pop(overlapping))
+                overlapping = rect.collidelist(merged)
+            merged.append(rect)
+        if len(merged) > self.max_passes:
+            merged = [merged[0].unionall(merged[1:])]
+        return merged
+
+    def render(self, viewport: pygame.Rect, draw_callable: typing.Callable[[], None]) -> None:
+        """Redraw the dirty parts of the screen with {draw_callable} and push them to the display."""
+        dirty = self.dirty_rects(viewport)
+        for rect in dirty:
+            self.screen.set_clip(rect)
+            draw_callable()
+        self.screen.set_clip(None)
+
+        self.passes = len(dirty)
+        self.pixels = sum(rect.w * rect.h for rect in dirty)
+        if dirty:
+            pygame.display.update(dirty)
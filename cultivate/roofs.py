@@ -0,0 +1,67 @@
+"""Drawing the roofs of buildings, which are hidden while the player is near them.
+
+Each roof is composed once with anything on it, like the building's sign,
+so drawing a roof is one blit, and only the roofs that are on screen are drawn.
+"""
+import typing
+
+import pygame
+
+from cultivate import settings
+from cultivate.asset_cache import scoped
+
+# roofs of buildings that overlap this area of the screen, around the player, are hidden
+NEAR_PLAYER = pygame.Rect(settings.WIDTH // 2 - 75, settings.HEIGHT // 2 - 75, 150, 150)
+
+
+def compose(*parts: typing.Tuple[pygame.Surface, typing.Tuple[int, int]]) -> typing.Tuple[pygame.Surface, pygame.Rect]:
+    """Blit {parts}, each a surface and where it goes on the map, in order onto one surface.
+
+    :return: the surface, and where it goes on the map
+    """
+    rects = [surface.get_rect(topleft=position) for surface, position in parts]
+    rect = rects[0].unionall(rects[1:])
+    # buildings of the same kind have the same roof, so share the surface between them
+    return _composite(tuple((surface, (r.x - rect.x, r.y - rect.y)) for (surface, _), r in zip(parts, rects)),
+                      rect.size), rect
+
+
+@scoped("session")
+def _composite(parts: typing.Tuple[typing.Tuple[pygame.Surface, typing.Tuple[int, int]], ...],
+               size: typing.Tuple[int, int]) -> pygame.Surface:
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    for part, position in parts:
+        surface.blit(part, position)
+    return surface
+
+
+class Roofs:
+    """The roofs of {buildings}, drawn in the order the buildings were added.
+
+    Each building has a {roof_image} that goes at {roof_rect} on the map,
+    and its roof is hidden when its {rect} on the map is near the player.
+    """
+
+    def __init__(self, buildings: typing.Iterable = ()):
+        self.buildings = []
+        # where each building's roof goes on the map, in the same order as {self.buildings}
+        self.rects = []
+        # how many roofs were drawn last frame
+        self.drawn = 0
+        for building in buildings:
+            self.add(building)
+
+    def add(self, building) -> None:
+        self.buildings.append(building)
+        self.rects.append(building.roof_rect)
+
+    def draw(self, surface: pygame.Surface, viewport: pygame.Rect) -> None:
+        """Draw the roofs on screen when the map is viewed through {viewport}."""
+        near_player = NEAR_PLAYER.move(viewport.x, viewport.y)
+        blits = []
+        for i in viewport.collidelistall(self.rects):
+            building = self.buildings[i]
+            if not near_player.colliderect(building.rect):
+                blits.append((building.roof_image, self.rects[i].move(-viewport.x, -viewport.y)))
+        surface.blits(blits, doreturn=False)
+        self.drawn = len(blits)
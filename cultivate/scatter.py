@@ -0,0 +1,91 @@
+"""Scattering trees, weeds and plants over the map.
+
+Placing things makes a list of {Instance}s, each saying which tile goes where,
+rather than painting the tiles onto a surface as they are placed.
+All the randomness comes from the random number generator passed in,
+so the same seed always places everything in the same way.
+Drawing instances onto a {cultivate.chunks.ChunkedSurface} only records them,
+and each chunk paints the instances that overlap it when it comes into view.
+"""
+import random
+import typing
+
+import pygame
+
+# indices into the forest tiles
+TALL_TREE = 1
+ROUND_TREES = (0, 2, 3)
+FOREST_TILES = 4
+GARDEN_TILES = 6
+
+
+class Instance(typing.NamedTuple):
+    """Tile number {tile} drawn with its top left at {x}, {y}."""
+    tile: int
+    x: int
+    y: int
+
+
+def forest_border(width: int, height: int, rng: random.Random) -> typing.List[Instance]:
+    """Place trees along the edges of an area of {width} and {height}, thick enough to hide what's beyond it."""
+    trees = []
+
+    def any_tree():
+        return rng.randrange(FOREST_TILES)
+
+    # top edge
+    for i in range(0, width, 100):
+        trees.append(Instance(TALL_TREE, i, -50))
+        trees.append(Instance(any_tree(), i + rng.randint(-30, 0), 0 + rng.randint(-20, 20)))
+        trees.append(Instance(any_tree(), i + rng.randint(-30, 0), 150 + rng.randint(-20, 20)))
+        trees.append(Instance(rng.choice(ROUND_TREES), i + rng.randint(-25, 25), 250 + rng.randint(-25, 25)))
+    # left edge
+    for i in range(0, height, 100):
+        trees.append(Instance(TALL_TREE, -50, i + rng.randint(-30, 0)))
+        for i_x in range(50, 450, 90):
+            trees.append(Instance(any_tree(), i_x + rng.randint(-30, 30), i + rng.randint(-30, 0)))
+    # right edge
+    for i in range(0, height, 100):
+        trees.append(Instance(TALL_TREE, width - 100, i + rng.randint(-30, 0)))
+        for i_x in range(50, 550, 90):
+            trees.append(Instance(any_tree(), (width - i_x) + rng.randint(-30, 30), i + rng.randint(-30, 0)))
+    # bottom edge
+    for i in range(0, width, 100):
+        for i_y in range(50, 400, 90):
+            trees.append(Instance(any_tree(), i + rng.randint(-30, 0), (height - i_y) + rng.randint(-30, 30)))
+        trees.append(Instance(TALL_TREE, i, height - 100))
+    return trees
+
+
+def garden_border(width: int, height: int, rng: random.Random) -> typing.List[Instance]:
+    """Place plants along the top, left and right edges of a garden of {width} and {height}."""
+    plants = []
+    # top edge
+    for i in range(0, width, 60):
+        plants.append(Instance(rng.randrange(GARDEN_TILES), i + rng.randint(0, 5), 0 + rng.randint(0, 10)))
+        plants.append(Instance(rng.randrange(GARDEN_TILES), i + rng.randint(0, 5), 0 + rng.randint(0, 10)))
+    # sides
+    for j in range(0, height, 60):
+        plants.append(Instance(rng.randrange(GARDEN_TILES), 0 + rng.randint(0, 10), j + rng.randint(0, 5)))
+        plants.append(Instance(rng.randrange(GARDEN_TILES), width - 60 + rng.randint(0, 10), j + rng.randint(0, 5)))
+    return plants
+
+
+def weeds(width: int, height: int, count: int, rng: random.Random) -> typing.List[Instance]:
+    """Place {count} weeds anywhere in an area of {width} and {height}."""
+    return [Instance(0, rng.randrange(0, width), rng.randrange(0, height)) for _ in range(count)]
+
+
+def draw(surface, tiles: typing.Sequence[pygame.Surface], instances: typing.Iterable[Instance],
+         area: pygame.Rect) -> None:
+    """Blit {instances} of {tiles} onto {surface}, placed relative to the top left of {area} and cut off at its edges.
+
+    :param surface: a pygame.Surface, or a ChunkedSurface
+    """
+    area = pygame.Rect(area)
+    for tile, x, y in instances:
+        image = tiles[tile]
+        rect = pygame.Rect(area.x + x, area.y + y, image.get_width(), image.get_height())
+        visible = rect.clip(area)
+        if visible.w and visible.h:
+            surface.blit(image, visible.topleft, visible.move(-rect.x, -rect.y))
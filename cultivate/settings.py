@@ -17,6 +17,21 @@ VIEW_PORT_SIZE = (WIDTH, HEIGHT)
 MAP_HEIGHT = MAP_WIDTH = 700 * 6
 TOTAL_MAP_SIZE = (MAP_HEIGHT, MAP_WIDTH)
 
+# the map background is painted and kept in memory in square chunks of this size
+CHUNK_SIZE = 256
+# obstacles are indexed for collision checks in square cells of this size
+SPATIAL_CELL_SIZE = 128
+# rendered strings are kept in memory until they take up more than this many bytes
+TEXT_CACHE_BUDGET = 2 * 1024 * 1024
+# how the screen changes between days, one of {cultivate.transition.STYLES}
+TRANSITION = "fade"
+# the seed that trees, weeds and plants are scattered over the map with, or None for a new map on every run
+WORLD_SEED = None
+# the HUD is only checked for changes every this many frames
+HUD_INTERVAL = 4
+# how many extra villagers walk around the map, moved and drawn together as one {cultivate.npc_batch.NpcBatch}
+CROWD_SIZE = 0
+
 
 # file paths
 PROJECT_DIR = os.path.dirname(
@@ -30,6 +45,13 @@ MUSIC_DIR = os.path.join(ROOT_ASSETS_DIR, 'music')
 DIALOGUE_DIR = os.path.join(ROOT_ASSETS_DIR, 'dialogue')
 FONTS_DIR = os.path.join(ROOT_ASSETS_DIR, 'fonts')
 
+# composed background surfaces are cached here between runs
+DISK_CACHE = True
+CACHE_DIR = os.environ.get(
+    'CULTIVATE_CACHE_DIR',
+    os.path.join(os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache')), 'cultivate')
+)
+
 
 # default fonts
 pygame.font.init()
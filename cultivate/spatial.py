@@ -0,0 +1,70 @@
+import typing
+
+import pygame
+
+from cultivate import settings
+
+
+class SpatialHash:
+    """A uniform grid of cells for quickly finding what overlaps a rect.
+
+    Each item is stored in every cell its rect overlaps,
+    so a query only has to look at the items in the cells the query rect overlaps.
+    Rects should all be in the same coordinate space, normally map coordinates.
+    """
+
+    def __init__(self, cell_size: int = settings.SPATIAL_CELL_SIZE):
+        self.cell_size = cell_size
+        # cell coordinates -> {item: rect}
+        self._cells = {}
+        # item -> rect
+        self._rects = {}
+
+    def __len__(self) -> int:
+        return len(self._rects)
+
+    def __contains__(self, item) -> bool:
+        return item in self._rects
+
+    def _cells_overlapping(self, rect: pygame.Rect) -> typing.Iterator[typing.Tuple[int, int]]:
+        size = self.cell_size
+        for cy in range(rect.top // size, (rect.bottom - 1) // size + 1):
+            for cx in range(rect.left // size, (rect.right - 1) // size + 1):
+                yield cx, cy
+
+    def insert(self, item, rect: pygame.Rect) -> None:
+        """Add {item} covering {rect}, replacing its old rect if it was already added."""
+        if item in self._rects:
+            self.remove(item)
+        rect = pygame.Rect(rect)
+        self._rects[item] = rect
+        for cell in self._cells_overlapping(rect):
+            self._cells.setdefault(cell, {})[item] = rect
+
+    def remove(self, item) -> None:
+        rect = self._rects.pop(item)
+        for cell in self._cells_overlapping(rect):
+            items = self._cells[cell]
+            del items[item]
+            if not items:
+                del self._cells[cell]
+
+    def get_rect(self, item) -> pygame.Rect:
+        return self._rects[item]
+
+    def query(self, rect: pygame.Rect) -> typing.List:
+        """Return every item whose rect collides with {rect}."""
+        found = {}
+        for cell in self._cells_overlapping(rect):
+            for item, item_rect in self._cells.get(cell, {}).items():
+                if item not in found and item_rect.colliderect(rect):
+                    found[item] = None
+        return list(found)
+
+    def collides(self, rect: pygame.Rect) -> bool:
+        """Check if any item's rect collides with {rect}."""
+        for cell in self._cells_overlapping(rect):
+            for item_rect in self._cells.get(cell, {}).values():
+                if item_rect.colliderect(rect):
+                    return True
+        return False
@@ -4,7 +4,7 @@ import typing
 
 import pygame
 
-from cultivate import settings
+from cultivate import roofs, settings
 from cultivate.loader import (get_floor, get_roof_small, get_walls,
                               get_walls_edge)
 from cultivate.sprites import UpdatableSprite
@@ -20,12 +20,13 @@ class Building(abc.ABC):
         self.side_wall = self.get_side_wall()
         self.roof, self.roof_y_overlap = self.get_roof()
         self.sign = self.get_sign()
+        self.roof_image, self.roof_rect = self.compose_roof()
         map_background.blit(self.floor, (self.rect.x, self.rect.y))
         if settings.DEBUG:
             random_color = pygame.Color(random.randint(0, 255),
                                         random.randint(0, 255),
                                         random.randint(0, 255))
-            pygame.draw.rect(map_background, random_color, self.rect)
+            map_background.fill(random_color, self.rect)
         map_background.blit(self.top_wall, (self.rect.x, self.rect.y))
         map_background.blit(self.side_wall, (self.rect.x, self.rect.y))
         map_background.blit(self.side_wall, (self.rect.right - self.side_wall.get_rect().w, self.rect.y))
@@ -45,28 +46,14 @@ class Building(abc.ABC):
         self.passables = pygame.sprite.Group()
         self.draw_items(map_background)
 
-    def update(self, view_port: pygame.Rect):
-        self.rect.x = self.map_x - view_port.x
-        self.rect.y = self.map_y - view_port.y
-
-    def draw(self, map_foreground: pygame.Surface) -> None:
-        """Draw the roof if the player is not near the building."""
-        rect_near_player = pygame.Rect(
-            settings.WIDTH // 2 - 75, settings.HEIGHT // 2 - 75,
-            150, 150
+    def compose_roof(self) -> typing.Tuple[pygame.Surface, pygame.Rect]:
+        """The roof with the sign on it, and where it goes on the map."""
+        sign_rect = self.sign.get_rect()
+        return roofs.compose(
+            (self.roof, (self.rect.x, self.rect.y - self.roof_y_overlap)),
+            (self.sign, (self.rect.x + self.rect.w // 2 - sign_rect.w // 2,
+                         self.rect.y + self.roof_y_overlap - sign_rect.h)),
         )
-        if not rect_near_player.colliderect(self.rect):
-            map_foreground.blit(
-                self.roof,
-                pygame.Rect(self.rect.x, self.rect.y - self.roof_y_overlap,
-                            self.rect.width, self.rect.height + self.roof_y_overlap)
-            )
-            map_foreground.blit(
-                self.sign,
-                pygame.Rect(self.rect.x + self.rect.w // 2 - self.sign.get_rect().w // 2,
-                            self.rect.y + self.roof_y_overlap - self.sign.get_rect().h,
-                            self.rect.w, self.rect.h)
-            )
 
     @property
     @abc.abstractmethod
@@ -21,5 +21,5 @@ class ClothesLine(UpdatableSprite):
     def interaction_result(self):
         return self
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, view_port):
+        surface.blit(self.image, self.rect.move(-view_port.x, -view_port.y))
@@ -1,25 +1,25 @@
 import pygame
 from pygame.sprite import Sprite
-from cultivate.loader import get_demon
+from cultivate.loader import get_demon, get_scaled_animation
 
 class Demon(Sprite):
     def __init__(self, x, y):
         super().__init__()
         self.x = x
         self.y = y
-        self.animation = get_demon()
+        self.animation = get_scaled_animation(get_demon, (1000, 1000))
         self.rect = self.image.get_rect()
 
     @property
     def image(self):
-         return pygame.transform.scale(self.animation.getCurrentFrame(), (1000,1000))
+        return self.animation.getCurrentFrame()
 
     def update(self, view_port):
         self.rect.x = self.x - view_port.x
         self.rect.y = self.y - view_port.y
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, offset=(0, 0), alpha=1.0):
+        surface.blit(self.image, self.rect.move(offset))
 
     @property
     def help_text(self):
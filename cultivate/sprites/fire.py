@@ -1,7 +1,7 @@
 
 import pygame
 from pygame.sprite import Sprite
-from cultivate.loader import get_fire, get_demon_fire
+from cultivate.loader import get_fire, get_demon_fire, get_scaled_animation
 
 class Fire(Sprite):
     def __init__(self, x, y):
@@ -9,18 +9,15 @@ class Fire(Sprite):
         self.x = x
         self.y = y
         self.animation = get_fire()
-        self.rect = self.image.get_rect()
+        # the fire never moves, so it is kept in map coordinates
+        self.rect = self.image.get_rect(topleft=(x, y))
 
     @property
     def image(self):
         return self.animation.getCurrentFrame()
 
-    def update(self, view_port):
-        self.rect.x = self.x - view_port.x
-        self.rect.y = self.y - view_port.y
-
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, view_port):
+        surface.blit(self.image, self.rect.move(-view_port.x, -view_port.y))
 
     @property
     def help_text(self):
@@ -35,19 +32,19 @@ class DemonFire(Sprite):
         super().__init__()
         self.x = x
         self.y = y
-        self.animation = get_demon_fire()
+        self.animation = get_scaled_animation(get_demon_fire, (1000, 1000))
         self.rect = self.image.get_rect()
 
     @property
     def image(self):
-        return pygame.transform.scale(self.animation.getCurrentFrame(), (1000,1000))
+        return self.animation.getCurrentFrame()
 
     def update(self, view_port):
         self.rect.x = self.x - view_port.x
         self.rect.y = self.y - view_port.y
 
-    def draw(self, surface):
-        surface.blit(self.image, self.rect)
+    def draw(self, surface, offset=(0, 0), alpha=1.0):
+        surface.blit(self.image, self.rect.move(offset))
 
     @property
     def help_text(self):
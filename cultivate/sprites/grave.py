@@ -40,5 +40,5 @@ class Grave(UpdatableSprite):
     def interaction_result(self):
         return self
 
-    def draw(self, surface):
-        surface.blit(self.grave_image, self.rect)
+    def draw(self, surface, view_port):
+        surface.blit(self.grave_image, self.rect.move(-view_port.x, -view_port.y))
@@ -6,6 +6,8 @@ from cultivate.sprites.river import River
 from cultivate.sprites.fire import Fire
 from cultivate.sprites.clothes_line import ClothesLine
 from cultivate import loader
+from cultivate.atlas import atlas
+from cultivate.recipes import Recipe, RecipeBook
 
 class BasePickUp(Sprite):
     scale = False
@@ -20,7 +22,11 @@ class BasePickUp(Sprite):
         self.image = self.get_image()
 
         if self.scale:
-            self.image = pygame.transform.scale(self.image, self.size)
+            # every instance of a pickup shares one scaled image
+            name = f"{type(self).__name__}{self.size}"
+            if name not in atlas:
+                atlas.add(name, pygame.transform.scale(self.image, self.size))
+            self.image = atlas.get(name)
 
         self.rect = self.image.get_rect()
         self.rect.x = x
@@ -44,11 +50,10 @@ class BasePickUp(Sprite):
         return msg
 
     def combine(self, item):
-        return None, None
+        return recipes.combine(self, item)
 
     def can_combine(self, item):
-        new_item, reusable = self.combine(item)
-        return new_item is not None
+        return recipes.can_combine(type(self), type(item))
 
     def __str__(self):
         return self.name
@@ -67,47 +72,18 @@ class Lemon(BasePickUp):
     def get_image(self):
         return loader.get_lemon_basket()
 
-    def combine(self, item):
-        if isinstance(item, WaterBucket):
-            return LemonyWater(self.x, self.y), None
-        if isinstance(item, SugaryWater):
-            return SugaryLemonWater(self.x, self.y), None
-        return None, None
-
 class EmptyBucket(BasePickUp):
     name = 'bucket'
 
     def get_image(self):
         return loader.get_basin_empty()
 
-    def combine(self, item):
-        if isinstance(item, River):
-            return WaterBucket(self.x, self.y), None
-        if isinstance(item, MeltedBlackWax):
-            return BlackCandles(self.x, self.y), None
-        if isinstance(item, ScentedMeltedBlackWax):
-            return ScentedBlackCandles(self.x, self.y), None
-        return None, None
-
 class WaterBucket(BasePickUp):
     name = 'water bucket'
 
     def get_image(self):
         return loader.get_basin_water()
 
-    def combine(self, item):
-        if isinstance(item, River):
-            return EmptyBucket(self.x, self.y), None
-        if isinstance(item, Lemon):
-            return LemonyWater(self.x, self.y), None
-        if isinstance(item, Sugar):
-            return SugaryWater(self.x, self.y), None
-        if isinstance(item, Soap):
-            return SoapyWater(self.x, self.y), None
-        if isinstance(item, DirtyRobes):
-            return RobesInWater(self.x, self.y), None
-        return None, None
-
 class Sugar(BasePickUp):
     name = 'sugar'
     color = (10, 10, 10)
@@ -117,13 +93,6 @@ class Sugar(BasePickUp):
     def get_image(self):
         return loader.get_empty_bottle()
 
-    def combine(self, item):
-        if isinstance(item, WaterBucket):
-            return SugaryWater(self.x, self.y), None
-        if isinstance(item, LemonyWater):
-            return SugaryLemonWater(self.x, self.y), None
-        return None, None
-
 
 class LemonyWater(BasePickUp):
     name = 'lemon water'
@@ -134,11 +103,6 @@ class LemonyWater(BasePickUp):
     def get_image(self):
         return loader.get_lemonade_pitcher()
 
-    def combine(self, item):
-        if isinstance(item, Sugar):
-            return SugaryLemonWater(self.x, self.y), None
-        return None, None
-
 class SugaryWater(BasePickUp):
     name = 'sugary water'
     color = (50, 50, 100)
@@ -148,11 +112,6 @@ class SugaryWater(BasePickUp):
     def get_image(self):
         return loader.get_lemonade_pitcher()
 
-    def combine(self, item):
-        if isinstance(item, Lemon):
-            return SugaryLemonWater(self.x, self.y), None
-        return None, None
-
 class SugaryLemonWater(BasePickUp):
     name = 'sugary lemon water'
     color = (123, 123, 105)
@@ -162,11 +121,6 @@ class SugaryLemonWater(BasePickUp):
     def get_image(self):
         return loader.get_lemonade_pitcher()
 
-    def combine(self, item):
-        if isinstance(item, Fire):
-            return Lemonade(self.x, self.y), EmptyBucket(self.x, self.y)
-        return None, None
-
 class Lemonade(BasePickUp):
     name = 'lemonade'
     color = (50, 100, 100)
@@ -185,11 +139,6 @@ class RatPoison(BasePickUp):
     def get_image(self):
         return loader.get_rat_poison()
 
-    def combine(self, item):
-        if isinstance(item, River):
-            return EmptyBottle(self.x, self.y), None
-        return None, None
-
 class EmptyBottle(BasePickUp):
     name = 'empty bottle'
     color = (100, 100, 200)
@@ -209,15 +158,6 @@ class Soap(BasePickUp):
     def get_image(self):
         return loader.get_soap()
 
-    def combine(self, item):
-        if isinstance(item, WaterBucket):
-            return SoapyWater(self.x, self.y), None
-        if isinstance(item, RobesInWater):
-            return WhiteLaundry(self.x, self.y), None
-        if isinstance(item, RobesAndSockInWater):
-            return ColorRunLaundry(self.x, self.y), None
-        return None, None
-
 
 class RedSock(BasePickUp):
     name = 'red sock'
@@ -228,13 +168,6 @@ class RedSock(BasePickUp):
     def get_image(self):
         return loader.get_sock()
 
-    def combine(self, item):
-        if isinstance(item, WhiteLaundry):
-            return ColorRunLaundry(self.x, self.y), None
-        if isinstance(item, RobesInWater):
-            return RobesAndSockInWater(self.x, self.y), None
-        return None, None
-
 class DirtyRobes(BasePickUp):
     name = 'dirty robes'
     color = (200, 200, 200)
@@ -243,13 +176,6 @@ class DirtyRobes(BasePickUp):
     def get_image(self):
         return loader.get_laundry_dirty()
 
-    def combine(self, item):
-        if isinstance(item, SoapyWater):
-            return WhiteLaundry(self.x, self.y), None
-        if isinstance(item, WaterBucket):
-            return RobesInWater(self.x, self.y), None
-        return None, None
-
 class SoapyWater(BasePickUp):
     name = 'soapy water'
     color = (136, 209, 243)
@@ -258,11 +184,6 @@ class SoapyWater(BasePickUp):
     def get_image(self):
         return loader.get_laundry_basin()
 
-    def combine(self, item):
-        if isinstance(item, DirtyRobes):
-            return WhiteLaundry(self.x, self.y), None
-        return None, None
-
 class RobesInWater(BasePickUp):
     name = 'robes in water'
     color = (200, 200, 200)
@@ -271,13 +192,6 @@ class RobesInWater(BasePickUp):
     def get_image(self):
         return loader.get_laundry_basin()
 
-    def combine(self, item):
-        if isinstance(item, Soap):
-            return WhiteLaundry(self.x, self.y), None
-        if isinstance(item, RedSock):
-            return RobesAndSockInWater(self.x, self.y), None
-        return None, None
-
 class RobesAndSockInWater(BasePickUp):
     name = 'robes and red sock in water'
     color = (200, 40, 200)
@@ -286,10 +200,6 @@ class RobesAndSockInWater(BasePickUp):
     def get_image(self):
         return loader.get_laundry_basin()
 
-    def combine(self, item):
-        if isinstance(item, Soap):
-            return ColorRunLaundry(self.x, self.y), None
-        return None, None
 class WhiteLaundry(BasePickUp):
     name = 'whites laundry'
     color = (152, 183, 203)
@@ -298,13 +208,6 @@ class WhiteLaundry(BasePickUp):
     def get_image(self):
         return loader.get_laundry_basin()
 
-    def combine(self, item):
-        if isinstance(item, RedSock):
-            return ColorRunLaundry(self.x, self.y), None
-        elif isinstance(item, ClothesLine):
-            return WhiteRobes(self.x, self.y), EmptyBucket(self.x, self.y)
-        return None, None
-
 class ColorRunLaundry(BasePickUp):
     name = 'color ruined laundry'
     color = (234, 164, 217)
@@ -313,11 +216,6 @@ class ColorRunLaundry(BasePickUp):
     def get_image(self):
         return loader.get_laundry_basin()
 
-    def combine(self, item):
-        if isinstance(item, ClothesLine):
-            return PinkRobes(self.x, self.y), EmptyBucket(self.x, self.y)
-        return None, None
-
 class WhiteRobes(BasePickUp):
     name = 'white robes'
     color = (255, 255, 255)
@@ -343,11 +241,6 @@ class BeesWax(BasePickUp):
     def get_image(self):
         return loader.get_empty_bottle()
 
-    def combine(self, item):
-        if isinstance(item, Fire):
-            return MeltedWax(self.x, self.y), None
-        return None, None
-
 class MeltedWax(BasePickUp):
     name = 'melted wax'
     color = (217, 239, 30)
@@ -356,13 +249,6 @@ class MeltedWax(BasePickUp):
     def get_image(self):
         return loader.get_melted_wax()
 
-    def combine(self, item):
-        if isinstance(item, BlackDye):
-            return MeltedBlackWax(self.x, self.y), None
-        if isinstance(item, EssenceOfCinnamon):
-            return ScentedMeltedWax(self.x, self.y), None
-        return None, None
-
 class MeltedBlackWax(BasePickUp):
     name = 'melted black wax'
     color = (217, 239, 30)
@@ -371,13 +257,6 @@ class MeltedBlackWax(BasePickUp):
     def get_image(self):
         return loader.get_melted_wax()
 
-    def combine(self, item):
-        if isinstance(item, EssenceOfCinnamon):
-            return ScentedMeltedBlackWax(self.x, self.y), None
-        if isinstance(item, EmptyBucket):
-            return BlackCandles(self.x, self.y), EmptyBucket(self.x, self.y)
-        return None, None
-
 
 class BlackDye(BasePickUp):
     name = 'black dye'
@@ -388,13 +267,6 @@ class BlackDye(BasePickUp):
     def get_image(self):
         return loader.get_brown_jar()
 
-    def combine(self, item):
-        if isinstance(item, MeltedWax):
-            return MeltedBlackWax(self.x, self.y), None
-        if isinstance(item, ScentedMeltedWax):
-            return ScentedMeltedBlackWax(self.x, self.y), None
-        return None, None
-
 class EssenceOfCinnamon(BasePickUp):
     name = 'essence of cinnamon'
     color = (122, 71, 47)
@@ -404,13 +276,6 @@ class EssenceOfCinnamon(BasePickUp):
     def get_image(self):
         return loader.get_pestle_and_mortar()
 
-    def combine(self, item):
-        if isinstance(item, MeltedWax):
-            return ScentedMeltedWax(self.x, self.y), None
-        if isinstance(item, MeltedBlackWax):
-            return ScentedMeltedBlackWax(self.x, self.y), None
-        return None, None
-
 class ScentedMeltedWax(BasePickUp):
     name = 'scented melted wax'
     color = (217, 239, 30)
@@ -419,11 +284,6 @@ class ScentedMeltedWax(BasePickUp):
     def get_image(self):
         return loader.get_melted_wax()
 
-    def combine(self, item):
-        if isinstance(item, BlackDye):
-            return ScentedMeltedBlackWax(self.x, self.y), None
-        return None, None
-
 class ScentedMeltedBlackWax(BasePickUp):
     name = 'scented melted black wax'
     color = (217, 239, 30)
@@ -432,11 +292,6 @@ class ScentedMeltedBlackWax(BasePickUp):
     def get_image(self):
         return loader.get_melted_wax()
 
-    def combine(self, item):
-        if isinstance(item, EmptyBucket):
-            return ScentedBlackCandles(self.x, self.y), EmptyBucket(self.x, self.y)
-        return None, None
-
 class BlackCandles(BasePickUp):
     name = 'black candle'
     color = (20, 20, 20)
@@ -478,3 +333,48 @@ class Flower(BasePickUp):
         ]
         return random.choice(flowers)()
 
+
+# held, target, result, and what the player is left holding
+recipes = RecipeBook([
+    Recipe(Lemon, WaterBucket, LemonyWater),
+    Recipe(Lemon, SugaryWater, SugaryLemonWater),
+    Recipe(EmptyBucket, River, WaterBucket),
+    Recipe(EmptyBucket, MeltedBlackWax, BlackCandles),
+    Recipe(EmptyBucket, ScentedMeltedBlackWax, ScentedBlackCandles),
+    Recipe(WaterBucket, River, EmptyBucket),
+    Recipe(WaterBucket, Lemon, LemonyWater),
+    Recipe(WaterBucket, Sugar, SugaryWater),
+    Recipe(WaterBucket, Soap, SoapyWater),
+    Recipe(WaterBucket, DirtyRobes, RobesInWater),
+    Recipe(Sugar, WaterBucket, SugaryWater),
+    Recipe(Sugar, LemonyWater, SugaryLemonWater),
+    Recipe(LemonyWater, Sugar, SugaryLemonWater),
+    Recipe(SugaryWater, Lemon, SugaryLemonWater),
+    Recipe(SugaryLemonWater, Fire, Lemonade, EmptyBucket),
+    Recipe(RatPoison, River, EmptyBottle),
+    Recipe(Soap, WaterBucket, SoapyWater),
+    Recipe(Soap, RobesInWater, WhiteLaundry),
+    Recipe(Soap, RobesAndSockInWater, ColorRunLaundry),
+    Recipe(RedSock, WhiteLaundry, ColorRunLaundry),
+    Recipe(RedSock, RobesInWater, RobesAndSockInWater),
+    Recipe(DirtyRobes, SoapyWater, WhiteLaundry),
+    Recipe(DirtyRobes, WaterBucket, RobesInWater),
+    Recipe(SoapyWater, DirtyRobes, WhiteLaundry),
+    Recipe(RobesInWater, Soap, WhiteLaundry),
+    Recipe(RobesInWater, RedSock, RobesAndSockInWater),
+    Recipe(RobesAndSockInWater, Soap, ColorRunLaundry),
+    Recipe(WhiteLaundry, RedSock, ColorRunLaundry),
+    Recipe(WhiteLaundry, ClothesLine, WhiteRobes, EmptyBucket),
+    Recipe(ColorRunLaundry, ClothesLine, PinkRobes, EmptyBucket),
+    Recipe(BeesWax, Fire, MeltedWax),
+    Recipe(MeltedWax, BlackDye, MeltedBlackWax),
+    Recipe(MeltedWax, EssenceOfCinnamon, ScentedMeltedWax),
+    Recipe(MeltedBlackWax, EssenceOfCinnamon, ScentedMeltedBlackWax),
+    Recipe(MeltedBlackWax, EmptyBucket, BlackCandles, EmptyBucket),
+    Recipe(BlackDye, MeltedWax, MeltedBlackWax),
+    Recipe(BlackDye, ScentedMeltedWax, ScentedMeltedBlackWax),
+    Recipe(EssenceOfCinnamon, MeltedWax, ScentedMeltedWax),
+    Recipe(EssenceOfCinnamon, MeltedBlackWax, ScentedMeltedBlackWax),
+    Recipe(ScentedMeltedWax, BlackDye, ScentedMeltedBlackWax),
+    Recipe(ScentedMeltedBlackWax, EmptyBucket, ScentedBlackCandles, EmptyBucket),
+])
@@ -0,0 +1,53 @@
+import os
+import typing
+
+import pygame
+
+
+class SpriteSheetRegistry:
+    """Decodes each spritesheet once, sharing it between everything cut out of it.
+
+    Sheets stay decoded until {clear} is called, so the registry should be cleared
+    once a batch of assets has been loaded to give the memory back.
+    The game clears it when a day loads and when the next day's assets have been prefetched,
+    so sheets decoded for anything else loaded during a day stay decoded until one of those.
+    """
+
+    def __init__(self):
+        self._sheets = {}
+        # statistics since the registry was created
+        self.requests = 0
+        self.decodes = 0
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.normcase(os.path.abspath(path))
+
+    def get(self, path: str) -> pygame.Surface:
+        """Return the decoded spritesheet at {path}, decoding it if it isn't already."""
+        self.requests += 1
+        key = self._key(path)
+        sheet = self._sheets.get(key)
+        if sheet is None:
+            sheet = self._sheets[key] = pygame.image.load(path).convert_alpha()
+            self.decodes += 1
+        return sheet
+
+    def clear(self) -> None:
+        """Forget every decoded sheet."""
+        self._sheets.clear()
+
+    def __len__(self) -> int:
+        return len(self._sheets)
+
+    @property
+    def resident_bytes(self) -> int:
+        return sum(sheet.get_bytesize() * sheet.get_width() * sheet.get_height()
+                   for sheet in self._sheets.values())
+
+    def stats(self) -> typing.Dict[str, int]:
+        return {"requests": self.requests, "decodes": self.decodes,
+                "resident": len(self), "resident_bytes": self.resident_bytes}
+
+
+registry = SpriteSheetRegistry()
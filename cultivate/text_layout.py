@@ -0,0 +1,114 @@
+"""Wrapping text to fit in a width.
+
+Each word is measured once per font, and wrapping adds up the widths of words,
+rather than measuring longer and longer pieces of the text until one doesn't fit.
+"""
+import typing
+from functools import lru_cache
+
+import pygame
+
+
+class FontMetrics:
+    """The widths of words in {font}, each measured the first time it is needed."""
+
+    def __init__(self, font: pygame.font.Font):
+        self.font = font
+        self.space = font.size(" ")[0]
+        self.line_height = font.size("Tg")[1]
+        self._widths = {}
+
+    def width(self, word: str) -> int:
+        try:
+            return self._widths[word]
+        except KeyError:
+            width = self._widths[word] = self.font.size(word)[0]
+            return width
+
+    def line_width(self, words: typing.Sequence[str]) -> int:
+        """The width of {words} separated by spaces."""
+        if not words:
+            return 0
+        return sum(self.width(word) for word in words) + self.space * (len(words) - 1)
+
+    def wrap(self, words: typing.Sequence[str], width: int) -> typing.List[typing.Tuple[int, int]]:
+        """Split {words} into lines narrower than {width}, putting as many words on each line as fit.
+
+        A word that is too wide for a line on its own gets a line to itself.
+
+        :return: the start and end index in {words} of each line
+        """
+        lines = []
+        start = 0
+        line_width = 0
+        for i, word in enumerate(words):
+            word_width = self.width(word)
+            if i == start:
+                line_width = word_width
+            elif line_width + self.space + word_width >= width:
+                lines.append((start, i))
+                start = i
+                line_width = word_width
+            else:
+                line_width += self.space + word_width
+        if start < len(words):
+            lines.append((start, len(words)))
+        return lines
+
+
+@lru_cache(None)
+def metrics(font: pygame.font.Font) -> FontMetrics:
+    return FontMetrics(font)
+
+
+class TextLayout:
+    """{text} wrapped into lines narrower than {width}, with as many lines as fit in {max_height}.
+
+    Layouts don't change, so one can be drawn on every frame without working it out again,
+    and the lines are only rendered once for each colour they are drawn in.
+    """
+
+    def __init__(self, text: str, font: pygame.font.Font, width: int, max_height: int = None, line_spacing: int = 2):
+        self.font = font
+        self.line_height = metrics(font).line_height
+        self.line_spacing = line_spacing
+        words = text.split(" ")
+        self.lines = []
+        # the text that didn't fit in {max_height}
+        self.overflow = ""
+        for start, end in metrics(font).wrap(words, width):
+            if max_height is not None and self.height + self.line_height > max_height:
+                self.overflow = " ".join(words[start:])
+                break
+            # keep the space after each line, like the original text
+            self.lines.append(" ".join(words[start:end]) + (" " if end < len(words) else ""))
+        # colour -> rendered lines
+        self._rendered = {}
+
+    @property
+    def height(self) -> int:
+        """The height of the lines, including the spacing after the last one."""
+        return len(self.lines) * (self.line_height + self.line_spacing)
+
+    def render(self, color: pygame.Color) -> typing.List[pygame.Surface]:
+        key = tuple(pygame.Color(color))
+        if key not in self._rendered:
+            self._rendered[key] = [self.font.render(line, True, color) for line in self.lines]
+        return self._rendered[key]
+
+    def draw(self, surface: pygame.Surface, color: pygame.Color, position: typing.Tuple[int, int]) -> int:
+        """Draw the lines in {color} with the top left of the first line at {position}.
+
+        :return: the y coordinate below the last line, including its spacing
+        """
+        x, y = position
+        for line in self.render(color):
+            surface.blit(line, (x, y))
+            y += self.line_height + self.line_spacing
+        return y
+
+
+@lru_cache(256)
+def layout(text: str, font: pygame.font.Font, width: int, max_height: int = None, line_spacing: int = 2) -> TextLayout:
+    """Return the {TextLayout} of {text}, reusing it if the same text was laid out the same way recently."""
+    return TextLayout(text, font, width, max_height, line_spacing)
@@ -0,0 +1,93 @@
+"""Filling surfaces with copies of a tile.
+
+The backgrounds are made of one small tile repeated across a large surface.
+Rather than blitting the tile once for each place it goes,
+{doubling} blits it once then copies everything drawn so far next to itself until the surface is full,
+which takes a number of blits that grows with the log of the size of the surface.
+When NumPy is installed, {numpy_tile} can repeat the pixels with {numpy.tile} instead,
+though it is only faster than doubling for small surfaces, so it isn't used unless chosen.
+"""
+import typing
+
+import pygame
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def loop(image: pygame.Surface, size: typing.Tuple[int, int]) -> pygame.Surface:
+    """Tile {image} over a new surface of {size} with one blit for each tile."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    tile_width, tile_height = image.get_size()
+    for x in range(0, size[0], tile_width):
+        for y in range(0, size[1], tile_height):
+            surface.blit(image, (x, y))
+    return surface
+
+
+def doubling(image: pygame.Surface, size: typing.Tuple[int, int]) -> pygame.Surface:
+    """Tile {image} over a new surface of {size} by copying the tiles drawn so far next to themselves."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    width, height = size
+    surface.blit(image, (0, 0))
+    # the surface starts transparent, so taking the maximum of each channel copies the pixels exactly,
+    # where blending would change pixels that aren't fully opaque
+    filled = min(image.get_width(), width)
+    row_height = min(image.get_height(), height)
+    while filled < width:
+        surface.blit(surface, (filled, 0), (0, 0, filled, row_height), pygame.BLEND_RGBA_MAX)
+        filled *= 2
+    filled = row_height
+    while filled < height:
+        surface.blit(surface, (0, filled), (0, 0, width, filled), pygame.BLEND_RGBA_MAX)
+        filled *= 2
+    return surface
+
+
+def numpy_tile(image: pygame.Surface, size: typing.Tuple[int, int]) -> pygame.Surface:
+    """Tile {image} over a new surface of {size} by repeating its pixels with NumPy."""
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    # copy the tile into a surface with the same pixel format, so its pixels can be copied as they are
+    source = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+    source.blit(image, (0, 0))
+    width, height = size
+    repeats = (-(-width // image.get_width()), -(-height // image.get_height()))
+    # surface arrays are indexed by x then y, and lock the surface until they are deleted
+    pixels = pygame.surfarray.pixels2d(surface)
+    pixels[...] = numpy.tile(pygame.surfarray.pixels2d(source), repeats)[:width, :height]
+    del pixels
+    return surface
+
+
+# strategy name -> function, all of which make the same surface
+STRATEGIES = {
+    "loop": loop,
+    "doubling": doubling,
+}
+if numpy is not None:
+    STRATEGIES["numpy"] = numpy_tile
+
+# the strategy used by {tiled}, one of {STRATEGIES}
+strategy = "doubling"
+
+
+def tiled(image: pygame.Surface, size: typing.Tuple[int, int]) -> pygame.Surface:
+    """Return a new transparent surface of {size} covered in copies of {image}, starting from the top left.
+
+    Tiles on the right and bottom edges are cut off where they don't fit.
+    """
+    return STRATEGIES[strategy](image, size)
+
+
+def tile(surface: pygame.Surface, image: pygame.Surface, rect: pygame.Rect = None) -> None:
+    """Cover {rect} of {surface}, or all of it, in copies of {image}, starting from the top left of {rect}.
+
+    The copies are blitted onto {surface} like blitting {image} into each place it goes.
+    """
+    rect = pygame.Rect(rect) if rect is not None else surface.get_rect()
+    # don't make copies that would be cut off by the right or bottom edge of {surface}
+    size = (min(rect.w, surface.get_width() - rect.x), min(rect.h, surface.get_height() - rect.y))
+    if size[0] > 0 and size[1] > 0:
+        surface.blit(tiled(image, size), rect.topleft)
@@ -0,0 +1,71 @@
+"""The game's idea of what time it is.
+
+Anything that happens after a delay, like NPC speech and animations, reads the time from {now}.
+Normally that is the real time, but while recording, replaying or running headless
+it is {FrameClock} time, so the game does the same thing on every run however fast it runs.
+"""
+import time
+
+
+class WallClock:
+    """The real time."""
+
+    def time(self) -> float:
+        return time.time()
+
+    def tick(self) -> None:
+        pass
+
+
+class FrameClock:
+    """Time that moves on by one frame's worth each time {tick} is called."""
+
+    def __init__(self, fps: int, start: float = None):
+        self.fps = fps
+        # start at the real time by default, so switching from a {WallClock} doesn't jump back in time
+        self.start = time.time() if start is None else start
+        self.frames = 0
+
+    def time(self) -> float:
+        return self.start + self.frames / self.fps
+
+    def tick(self) -> None:
+        self.frames += 1
+
+
+clock = WallClock()
+
+
+def now() -> float:
+    """Return the time in seconds according to {clock}."""
+    return clock.time()
+
+
+class FixedTimestep:
+    """Works out how many fixed-length steps to move the game on by for each frame drawn.
+
+    Real time is added to an accumulator, and used up a whole {step} at a time,
+    so the game runs at the same speed however fast frames are drawn.
+    If drawing falls too far behind, at most {max_steps} are run per frame, and the rest of the time is dropped,
+    so a slow frame can't cause an ever growing backlog of steps.
+    """
+
+    def __init__(self, step: float, max_steps: int = 5):
+        self.step = step
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+
+    def advance(self, seconds: float) -> int:
+        """Add {seconds} of real time, and return how many steps to run for it."""
+        self.accumulator += seconds
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = self.step * steps
+        self.accumulator -= self.step * steps
+        return steps
+
+    @property
+    def alpha(self) -> float:
+        """How far through the next step the game is, from 0 to 1, for drawing between the last two steps."""
+        return min(self.accumulator / self.step, 1.0)
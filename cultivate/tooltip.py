@@ -1,32 +1,53 @@
+import abc
 from datetime import date, timedelta
+import typing
+
 import pygame
-from cultivate import loader
+from cultivate import glyphs, loader
 from cultivate.settings import WIDTH, HEIGHT, MD_FONT, SM_FONT
 
 BACKGROUND = pygame.Color(245, 245, 220)
 FONT_COLOR = pygame.Color("black")
 
 
-def pad_rect(rect, padding):
-    return pygame.Rect(
-        rect.x + padding,
-        rect.y + padding,
-        rect.width - padding,
-        rect.height - padding
-    )
+class Widget(abc.ABC):
+    """Part of the HUD, drawn from a surface that is only composed again when what it shows changes."""
+
+    def __init__(self):
+        self._shown = None
+        self._surface = None
+        # how many times the surface has been composed
+        self.composed = 0
+
+    @abc.abstractmethod
+    def shows(self) -> typing.Hashable:
+        """What the widget shows, which must change whenever the composed surface would."""
+
+    @abc.abstractmethod
+    def compose(self) -> pygame.Surface:
+        pass
 
+    def get_surface(self) -> pygame.Surface:
+        shown = self.shows()
+        if self._surface is None or shown != self._shown:
+            self._surface = self.compose()
+            self._shown = shown
+            self.composed += 1
+        return self._surface
 
-class Tooltip:
+
+class Tooltip(Widget):
     def __init__(self):
+        super().__init__()
         self.render = None
+        self.text = None
         self.rect = pygame.Rect(0, HEIGHT-50, 250, 50)
         self.padding = 20
 
     def set_tooltip(self, text):
-        font_width, font_height = MD_FONT.size(text)
-        self.rect.width = font_width + (self.padding * 2)
-        self.render = MD_FONT.render(text,
-                                     True, FONT_COLOR)
+        self.render = glyphs.render(MD_FONT, text, FONT_COLOR)
+        self.rect.width = self.render.get_width() + (self.padding * 2)
+        self.text = text
 
     @property
     def empty(self):
@@ -34,15 +55,25 @@ class Tooltip:
 
     def clear_tooltip(self):
         self.render = None
+        self.text = None
+
+    def shows(self):
+        return self.text
+
+    def compose(self):
+        composed = pygame.Surface(self.rect.size)
+        composed.fill(BACKGROUND)
+        composed.blit(self.render, (self.padding, self.padding))
+        return composed
 
     def draw(self, surface):
         if self.render:
-            pygame.draw.rect(surface, BACKGROUND, self.rect)
-            surface.blit(self.render, pad_rect(self.rect, self.padding))
+            surface.blit(self.get_surface(), self.rect)
 
 
-class InventoryBox:
+class InventoryBox(Widget):
     def __init__(self):
+        super().__init__()
         self.image = loader.get_inventory_box()
         self.width, self.height = self.image.get_size()
         self.rect = pygame.Rect(WIDTH-self.width, 0, self.width, self.height)
@@ -62,28 +93,37 @@ class InventoryBox:
         self.icon = None
         self.name = ""
 
-    def draw(self, surface):
+    def get_rect(self):
         rect = self.rect
         if self.name:
-            font_width, _ = MD_FONT.size(self.name)
+            font_width = glyphs.render(MD_FONT, self.name, FONT_COLOR).get_width()
             rect.width = max(rect.width, font_width + (self.padding * 2))
             rect.x = WIDTH - rect.width
         else:
             rect.width = self.width
             rect.x = WIDTH - self.width
+        return rect
 
-        scaled_image = pygame.transform.scale(self.image, (rect.w, rect.h))
-        surface.blit(scaled_image, rect)
+    def shows(self):
+        return self.name, self.icon
+
+    def compose(self):
+        rect = self.get_rect()
+        composed = pygame.transform.scale(self.image, (rect.w, rect.h))
         if self.icon:
-            icon_x = rect.x + rect.width // 2 - self.icon.get_width() // 2
-            icon_y = rect.y + rect.height // 2 - self.icon.get_width() // 2
-            surface.blit(self.icon, (icon_x, icon_y))
+            icon_x = rect.width // 2 - self.icon.get_width() // 2
+            icon_y = rect.height // 2 - self.icon.get_width() // 2
+            composed.blit(self.icon, (icon_x, icon_y))
         if self.name:
-            surface.blit(MD_FONT.render(self.name, True, FONT_COLOR),
-                         (rect.x + self.padding, rect.y + self.padding))
+            composed.blit(glyphs.render(MD_FONT, self.name, FONT_COLOR), (self.padding, self.padding))
+        return composed
+
+    def draw(self, surface):
+        surface.blit(self.get_surface(), self.get_rect())
 
-class InfoBox:
+class InfoBox(Widget):
     def __init__(self, game_state):
+        super().__init__()
         self.image = loader.get_info_box()
         self.width, self.height = self.image.get_size()
         self.game_state = game_state
@@ -97,22 +137,30 @@ class InfoBox:
         return day.strftime('%d/%m/%Y')
 
 
-    def draw(self, surface):
-        font_width, font_height = MD_FONT.size(self.current_date)
+    def get_rect(self):
         rect = self.rect
         if self.game_state.current_task:
-            font_width, _ = MD_FONT.size(self.game_state.current_task)
+            font_width = glyphs.render(MD_FONT, self.game_state.current_task, FONT_COLOR).get_width()
             rect.width = max(rect.width, font_width + (self.padding * 2))
         else:
             rect.width = self.width
-        scaled_image = pygame.transform.scale(self.image, (rect.w, rect.h))
-        surface.blit(scaled_image, rect)
-        surface.blit(
-            MD_FONT.render(self.current_date, True, FONT_COLOR),
-            (self.rect.x + self.padding, self.rect.y + self.padding)
-        )
+        return rect
+
+    def shows(self):
+        return self.game_state.day, self.game_state.current_task
+
+    def compose(self):
+        current_date = glyphs.render(MD_FONT, self.current_date, FONT_COLOR)
+        font_height = current_date.get_height()
+        rect = self.get_rect()
+        composed = pygame.transform.scale(self.image, (rect.w, rect.h))
+        composed.blit(current_date, (self.padding, self.padding))
         if self.game_state.current_task:
-            surface.blit(
-                SM_FONT.render(self.game_state.current_task, True, FONT_COLOR),
-                (self.rect.x + self.padding, self.rect.y + self.padding + font_height + self.padding)
+            composed.blit(
+                glyphs.render(SM_FONT, self.game_state.current_task, FONT_COLOR),
+                (self.padding, self.padding + font_height + self.padding)
             )
+        return composed
+
+    def draw(self, surface):
+        surface.blit(self.get_surface(), self.get_rect())
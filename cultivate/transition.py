@@ -1,18 +1,29 @@
+import abc
+
 import pygame
-from cultivate.settings import MAP_WIDTH, MAP_HEIGHT, MD_FONT
+from cultivate import settings
+from cultivate.settings import WIDTH, HEIGHT
 
 BLACK = pygame.Color(0, 0, 0)
+# the screen counts as black once the opacity is above this
+BLACK_OPACITY = 230
+
 
+class Transition(abc.ABC):
+    """Covers the screen and uncovers it again, e.g. while the day changes.
+
+    The screen is covered more and more as {opacity} goes up to 255, and is {black} near the top,
+    then uncovered as it goes back down to 0.
+    Subclasses draw the screen being covered, without making new surfaces on every frame.
+    """
 
-class Fader:
     def __init__(self):
-        self.fade = pygame.Surface((MAP_WIDTH, MAP_HEIGHT))
         self.opacity = 0
         self.opacity_step = 8
         self.increasing = True
         self.fading = False
         self.black = False
-        self.rect = pygame.Rect(0, 0, MAP_WIDTH, MAP_HEIGHT)
+        self.rect = pygame.Rect(0, 0, WIDTH, HEIGHT)
 
     def start(self):
         self.fading = True
@@ -25,11 +36,13 @@ class Fader:
         self.increasing = True
         self.fading = False
 
+    @abc.abstractmethod
     def draw(self, surface):
-        self.fade.set_alpha(self.opacity)
-        pygame.draw.rect(self.fade, BLACK, self.rect)
-        surface.blit(self.fade, self.rect)
-        self.adjust_opacity()
+        pass
+
+    def update(self):
+        if self.fading:
+            self.adjust_opacity()
 
     def adjust_opacity(self):
         if not self.increasing and self.opacity <= 0:
@@ -45,15 +58,44 @@ class Fader:
         elif self.opacity > 255:
             self.increasing = False
 
-        if self.opacity > 230 and self.opacity < 255:
+        if self.opacity > BLACK_OPACITY and self.opacity < 255:
             self.black = True
         else:
             self.black = False
 
 
+class Fader(Transition):
+    """Fades the screen to black and back."""
+
+    def __init__(self):
+        super().__init__()
+        self.fade = pygame.Surface(self.rect.size)
+        self.fade.fill(BLACK)
+
+    def draw(self, surface):
+        self.fade.set_alpha(self.opacity)
+        surface.blit(self.fade, self.rect)
+
 
+class Wipe(Transition):
+    """Covers the screen with black from the left, then uncovers it from the left."""
 
+    def draw(self, surface):
+        # fully covered by the time the screen counts as black
+        width = min(self.rect.width * max(self.opacity, 0) // BLACK_OPACITY, self.rect.width)
+        if self.increasing:
+            surface.fill(BLACK, (0, 0, width, self.rect.height))
+        else:
+            surface.fill(BLACK, (self.rect.width - width, 0, width, self.rect.height))
 
 
+# transition name -> type
+STYLES = {
+    "fade": Fader,
+    "wipe": Wipe,
+}
 
 
+def make_transition() -> Transition:
+    """Make a transition in the style named by {settings.TRANSITION}."""
+    return STYLES[settings.TRANSITION]()